@@ -0,0 +1,131 @@
+"""
+对比清理阶段耗时：改造前逐条调用清理函数的方式、按 id / class / 标签名索引的规则集，
+以及在索引基础上单次先序遍历并剪枝的方式。
+
+    uv run python scripts/bench_clean.py --sections 300 --repeat 5
+"""
+
+import argparse
+import re
+import time
+
+from bs4 import BeautifulSoup
+from bs4.element import Comment, Tag
+
+from omni_article_markdown.extractors.wikipedia import WikipediaExtractor
+from omni_article_markdown.utils import get_attr_text
+
+# 改造前 Extractor 与 WikipediaExtractor 的清理函数
+LEGACY_TAGS_TO_CLEAN = [
+    lambda el: el.name in ("style", "link", "button", "footer", "header"),
+    lambda el: el.name == "script" and "src" not in el.attrs,
+    lambda el: (
+        el.name == "script"
+        and el.has_attr("src")
+        and not get_attr_text(el.attrs["src"]).startswith("https://gist.github.com")
+    ),
+]
+
+LEGACY_ATTRS_TO_CLEAN = [
+    lambda el: (
+        "style" in el.attrs
+        and re.search(r"display\s*:\s*none", get_attr_text(el.attrs.get("style")), re.IGNORECASE) is not None
+    ),
+    lambda el: "hidden" in el.attrs,
+    lambda el: "class" in el.attrs and "katex-html" in el.attrs["class"],
+    lambda el: "aria-hidden" in el.attrs and "true" in el.attrs["aria-hidden"],
+    lambda el: "id" in el.attrs and "siteSub" in el.attrs["id"],
+    lambda el: "class" in el.attrs and "vector-body-before-content" in el.attrs["class"],
+    lambda el: "class" in el.attrs and "mw-editsection" in el.attrs["class"],
+    lambda el: "role" in el.attrs and "navigation" in el.attrs["role"],
+    lambda el: "role" in el.attrs and "presentation" in el.attrs["role"],
+    lambda el: "class" in el.attrs and "printfooter" in el.attrs["class"],
+    lambda el: "class" in el.attrs and "side-box" in el.attrs["class"],
+    lambda el: "class" in el.attrs and "reflist" in el.attrs["class"],
+    lambda el: "class" in el.attrs and "div-col" in el.attrs["class"],
+    lambda el: "class" in el.attrs and "mw-references" in el.attrs["class"],
+    lambda el: "class" in el.attrs and "mw-references-wrap" in el.attrs["class"],
+    lambda el: "class" in el.attrs and "mw-references-columns" in el.attrs["class"],
+    lambda el: "class" in el.attrs and "refbegin" in el.attrs["class"],
+    lambda el: "id" in el.attrs and "catlinks" in el.attrs["id"],
+    lambda el: el.name == "sup" and ("class" in el.attrs and "reference" in el.attrs["class"]),
+]
+
+
+def make_page(sections: int) -> str:
+    parts = []
+    for i in range(sections):
+        parts.append(
+            f'<h2 id="s{i}">Section {i}<span class="mw-editsection">[edit]</span></h2>'
+            f'<p class="para">Text <a href="/wiki/{i}" title="t">link</a><sup class="reference">[{i}]</sup> '
+            f'<b>bold</b> <i>it</i> <span class="nowrap">x</span></p>'
+            f'<div class="thumb tright"><div class="thumbinner"><img src="/img/{i}.png"></div></div>'
+            f'<table class="wikitable"><tr><td>a</td><td>b</td></tr><tr><td>c</td><td>d</td></tr></table>'
+            f"<!-- section {i} -->"
+            f'<div role="navigation"><ul>{"<li><a href=\'/nav\'>nav</a></li>" * 20}</ul></div>'
+        )
+    parts.append('<div class="reflist"><ol class="references">' + "<li>ref</li>" * sections + "</ol></div>")
+    parts.append('<div id="catlinks" role="navigation"><ul><li>Category</li></ul></div>')
+    body = "".join(parts)
+    return f'<html><head><title>Bench</title></head><body><div id="bodyContent">{body}</div></body></html>'
+
+
+def clean_linear(extractor: WikipediaExtractor, root: Tag):
+    for el in root.find_all():
+        if el.attrs is None:
+            continue
+        if any(cond(el) for cond in LEGACY_TAGS_TO_CLEAN):
+            el.decompose()
+            continue
+        if el.attrs and any(cond(el) for cond in LEGACY_ATTRS_TO_CLEAN):
+            el.decompose()
+    for comment in root.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+
+
+def clean_indexed(extractor: WikipediaExtractor, root: Tag):
+    rules = extractor.clean_rules()
+    for el in root.find_all():
+        if el.attrs is not None and rules.matches(el):
+            el.decompose()
+    for comment in root.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+
+
+def clean_pruned(extractor: WikipediaExtractor, root: Tag):
+    extractor.clean_rules().prune(root)
+
+
+def bench(name: str, func, html: str, repeat: int) -> float:
+    total = 0.0
+    for _ in range(repeat):
+        soup = BeautifulSoup(html, "html5lib")
+        extractor = WikipediaExtractor(soup)
+        root = soup.find("div", {"id": "bodyContent"})
+        start = time.perf_counter()
+        func(extractor, root)
+        total += time.perf_counter() - start
+    elapsed = total / repeat * 1000
+    print(f"  {name:<8} {elapsed:8.2f} ms")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sections", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    html = make_page(args.sections)
+    start = time.perf_counter()
+    BeautifulSoup(html, "html5lib")
+    print(f"html5lib parse: {(time.perf_counter() - start) * 1000:.2f} ms")
+    print(f"cleaning ({args.sections} sections):")
+    linear = bench("linear", clean_linear, html, args.repeat)
+    indexed = bench("indexed", clean_indexed, html, args.repeat)
+    pruned = bench("pruned", clean_pruned, html, args.repeat)
+    print(f"  speedup  {linear / indexed:8.2f}x (indexed)  {indexed / pruned:8.2f}x (pruned vs indexed)")
+
+
+if __name__ == "__main__":
+    main()
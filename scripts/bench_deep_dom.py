@@ -0,0 +1,65 @@
+"""
+测量层层嵌套的 `<div>` / `<span>` 包装（飞书、Notion 导出等机器生成的页面）的转换耗时，
+在默认的递归深度限制下检查各解析器以及流式转换都不会抛出 RecursionError。
+
+    uv run python scripts/bench_deep_dom.py --depths 1000 5000 --repeat 3
+"""
+
+import argparse
+import time
+
+from omni_article_markdown.html_parser import PARSER_BACKENDS, make_soup
+from omni_article_markdown.omni_article_md import OmniArticleMarkdown
+
+
+def make_page(depth: int) -> str:
+    opening = "".join(f"<div class='block-{i}'><span>level {i} " for i in range(depth))
+    leaf = "<p><b>deep</b> <a href='/x'>link</a></p><ul><li>item</li></ul><blockquote><p>quote</p></blockquote>"
+    closing = "</span></div>" * depth
+    return f"<html><head><title>Deep</title></head><body><article>{opening}{leaf}{closing}</article></body></html>"
+
+
+def convert(html: str, backend: str, streaming: bool) -> str:
+    handler = OmniArticleMarkdown("", use_cache=False, html_parser=backend, streaming=streaming)
+    handler.parse_html(html)
+    return handler.result()
+
+
+def bench(label: str, html: str, backend: str, streaming: bool, repeat: int) -> str | None:
+    best = float("inf")
+    markdown = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            markdown = convert(html, backend, streaming)
+        except RecursionError:
+            print(f"  {label:<18} RecursionError")
+            return None
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<18} {best * 1000:9.2f} ms")
+    return markdown
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for depth in args.depths:
+        html = make_page(depth)
+        print(f"depth {depth} ({len(html) / 1024:.0f} KB):")
+        results = {}
+        for backend in PARSER_BACKENDS:
+            try:
+                make_soup("", backend)
+            except ValueError:
+                continue
+            results[backend] = bench(backend, html, backend, False, args.repeat)
+        results["stream"] = bench("html.parser+stream", html, "html.parser", True, args.repeat)
+        outputs = {markdown for markdown in results.values() if markdown is not None}
+        print(f"  output             {'identical' if len(outputs) == 1 else 'differs'}")
+
+
+if __name__ == "__main__":
+    main()
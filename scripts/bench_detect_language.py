@@ -0,0 +1,350 @@
+"""
+测量代码块语言检测的准确率和耗时。语料是各类文章中常见的代码片段，期望值为空字符串的是命令输出、
+纯文本等无法（也不应该）判断语言的内容。
+
+    uv run python scripts/bench_detect_language.py --repeat 2000
+"""
+
+import argparse
+import time
+
+from omni_article_markdown.code_language import _detect_code, detect_language
+
+CORPUS: list[tuple[str, str]] = [
+    (
+        "python",
+        """import os
+from pathlib import Path
+
+
+def read_config(path: str) -> dict:
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    with open(path) as f:
+        return json.load(f)
+""",
+    ),
+    (
+        "python",
+        """class Agent:
+    def __init__(self, name):
+        self.name = name
+
+    def run(self, task):
+        for step in range(3):
+            print(f"{self.name}: {task} #{step}")
+""",
+    ),
+    ("python", ">>> import numpy as np\n>>> np.arange(3)\narray([0, 1, 2])"),
+    (
+        "python",
+        """response = client.messages.create(
+    model=model,
+    max_tokens=1024,
+    messages=[{"role": "user", "content": prompt}],
+)
+print(response.content[0].text)""",
+    ),
+    (
+        "javascript",
+        """const express = require('express');
+const app = express();
+
+app.get('/', (req, res) => {
+  res.send('Hello World!');
+});
+
+app.listen(3000, () => console.log('listening'));
+""",
+    ),
+    (
+        "javascript",
+        """document.querySelectorAll('.item').forEach(function (el) {
+  if (el.dataset.id === undefined) {
+    el.remove();
+  }
+});""",
+    ),
+    (
+        "typescript",
+        """interface User {
+  id: number;
+  name: string;
+  email?: string;
+}
+
+export function greet(user: User): string {
+  return `Hello, ${user.name}`;
+}
+""",
+    ),
+    (
+        "java",
+        """import java.util.ArrayList;
+import java.util.List;
+
+public class Main {
+    public static void main(String[] args) {
+        List<String> items = new ArrayList<>();
+        items.add("a");
+        System.out.println(items);
+    }
+}""",
+    ),
+    (
+        "java",
+        """@Override
+public ResponseEntity<User> getUser(@PathVariable Long id) throws NotFoundException {
+    return ResponseEntity.ok(userService.find(id));
+}""",
+    ),
+    (
+        "kotlin",
+        """data class Point(val x: Int, val y: Int)
+
+fun main() {
+    val points = listOf(Point(1, 2), Point(3, 4))
+    points.forEach { println(it) }
+}""",
+    ),
+    (
+        "go",
+        """package main
+
+import "fmt"
+
+func main() {
+    ch := make(chan int)
+    go func() { ch <- 42 }()
+    fmt.Println(<-ch)
+}""",
+    ),
+    (
+        "go",
+        """func (s *Server) Start() error {
+	ln, err := net.Listen("tcp", s.addr)
+	if err != nil {
+		return err
+	}
+	defer ln.Close()
+	return s.serve(ln)
+}""",
+    ),
+    (
+        "rust",
+        """use std::collections::HashMap;
+
+fn main() {
+    let mut counts: HashMap<&str, usize> = HashMap::new();
+    for word in "a b a".split_whitespace() {
+        *counts.entry(word).or_insert(0) += 1;
+    }
+    println!("{:?}", counts);
+}""",
+    ),
+    (
+        "c",
+        """#include <stdio.h>
+#include <stdlib.h>
+
+int main(void) {
+    char *buf = malloc(sizeof(char) * 16);
+    if (buf == NULL) return 1;
+    printf("%s\\n", buf);
+    free(buf);
+    return 0;
+}""",
+    ),
+    (
+        "cpp",
+        """#include <iostream>
+#include <vector>
+
+int main() {
+    std::vector<int> v{1, 2, 3};
+    for (auto x : v) std::cout << x << std::endl;
+}""",
+    ),
+    (
+        "csharp",
+        """using System;
+using System.Threading.Tasks;
+
+public class Program
+{
+    public string Name { get; set; }
+
+    public static async Task Main()
+    {
+        Console.WriteLine("Hello");
+    }
+}""",
+    ),
+    (
+        "swift",
+        """import SwiftUI
+
+struct ContentView: View {
+    @State private var count = 0
+
+    var body: some View {
+        Button("Tap") { count += 1 }
+    }
+}""",
+    ),
+    (
+        "ruby",
+        """class Greeter
+  attr_accessor :name
+
+  def greet
+    puts "Hello #{name}"
+  end
+end
+
+[1, 2].each do |n|
+  puts n
+end""",
+    ),
+    (
+        "php",
+        """<?php
+class User {
+    public function __construct(private string $name) {}
+    public function greet() {
+        echo "Hello " . $this->name;
+    }
+}""",
+    ),
+    (
+        "bash",
+        """#!/bin/bash
+set -e
+for f in *.log; do
+  if [ -s "$f" ]; then
+    echo "$f"
+  fi
+done""",
+    ),
+    ("bash", "pip install -U omni-article-markdown\nmdcli https://example.com -s ./output"),
+    ("bash", "$ sudo apt-get update\n$ sudo apt-get install -y curl git"),
+    ("bash", "docker run -d -p 8080:80 --name web nginx:latest"),
+    (
+        "sql",
+        """SELECT u.id, u.name, COUNT(o.id) AS orders
+FROM users u
+LEFT JOIN orders o ON o.user_id = u.id
+WHERE u.active = 1
+GROUP BY u.id
+ORDER BY orders DESC
+LIMIT 10;""",
+    ),
+    (
+        "sql",
+        """CREATE TABLE users (
+    id INT PRIMARY KEY,
+    email VARCHAR(255) NOT NULL
+);""",
+    ),
+    (
+        "html",
+        """<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <link rel="stylesheet" href="style.css">
+</head>
+<body>
+  <div class="app"></div>
+</body>
+</html>""",
+    ),
+    (
+        "css",
+        """.container {
+  display: flex;
+  padding: 0 16px;
+  margin: 0 auto;
+}
+
+@media (max-width: 600px) {
+  .container { padding: 0 8px; }
+}""",
+    ),
+    (
+        "yaml",
+        """apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: web
+spec:
+  replicas: 2""",
+    ),
+    (
+        "yaml",
+        """name: CI
+on: [push]
+jobs:
+  test:
+    runs-on: ubuntu-latest
+    steps:
+      - uses: actions/checkout@v4
+      - run: pytest""",
+    ),
+    (
+        "dockerfile",
+        """FROM python:3.13-slim
+WORKDIR /app
+COPY . .
+RUN pip install .
+EXPOSE 8000
+ENTRYPOINT ["mdcli"]""",
+    ),
+    ("json", '{\n  "name": "demo",\n  "version": "1.0.0",\n  "private": true\n}'),
+    ("", "Hello, world!"),
+    ("", "code"),
+    ("", "The quick brown fox jumps over the lazy dog. It was the best of times, it was the worst of times."),
+    ("", "Traceback (most recent call last):\n  ...\nValueError: invalid literal"),
+    ("", "Total: 42\nPassed: 40\nFailed: 2"),
+    ("", "├── src\n│   └── main.py\n└── README.md"),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    correct = 0
+    for expected, code in CORPUS:
+        actual = detect_language(None, code)
+        if actual == expected:
+            correct += 1
+        else:
+            print(f"expected {expected or '-':<11} got {actual or '-':<11} {code[:40]!r}")
+    print(f"accuracy     {correct}/{len(CORPUS)}")
+
+    size = sum(len(code) for _, code in CORPUS)
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        _detect_code.cache_clear()
+        for _, code in CORPUS:
+            detect_language(None, code)
+    cold = (time.perf_counter() - start) / args.repeat / len(CORPUS)
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for _, code in CORPUS:
+            detect_language(None, code)
+    warm = (time.perf_counter() - start) / args.repeat / len(CORPUS)
+    print(f"uncached     {cold * 1e6:8.1f} us/block  (avg {size / len(CORPUS):.0f} chars)")
+    print(f"memoised     {warm * 1e6:8.1f} us/block")
+
+    big = CORPUS[0][1] * 2000
+    start = time.perf_counter()
+    _detect_code.cache_clear()
+    detect_language(None, big)
+    print(f"{len(big) // 1024} KB block {(time.perf_counter() - start) * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
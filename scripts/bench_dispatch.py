@@ -0,0 +1,80 @@
+"""
+对比提取器分发耗时：旧方式（每个提取器各自搜索一遍 DOM 树）与元数据索引方式。
+
+    uv run python scripts/bench_dispatch.py --paragraphs 2000 --repeat 20
+"""
+
+import argparse
+import time
+
+from bs4 import BeautifulSoup
+
+from omni_article_markdown.extractor import DefaultExtractor, Extractor, ExtractorFactory
+from omni_article_markdown.page_meta import TESTID_KEY
+from omni_article_markdown.plugins import plugin_classes
+from omni_article_markdown.utils import filter_tag, get_canonical_url, get_og_title, get_og_url, get_tag_text, get_title
+
+
+def legacy_value(soup: BeautifulSoup, key: str) -> list[str]:
+    # 与改造前一样，每次取值都搜索一遍文档
+    if key == "title":
+        return [get_title(soup)]
+    if key == "canonical":
+        return [get_canonical_url(soup)]
+    if key == "og:title":
+        return [get_og_title(soup)]
+    if key == "og:url":
+        return [get_og_url(soup)]
+    if key == TESTID_KEY:
+        return []
+    return [get_tag_text(filter_tag(soup.find("meta", {"property": key})), "content")]
+
+
+def legacy_create(soup: BeautifulSoup) -> Extractor:
+    for cls in plugin_classes(Extractor, "extractors"):
+        extractor = cls(soup)
+        if cls.MATCH and cls.can_handle is Extractor.can_handle:
+            if any(rule.test(v) for rule in cls.MATCH for v in legacy_value(soup, rule.key) if v):
+                return extractor
+        elif extractor.can_handle():
+            return extractor
+    return DefaultExtractor(soup)
+
+
+def make_page(paragraphs: int, head: str) -> str:
+    body = "".join(
+        f'<div class="section"><p>Paragraph {i} <a href="/p/{i}">link</a> <code>x = {i}</code></p></div>'
+        for i in range(paragraphs)
+    )
+    return f"<html><head><title>Benchmark</title>{head}</head><body><article>{body}</article></body></html>"
+
+
+def bench(name: str, func, soup: BeautifulSoup, repeat: int):
+    func(soup)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(soup)
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+    print(f"  {name:<8} {elapsed:8.2f} ms/page  -> {type(result).__name__}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--paragraphs", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    pages = {
+        "unmatched": "",
+        "zhihu (og:site_name)": '<meta property="og:site_name" content="知乎专栏">',
+        "yuque (og:url)": '<meta property="og:url" content="https://www.yuque.com/a/b">',
+    }
+    for label, head in pages.items():
+        soup = BeautifulSoup(make_page(args.paragraphs, head), "html5lib")
+        print(f"{label} ({args.paragraphs} paragraphs):")
+        bench("legacy", legacy_create, soup, args.repeat)
+        bench("indexed", ExtractorFactory.create, soup, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
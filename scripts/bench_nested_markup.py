@@ -0,0 +1,51 @@
+"""
+测量 HtmlMarkdownParser 在普通文章和深层嵌套的行内元素（引用中层层嵌套、末尾带空白的强调和链接）上的转换耗时，
+耗时应随嵌套深度线性增长。
+
+    uv run python scripts/bench_nested_markup.py --depths 100 200 400 --repeat 3
+"""
+
+import argparse
+import time
+
+from bench_parsers import make_article
+from bs4 import BeautifulSoup
+
+from omni_article_markdown.extractor import Article
+from omni_article_markdown.parser import HtmlMarkdownParser
+
+TAGS = ["b", "i", "a href='/x'", "span", "em", "strong"]
+
+
+def make_nested(depth: int, width: int) -> str:
+    opening = "".join(f"<{TAGS[d % len(TAGS)]}>{'word ' * width}<br>" for d in range(depth))
+    closing = "".join(f"</{TAGS[d % len(TAGS)].split()[0]}>" for d in reversed(range(depth)))
+    return f"<blockquote><p>{opening}{closing}</p></blockquote>"
+
+
+def bench(label: str, html: str, repeat: int):
+    soup = BeautifulSoup(html, "html.parser")
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _, markdown = HtmlMarkdownParser(Article("Bench", "", "", soup)).parse()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<14} {best * 1000:9.2f} ms  {len(markdown) / 1024:8.1f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--paragraphs", type=int, default=2000)
+    parser.add_argument("--depths", type=int, nargs="+", default=[100, 200, 400])
+    parser.add_argument("--width", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    article = make_article(args.paragraphs).split("<article>")[1].split("</article>")[0]
+    bench("article", article, args.repeat)
+    for depth in args.depths:
+        bench(f"nested {depth}", make_nested(depth, args.width), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+对比不同 HTML 解析器的转换耗时，并检查输出是否与 html5lib 一致。
+
+默认使用内置的几类样例页面，也可以传入本地 HTML 文件：
+
+    uv run python scripts/bench_parsers.py --repeat 5
+    uv run python scripts/bench_parsers.py page1.html page2.html
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from omni_article_markdown.html_parser import PARSER_BACKENDS
+from omni_article_markdown.omni_article_md import OmniArticleMarkdown
+
+
+def make_article(paragraphs: int) -> str:
+    body = "".join(
+        f"<h2>Section {i}</h2><p>Paragraph {i} <a href='/p/{i}'>link</a> <b>bold</b> <code>x = {i}</code></p>"
+        f"<ul><li>one</li><li>two<ul><li>nested</li></ul></li></ul>"
+        f"<pre><code class='language-python'>print({i})</code></pre>"
+        f"<table><tr><th>a</th><th>b</th></tr><tr><td>{i}</td><td>{i * 2}</td></tr></table>"
+        for i in range(paragraphs)
+    )
+    return f"<html><head><title>Article</title></head><body><article>{body}</article></body></html>"
+
+
+def make_wikipedia(paragraphs: int) -> str:
+    body = "".join(
+        f'<h2>Section {i}<span class="mw-editsection">[edit]</span></h2>'
+        f'<p>Text <a href="/wiki/{i}">link</a><sup class="reference">[{i}]</sup></p>'
+        f'<div role="navigation"><ul><li>nav</li></ul></div>'
+        for i in range(paragraphs)
+    )
+    head = '<title>Bench - Wikipedia</title><link rel="canonical" href="https://en.wikipedia.org/wiki/Bench">'
+    return f'<html><head>{head}</head><body><div id="bodyContent">{body}</div></body></html>'
+
+
+def make_malformed(paragraphs: int) -> str:
+    # 未闭合的标签和错误的嵌套，考察各解析器的容错结果
+    body = "".join(f"<p>Paragraph {i} <b>bold <i>both</b> italic</i><li>loose item {i}" for i in range(paragraphs))
+    return f"<html><head><title>Malformed</title></head><body><article>{body}</article></body></html>"
+
+
+def convert(html: str, parser: str) -> tuple[str, dict[str, float]]:
+    handler = OmniArticleMarkdown("", use_cache=False, html_parser=parser)
+    handler.parse_html(html)
+    return handler.result(), handler.timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--paragraphs", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.files:
+        pages = {path.name: path.read_text(encoding="utf-8") for path in args.files}
+    else:
+        pages = {
+            "article": make_article(args.paragraphs),
+            "wikipedia": make_wikipedia(args.paragraphs),
+            "malformed": make_malformed(args.paragraphs),
+        }
+    for name, html in pages.items():
+        print(f"{name} ({len(html) / 1024:.0f} KB):")
+        reference, _ = convert(html, "html5lib")
+        for backend in PARSER_BACKENDS:
+            try:
+                markdown, _ = convert(html, backend)
+            except Exception as e:
+                # 如 lxml 未安装，或 html.parser 对未闭合标签建出过深的树
+                print(f"  {backend:<12} failed: {type(e).__name__}: {str(e)[:80]}")
+                continue
+            extract = total = 0.0
+            for _ in range(args.repeat):
+                _, timings = convert(html, backend)
+                extract += timings["extract"]
+                total += timings["extract"] + timings["parse"]
+            same = "identical" if markdown == reference else "differs"
+            print(
+                f"  {backend:<12} extract {extract / args.repeat * 1000:8.2f} ms"
+                f"  total {total / args.repeat * 1000:8.2f} ms  {same}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+对比完整解析后分发与两段式解析（先解析元数据选择提取器，再跳过 script / style 内容解析文档）的耗时和峰值内存。
+
+    uv run python scripts/bench_partial_parse.py --script-kb 2000 --repeat 3
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from omni_article_markdown.extractor import Extractor, ExtractorFactory
+from omni_article_markdown.html_parser import PARSER_BACKENDS, make_soup
+from omni_article_markdown.parser import HtmlMarkdownParser
+
+
+def make_page(script_kb: int, paragraphs: int, head: str) -> str:
+    # 模拟内嵌大量 JSON 状态、样式和图标的页面
+    state = json.dumps({"items": [{"id": i, "text": "x" * 80} for i in range(script_kb * 1024 // 100)]})
+    style = "".join(f".c{i} {{ color: #{i % 999:03d}; }}" for i in range(2000))
+    body = "".join(f"<p>Paragraph {i} <a href='/p/{i}'>link</a></p>" for i in range(paragraphs))
+    return (
+        f"<html><head><title>Heavy page</title>{head}<style>{style}</style></head>"
+        f"<body><script>window.__STATE__ = {state};</script><article>{body}</article>"
+        f"<script src='/app.js'></script></body></html>"
+    )
+
+
+def full(html: str, parser: str) -> Extractor:
+    extract = ExtractorFactory.create(make_soup(html, parser))
+    if extract.PARSER and parser != extract.PARSER:
+        extract = type(extract)(make_soup(html, extract.PARSER))
+    return extract
+
+
+def partial(html: str, parser: str) -> Extractor:
+    return ExtractorFactory.create_from_html(html, parser)
+
+
+def convert(func, html: str, parser: str) -> str:
+    article = func(html, parser).extract()
+    assert article is not None
+    return HtmlMarkdownParser(article).parse()[1]
+
+
+def bench(name: str, func, html: str, parser: str, repeat: int) -> str:
+    markdown = convert(func, html, parser)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        convert(func, html, parser)
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+    tracemalloc.start()
+    convert(func, html, parser)
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    print(f"    {name:<8} {elapsed:8.2f} ms  peak {peak:7.1f} MB")
+    return markdown
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--script-kb", type=int, default=2000)
+    parser.add_argument("--paragraphs", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = {
+        "default": "",
+        "wechat": '<meta property="og:site_name" content="微信公众平台">',
+    }
+    for label, head in pages.items():
+        html = make_page(args.script_kb, args.paragraphs, head)
+        if label == "wechat":
+            html = html.replace("<article>", '<div class="rich_media_content">').replace("</article>", "</div>")
+        print(f"{label} ({len(html) / 1024:.0f} KB):")
+        for backend in PARSER_BACKENDS:
+            try:
+                make_soup("", backend)
+            except ValueError:
+                continue
+            print(f"  {backend}:")
+            expected = bench("full", full, html, backend, args.repeat)
+            actual = bench("partial", partial, html, backend, args.repeat)
+            print(f"    output   {'identical' if expected == actual else 'differs'}")
+
+
+if __name__ == "__main__":
+    main()
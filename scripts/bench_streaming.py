@@ -0,0 +1,85 @@
+"""
+对比树解析（提取 + HtmlMarkdownParser）与流式转换的耗时和峰值内存，并检查输出是否与 html.parser 一致。
+
+    uv run python scripts/bench_streaming.py --paragraphs 2000 --repeat 3
+    uv run python scripts/bench_streaming.py page1.html page2.html
+"""
+
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+
+from omni_article_markdown.extractor import ExtractorFactory
+from omni_article_markdown.html_parser import PARSER_BACKENDS
+from omni_article_markdown.parser import HtmlMarkdownParser
+from omni_article_markdown.streaming import StreamingMarkdownParser
+
+
+def make_article(paragraphs: int) -> str:
+    body = "".join(
+        f"<h2>Section {i}</h2><p>Paragraph {i} <a href='/p/{i}'>link</a> <b>bold</b> <code>x = {i}</code></p>"
+        f"<ul><li>one</li><li>two<ul><li>nested</li></ul></li></ul>"
+        f"<pre><code class='language-python'>print({i})</code></pre>"
+        f"<table><tr><th>a</th><th>b</th></tr><tr><td>{i}</td><td>{i * 2}</td></tr></table>"
+        f"<div style='display: none'><p>hidden {i}</p></div><!-- comment {i} -->"
+        for i in range(paragraphs)
+    )
+    return f"<html><head><title>Article</title></head><body><nav>menu</nav><article>{body}</article></body></html>"
+
+
+def tree(html: str, parser: str) -> tuple[str, str] | None:
+    article = ExtractorFactory.create_from_html(html, parser).extract()
+    return HtmlMarkdownParser(article).parse() if article else None
+
+
+def stream(html: str, parser: str) -> tuple[str, str] | None:
+    return StreamingMarkdownParser(html).parse()
+
+
+def bench(name: str, func, html: str, parser: str, repeat: int) -> tuple[str, str] | None:
+    try:
+        result = func(html, parser)
+    except Exception as e:
+        # 如 lxml 未安装，或 html.parser 对未闭合标签建出过深的树
+        print(f"  {name:<18} failed: {type(e).__name__}: {str(e)[:80]}")
+        return None
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(html, parser)
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+    tracemalloc.start()
+    func(html, parser)
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    print(f"  {name:<18} {elapsed:8.2f} ms  peak {peak:7.1f} MB")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--paragraphs", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.files:
+        pages = {path.name: path.read_text(encoding="utf-8") for path in args.files}
+    else:
+        pages = {"article": make_article(args.paragraphs)}
+    for name, html in pages.items():
+        print(f"{name} ({len(html) / 1024:.0f} KB):")
+        reference = None
+        for backend in PARSER_BACKENDS:
+            result = bench(f"tree {backend}", tree, html, backend, args.repeat)
+            if backend == "html.parser":
+                reference = result
+        result = bench("streaming", stream, html, "html.parser", args.repeat)
+        if result is None:
+            print("  streaming falls back to the tree parser for this page")
+        else:
+            print(f"  output             {'identical' if result == reference else 'differs'}")
+
+
+if __name__ == "__main__":
+    main()
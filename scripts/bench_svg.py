@@ -0,0 +1,73 @@
+"""
+测量插图较多（公众号文章中常见的大量内联 SVG）时的转换耗时和输出大小：内嵌为 base64 data URI，
+以及用 SvgExporter 写入资源目录（可选 minify）后的 Markdown 与 SVG 文件大小。
+
+    uv run python scripts/bench_svg.py --svgs 300 --repeat 3
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from omni_article_markdown.assets import SvgExporter
+from omni_article_markdown.extractor import Article
+from omni_article_markdown.parser import HtmlMarkdownParser
+
+
+def make_svg(i: int) -> str:
+    # 每隔几张图重复一次，模拟文章中反复出现的分隔线、图标
+    if i % 5 == 4:
+        i = 0
+    rng = random.Random(i)
+    paths = "\n    ".join(
+        f'<path d="M{rng.randint(0, 500)} {rng.randint(0, 500)} L{rng.randint(0, 500)} {rng.randint(0, 500)} Z" '
+        f'fill="#{i % 999:03d}" stroke-width="1.5"></path>'
+        for _ in range(60)
+    )
+    return (
+        f'<svg data-id="omnimd" viewBox="0 0 500 500" xmlns="http://www.w3.org/2000/svg">\n  <!-- figure {i} -->\n'
+        f'  <g transform="translate(1 1)">\n    {paths}\n  </g>\n</svg>'
+    )
+
+
+def make_html(svgs: int) -> str:
+    body = "".join(f"<p>para {i} text text</p><section>{make_svg(i)}</section>" for i in range(svgs))
+    return f"<div>{body}</div>"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--svgs", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    html = make_html(args.svgs)
+    print(f"html         {len(html) / 1024:9.1f} KB")
+    best = float("inf")
+    markdown = ""
+    for _ in range(args.repeat):
+        soup = BeautifulSoup(html, "lxml")
+        start = time.perf_counter()
+        _, markdown = HtmlMarkdownParser(Article("Bench", "", "", soup.div)).parse()
+        best = min(best, time.perf_counter() - start)
+    print(f"convert      {best * 1000:9.2f} ms  markdown {len(markdown.encode()) / 1024:8.1f} KB (inline)")
+
+    for minify in (False, True):
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            result = SvgExporter(minify=minify).localise(markdown, tmp)
+            elapsed = time.perf_counter() - start
+            files = list((Path(tmp) / "assets").iterdir())
+            size = sum(f.stat().st_size for f in files)
+            print(
+                f"{'minify' if minify else 'files':<12} {elapsed * 1000:9.2f} ms  markdown {len(result.encode()) / 1024:8.1f} KB"
+                f" + {len(files)} svg {size / 1024:8.1f} KB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+测量大表格（维基百科、文档站点中上万行的表格）的转换耗时，默认 5000 行 × 10 列共 5 万个单元格，
+每隔若干行带有 rowspan / colspan。
+
+    uv run python scripts/bench_table.py --rows 5000 --cols 10 --repeat 3
+"""
+
+import argparse
+import time
+
+from bs4 import BeautifulSoup
+
+from omni_article_markdown.extractor import Article
+from omni_article_markdown.parser import HtmlMarkdownParser
+
+
+def make_table(rows: int, cols: int, spans: bool) -> str:
+    parts = ["<table><thead><tr>", *(f"<th>Column {c}</th>" for c in range(cols)), "</tr></thead><tbody>"]
+    for r in range(rows):
+        parts.append("<tr>")
+        c = 0
+        while c < cols:
+            if spans and r % 50 == 0 and c == 0:
+                parts.append(f"<td rowspan='3'><a href='/r{r}'>row {r}</a></td>")
+            elif spans and r % 50 in (1, 2) and c == 0:
+                # 被上一行的 rowspan 占据
+                c += 1
+                continue
+            elif spans and r % 20 == 5 and c == 2:
+                parts.append(f"<td colspan='2'><b>wide</b> {r}</td>")
+                c += 1
+            else:
+                parts.append(f"<td> cell {r}-{c} <code>x</code></td>")
+            c += 1
+        parts.append("</tr>")
+    parts.append("</tbody></table>")
+    return "".join(parts)
+
+
+def bench(label: str, html: str, repeat: int):
+    best = float("inf")
+    markdown = ""
+    for _ in range(repeat):
+        soup = BeautifulSoup(html, "lxml")
+        start = time.perf_counter()
+        _, markdown = HtmlMarkdownParser(Article("Bench", "", "", soup)).parse()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<12} {best * 1000:9.2f} ms  {len(markdown) / 1024:8.1f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    bench("plain", make_table(args.rows, args.cols, False), args.repeat)
+    bench("spans", make_table(args.rows, args.cols, True), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,3 @@
-from .omni_article_md import OmniArticleMarkdown
+from .omni_article_md import OmniArticleMarkdown, convert_many
 
-__all__ = ["OmniArticleMarkdown"]
+__all__ = ["OmniArticleMarkdown", "convert_many"]
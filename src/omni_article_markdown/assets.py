@@ -0,0 +1,161 @@
+import base64
+import binascii
+import hashlib
+import json
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from .disk_cache import _atomic_write
+
+DEFAULT_ASSETS_DIR = "assets"
+
+# 代码块原样保留，其中形如图片的文字不会被改写
+_FENCE_RE = re.compile(r"^```.*?^```[ \t]*$", re.MULTILINE | re.DOTALL)
+_SVG_DATA_RE = re.compile(r"!\[([^\]\n]*)\]\(data:image/svg\+xml;base64,([A-Za-z0-9+/=]+)\)")
+_SVG_COMMENT_RE = re.compile(rb"<!--.*?-->", re.DOTALL)
+_SVG_INDENT_RE = re.compile(rb">\s*\n\s*<")
+
+
+class AssetStore:
+    """
+    按内容寻址的资源目录（图片、SVG 等）：文件名为内容 SHA-256 的前 16 位加扩展名，相同的内容只保存一次。
+
+    同时在 `.index.json` 中记录来源 URL -> 文件名，保存到同一目录的多篇文章引用同一个 URL 时只下载一次。
+    """
+
+    INDEX_NAME = ".index.json"
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._urls: dict[str, str] | None = None
+        self._dirty = False
+
+    def put(self, data: bytes, suffix: str) -> str:
+        """保存内容并返回文件名，内容相同的文件已经存在时不再写入。"""
+        name = f"{hashlib.sha256(data).hexdigest()[:16]}{suffix}"
+        target = self.path / name
+        if not target.exists():
+            self.path.mkdir(parents=True, exist_ok=True)
+            _atomic_write(target, data)
+        return name
+
+    def lookup_url(self, url: str) -> str | None:
+        with self._lock:
+            name = self._index().get(url)
+        if name and (self.path / name).exists():
+            return name
+        return None
+
+    def record_url(self, url: str, name: str):
+        with self._lock:
+            self._index()[url] = name
+            self._dirty = True
+
+    def flush(self):
+        """把 URL 索引写回磁盘。"""
+        with self._lock:
+            if not self._dirty or self._urls is None:
+                return
+            self.path.mkdir(parents=True, exist_ok=True)
+            # 其他进程可能同时写入了索引，合并后再保存
+            urls = {**self._load_index(), **self._urls}
+            _atomic_write(self.path / self.INDEX_NAME, json.dumps(urls, ensure_ascii=False).encode("utf-8"))
+            self._urls = urls
+            self._dirty = False
+
+    def relative_to(self, base_dir: Path | str, name: str) -> str:
+        """Markdown 文件所在目录 base_dir 到资源文件的相对路径，使用 `/` 分隔。"""
+        return Path(os.path.relpath(self.path / name, base_dir)).as_posix()
+
+    def _index(self) -> dict[str, str]:
+        if self._urls is None:
+            self._urls = self._load_index()
+        return self._urls
+
+    def _load_index(self) -> dict[str, str]:
+        try:
+            with open(self.path / self.INDEX_NAME, encoding="utf8") as f:
+                urls = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return urls if isinstance(urls, dict) else {}
+
+
+class AssetLocaliser(ABC):
+    """
+    把 Markdown 引用的资源保存到 Markdown 文件所在目录下的 assets_dir 中，并改写为相对路径。
+    同一目录共用一个 AssetStore；子类实现 localise()。
+    """
+
+    def __init__(self, assets_dir: str = DEFAULT_ASSETS_DIR):
+        self.assets_dir = assets_dir
+        self._lock = threading.Lock()
+        self._stores: dict[Path, AssetStore] = {}
+
+    def store_for(self, base_dir: Path | str) -> AssetStore:
+        path = (Path(base_dir) / self.assets_dir).resolve()
+        with self._lock:
+            store = self._stores.get(path)
+            if store is None:
+                store = self._stores[path] = AssetStore(path)
+        return store
+
+    @abstractmethod
+    def localise(self, markdown: str, base_dir: Path | str) -> str:
+        """返回改写了链接的 Markdown，链接相对于 base_dir。"""
+
+    def iter_localise(self, chunks: Iterable[str], base_dir: Path | str) -> Iterator[str]:
+        """
+        localise() 的增量版本，chunks 为 iter_markdown() 的输出。代码块不会跨越两段，可以逐段改写。
+        """
+        for chunk in chunks:
+            yield self.localise(chunk, base_dir)
+
+
+class SvgExporter(AssetLocaliser):
+    """
+    把以 data URI 内嵌的 SVG（见 HtmlMarkdownParser._process_svg()）写入资源目录，改为按相对路径引用。
+    内容相同的 SVG 只保存一份；minify 为 True 时去掉注释和标签之间的换行缩进。
+    """
+
+    def __init__(self, assets_dir: str = DEFAULT_ASSETS_DIR, minify: bool = False):
+        super().__init__(assets_dir)
+        self.minify = minify
+
+    def localise(self, markdown: str, base_dir: Path | str) -> str:
+        if "data:image/svg+xml;base64," not in markdown:
+            return markdown
+        store = self.store_for(base_dir)
+
+        def replace(match: re.Match[str]) -> str:
+            try:
+                svg = base64.b64decode(match[2], validate=True)
+            except binascii.Error:
+                return match[0]
+            if self.minify:
+                svg = minify_svg(svg)
+            return f"![{match[1]}]({store.relative_to(base_dir, store.put(svg, '.svg'))})"
+
+        return "".join(
+            text if is_code else _SVG_DATA_RE.sub(replace, text) for text, is_code in split_code_fences(markdown)
+        )
+
+
+def minify_svg(svg: bytes) -> bytes:
+    # 只去掉格式化用的换行缩进，同一行内标签之间的空格在 <text> 中可能有意义
+    return _SVG_INDENT_RE.sub(b"><", _SVG_COMMENT_RE.sub(b"", svg))
+
+
+def split_code_fences(markdown: str) -> Iterator[tuple[str, bool]]:
+    """把 Markdown 切分为 (文字, 是否为代码块)。"""
+    pos = 0
+    for fence in _FENCE_RE.finditer(markdown):
+        yield markdown[pos : fence.start()], False
+        yield fence[0], True
+        pos = fence.end()
+    yield markdown[pos:], False
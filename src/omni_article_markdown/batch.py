@@ -0,0 +1,198 @@
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TextIO
+from urllib.parse import urlparse
+
+from .launch_playwright import close_worker_browser_pools
+from .omni_article_md import OmniArticleMarkdown
+from .rate_limit import get_rate_limiter
+from .reporter import Reporter
+
+DEFAULT_WORKERS = 4
+
+
+@dataclass
+class BatchResult:
+    url: str
+    save_path: str | None = None
+    error: str | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def iter_urls(stream: TextIO) -> Iterator[str]:
+    """
+    逐行读取 URL 列表，跳过空行和以 `#` 开头的注释行。
+    按行流式读取，不会一次性把整个文件载入内存。
+    """
+    for line in stream:
+        url = line.strip()
+        if url and not url.startswith("#"):
+            yield url
+
+
+def convert_batch(
+    urls: Iterable[str],
+    save_path: str = OmniArticleMarkdown.DEFAULT_SAVE_PATH,
+    workers: int = DEFAULT_WORKERS,
+    reporter: Reporter | None = None,
+    verify_ssl: bool = True,
+    use_cache: bool = True,
+    html_parser: str | None = None,
+    streaming: bool = False,
+) -> Iterator[BatchResult]:
+    """
+    使用有界线程池并发转换多篇文章，并按完成顺序逐个返回结果。
+
+    同时在途的任务数不超过 `workers * 2`，因此即使输入是一个很大的流，
+    也只会按需从中读取 URL（最多预读 `workers * 8` 个），而不会一次性提交所有任务。
+    不同主机的任务交错提交，每个主机在途的任务数不超过限速配置中的 max_in_flight（见 rate_limit），
+    某个站点响应缓慢或被限速时，其他站点的任务不会被它占满的线程阻塞。
+    标题相同的文章依次保存为 `<title>.md`、`<title>-2.md`……，不会互相覆盖。
+    """
+    Path(save_path).mkdir(parents=True, exist_ok=True)
+    output_paths = _OutputPaths()
+    max_pending = workers * 2
+    scheduler = _HostInterleaver(urls, lookahead=workers * 8, max_pending=max_pending)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mdcli-batch") as executor:
+        try:
+            pending: set[Future[BatchResult]] = set()
+            while True:
+                while len(pending) < max_pending:
+                    url = scheduler.take()
+                    if url is None:
+                        break
+                    pending.add(
+                        executor.submit(
+                            _convert_one,
+                            url,
+                            save_path,
+                            output_paths,
+                            reporter,
+                            verify_ssl,
+                            use_cache,
+                            html_parser,
+                            streaming,
+                        )
+                    )
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    scheduler.release(result.url)
+                    yield result
+        finally:
+            # 浏览器池绑定在工作线程上，须在线程池关闭前由各线程自行关闭
+            close_worker_browser_pools(executor, workers)
+
+
+class _OutputPaths:
+    """在一次批量转换中为每篇文章分配不重复的文件路径，多个工作线程共用。"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reserved: set[Path] = set()
+
+    def reserve(self, path: Path) -> Path:
+        with self._lock:
+            candidate = path
+            n = 1
+            while candidate.resolve() in self._reserved:
+                n += 1
+                candidate = path.with_name(f"{path.stem}-{n}{path.suffix}")
+            self._reserved.add(candidate.resolve())
+        return candidate
+
+
+class _HostInterleaver:
+    """
+    从 URL 流中预读最多 lookahead 个，按主机分组后轮流取出；主机在途的任务数达到上限时先取其他主机的 URL。
+    """
+
+    def __init__(self, urls: Iterable[str], lookahead: int, max_pending: int):
+        self._urls = iter(urls)
+        self._lookahead = lookahead
+        self._max_pending = max_pending
+        self._exhausted = False
+        self._buffered = 0
+        # 插入顺序即轮询顺序，取出后移到末尾
+        self._queues: dict[str, deque[str]] = {}
+        self._in_flight: Counter[str] = Counter()
+
+    def take(self) -> str | None:
+        """返回下一个可以提交的 URL；没有剩余 URL，或剩余的主机都已达到上限时返回 None。"""
+        self._fill()
+        for host in list(self._queues):
+            if self._in_flight[host] >= self._cap(host):
+                continue
+            queue = self._queues.pop(host)
+            url = queue.popleft()
+            if queue:
+                self._queues[host] = queue
+            self._buffered -= 1
+            self._in_flight[host] += 1
+            return url
+        return None
+
+    def release(self, url: str):
+        self._in_flight[_host(url)] -= 1
+
+    def _fill(self):
+        while not self._exhausted and self._buffered < self._lookahead:
+            url = next(self._urls, None)
+            if url is None:
+                self._exhausted = True
+                break
+            self._queues.setdefault(_host(url), deque()).append(url)
+            self._buffered += 1
+
+    def _cap(self, host: str) -> int:
+        limit = get_rate_limiter().limit_for(host)
+        return limit.max_in_flight if limit else self._max_pending
+
+
+def _host(url: str) -> str:
+    return (urlparse(url).hostname or "").lower()
+
+
+def _convert_one(
+    url: str,
+    save_path: str,
+    output_paths: _OutputPaths,
+    reporter: Reporter | None,
+    verify_ssl: bool,
+    use_cache: bool,
+    html_parser: str | None,
+    streaming: bool,
+) -> BatchResult:
+    start = time.perf_counter()
+    try:
+        handler = OmniArticleMarkdown(
+            url,
+            reporter=_prefixed(reporter, url),
+            verify_ssl=verify_ssl,
+            use_cache=use_cache,
+            html_parser=html_parser,
+            streaming=streaming,
+        )
+        handler.parse()
+        saved = handler.save(str(output_paths.reserve(handler.file_path(save_path))))
+        return BatchResult(url=url, save_path=saved, elapsed=time.perf_counter() - start)
+    except Exception as e:
+        return BatchResult(url=url, error=str(e) or e.__class__.__name__, elapsed=time.perf_counter() - start)
+
+
+def _prefixed(reporter: Reporter | None, url: str) -> Reporter | None:
+    # 多个任务的日志会交错输出，带上 URL 前缀方便区分
+    if reporter is None:
+        return None
+    return lambda message: reporter(f"[{url}] {message}")
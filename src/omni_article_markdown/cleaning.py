@@ -0,0 +1,176 @@
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import soupsieve
+from bs4.element import Comment, PageElement, Tag
+
+type TagPredicate = Callable[[Tag], bool]
+
+
+@dataclass(frozen=True, kw_only=True)
+class CleanRule:
+    """
+    声明式的清理规则，指定的条件需要同时满足：
+
+    - tags: 标签名之一
+    - class_: 包含该 class
+    - id: id 完全相等
+    - attr / contains: 存在属性 attr；指定 contains 时属性值还需包含该字符串（多值属性按元素匹配）
+    - css: CSS 选择器
+    - when: 额外的自定义判断；只应读取元素的 name 与 attrs，流式转换时传入的不是完整的 Tag
+    """
+
+    tags: tuple[str, ...] = ()
+    class_: str | None = None
+    id: str | None = None
+    attr: str | None = None
+    contains: str | None = None
+    css: str | None = None
+    when: TagPredicate | None = None
+
+    def __post_init__(self):
+        if self.contains is not None and self.attr is None:
+            raise ValueError("`contains` requires `attr`.")
+        if self.css is not None:
+            # 提前编译以便尽早发现错误的选择器，soupsieve 会缓存编译结果
+            soupsieve.compile(self.css)
+
+    def matches(self, name: str, attrs: Mapping[str, Any], el: Tag | None = None) -> bool:
+        """
+        按标签名和属性判断是否匹配；包含 css 或 when 条件的规则还需要传入 el。
+        """
+        if self.tags and name not in self.tags:
+            return False
+        if self.class_ is not None and not _contains(attrs.get("class"), self.class_):
+            return False
+        if self.id is not None and attrs.get("id") != self.id:
+            return False
+        if self.attr is not None:
+            if self.attr not in attrs:
+                return False
+            if self.contains is not None and not _contains(attrs[self.attr], self.contains):
+                return False
+        if self.css is not None and (el is None or not soupsieve.match(self.css, el)):
+            return False
+        return self.when is None or (el is not None and self.when(el))
+
+
+type CleanCondition = CleanRule | TagPredicate
+
+
+class CleanRuleSet:
+    """
+    把清理规则按 id / class / 标签名 / 属性名编译成索引，每个元素只与可能相关的规则比较。
+    无法索引的规则（纯 CSS 选择器、自定义函数）对每个元素逐条判断。
+    """
+
+    def __init__(self, conditions: Iterable[CleanCondition]):
+        # 值为 (规则, 是否仅凭索引键即可判定匹配)
+        self._by_id: dict[str, list[tuple[CleanRule, bool]]] = {}
+        self._by_class: dict[str, list[tuple[CleanRule, bool]]] = {}
+        self._by_tag: dict[str, list[tuple[CleanRule, bool]]] = {}
+        self._by_attr: dict[str, list[tuple[CleanRule, bool]]] = {}
+        self._generic: list[CleanCondition] = []
+        # 是否存在需要完整元素才能判断的规则（CSS 选择器或自定义函数）
+        self.needs_element = False
+        for cond in conditions:
+            self.add(cond)
+
+    def add(self, cond: CleanCondition):
+        if not isinstance(cond, CleanRule):
+            self._generic.append(cond)
+            self.needs_element = True
+            return
+        if cond.css is not None:
+            self.needs_element = True
+        # 除索引键之外没有其他条件时，命中索引即视为匹配
+        conditions = sum(
+            value is not None for value in (cond.class_, cond.id, cond.attr, cond.contains, cond.css, cond.when)
+        ) + bool(cond.tags)
+        exact = conditions == 1
+        if cond.id is not None:
+            self._by_id.setdefault(cond.id, []).append((cond, exact))
+        elif cond.class_ is not None:
+            self._by_class.setdefault(cond.class_, []).append((cond, exact))
+        elif cond.tags:
+            for tag in cond.tags:
+                self._by_tag.setdefault(tag, []).append((cond, exact))
+        elif cond.attr is not None:
+            self._by_attr.setdefault(cond.attr, []).append((cond, exact))
+        else:
+            self._generic.append(cond)
+
+    def matches(self, el: Tag) -> bool:
+        return self.matches_attrs(el.name, el.attrs, el)
+
+    def matches_attrs(self, name: str, attrs: Mapping[str, Any], el: Tag | None = None) -> bool:
+        if _match_any(self._by_tag.get(name), name, attrs, el):
+            return True
+        if attrs:
+            el_id = attrs.get("id")
+            if isinstance(el_id, str) and _match_any(self._by_id.get(el_id), name, attrs, el):
+                return True
+            classes = attrs.get("class")
+            if classes and self._by_class:
+                for token in classes.split() if isinstance(classes, str) else classes:
+                    if _match_any(self._by_class.get(token), name, attrs, el):
+                        return True
+            if self._by_attr:
+                for attr in attrs:
+                    if _match_any(self._by_attr.get(attr), name, attrs, el):
+                        return True
+        if el is not None:
+            for cond in self._generic:
+                if cond.matches(name, attrs, el) if isinstance(cond, CleanRule) else cond(el):
+                    return True
+        return False
+
+    def prune(self, root: Tag):
+        """
+        先序遍历一次 root 的子孙节点：删除匹配规则的元素（不再进入其子树）以及所有注释。
+        """
+        node: PageElement | None = root.contents[0] if root.contents else None
+        while node is not None:
+            if isinstance(node, Tag):
+                if self.matches(node):
+                    following = _next_outside(node, root)
+                    node.decompose()
+                    node = following
+                    continue
+                if node.contents:
+                    node = node.contents[0]
+                    continue
+            elif isinstance(node, Comment):
+                following = _next_outside(node, root)
+                node.extract()
+                node = following
+                continue
+            node = _next_outside(node, root)
+
+
+def _next_outside(node: PageElement, root: Tag) -> PageElement | None:
+    # 跳过 node 的子树，返回先序遍历中的下一个节点
+    while node is not root:
+        if node.next_sibling is not None:
+            return node.next_sibling
+        parent = node.parent
+        if parent is None:
+            return None
+        node = parent
+    return None
+
+
+def _match_any(rules: list[tuple[CleanRule, bool]] | None, name: str, attrs: Mapping[str, Any], el: Tag | None) -> bool:
+    if rules:
+        for rule, exact in rules:
+            if exact or rule.matches(name, attrs, el):
+                return True
+    return False
+
+
+def _contains(value: Any, needle: str) -> bool:
+    # 与 `needle in el.attrs[...]` 一致：字符串按子串匹配，多值属性（列表）按元素匹配
+    if value is None:
+        return False
+    return needle in value
@@ -5,7 +5,12 @@ from importlib import metadata
 import click
 from click_default_group import DefaultGroup
 
+from . import assets, images, server
+from .batch import DEFAULT_WORKERS, convert_batch, iter_urls
+from .html_parser import AUTO, PARSER_BACKENDS, make_soup
+from .http_client import DEFAULT_POOL_MAXSIZE, close_sessions, configure_sessions
 from .omni_article_md import OmniArticleMarkdown
+from .rate_limit import HostLimit, configure_rate_limits, parse_host_limit
 from .reader import ReaderFactory
 
 help_msg = inspect.cleandoc("""
@@ -18,11 +23,23 @@ Parse an article and print Markdown:
   mdcli <url>
 Parse and save to a specific directory:
   mdcli <url> -s /path/to/save
+Convert a list of URLs (one per line) concurrently:
+  mdcli batch urls.txt -s /path/to/save -j 8
+Run a local conversion service:
+  mdcli serve --port 8765
+Show which reader handles a URL (or list all routes):
+  mdcli routes <url>
 
 
 Notes:
 
 --no-verify-ssl disables certificate validation.
+--parser selects the HTML parser (auto uses lxml when installed, otherwise html5lib).
+--streaming converts generic pages without building a DOM tree (same output as --parser html.parser).
+--incremental writes each block as soon as it is converted, so pipes can start reading right away.
+--offline-gists renders embedded gists from the local cache without calling the GitHub API.
+--download-images stores images under --assets-dir (deduplicated by content) so archives survive expiring links.
+--host-limit (batch, serve) overrides the built-in per-domain rate limits, e.g. --host-limit zhihu.com=0.5,1,1.
 """)
 
 
@@ -41,6 +58,19 @@ def stderr(message: str):
     click.echo(click.style(message, fg="red"), err=True)
 
 
+def _parse_host_limits(values: tuple[str, ...]) -> dict[str, HostLimit]:
+    try:
+        return dict(parse_host_limit(value) for value in values)
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from None
+
+
+def _size_connection_pool(workers: int):
+    # 每个主机保留的连接数不少于并发线程数，否则多出的连接用完即被丢弃，无法复用
+    if workers > DEFAULT_POOL_MAXSIZE:
+        configure_sessions(pool_maxsize=workers)
+
+
 @click.group(
     cls=DefaultGroup,
     default="parse",
@@ -50,7 +80,9 @@ def stderr(message: str):
     help=help_msg,
 )
 @click.version_option(version=get_version())
-def cli(): ...
+def cli():
+    # 退出时关闭连接池中的连接
+    click.get_current_context().call_on_close(close_sessions)
 
 
 @cli.command(name="parse")
@@ -58,6 +90,60 @@ def cli(): ...
 @click.option(
     "--no-verify-ssl", is_flag=True, default=False, help="Disable SSL certificate verification (not recommended)."
 )
+@click.option("--no-cache", is_flag=True, default=False, help="Bypass the local cache.")
+@click.option("--parser", "html_parser", type=click.Choice([AUTO, *PARSER_BACKENDS]), default=None, help="HTML parser.")
+@click.option(
+    "--streaming", is_flag=True, default=False, help="Convert without building a DOM tree when the page allows it."
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help="Write Markdown block by block while converting instead of all at once.",
+)
+@click.option(
+    "--offline-gists", is_flag=True, default=False, help="Render embedded GitHub gists from the local cache only."
+)
+@click.option(
+    "--download-images",
+    is_flag=True,
+    default=False,
+    help="Download images next to the Markdown file and link them by relative path.",
+)
+@click.option(
+    "--assets-dir",
+    default=assets.DEFAULT_ASSETS_DIR,
+    show_default=True,
+    help="Directory for downloaded images and SVG files, relative to the Markdown file.",
+)
+@click.option(
+    "--image-workers",
+    type=click.IntRange(min=1),
+    default=images.DEFAULT_WORKERS,
+    show_default=True,
+    help="Number of images downloaded concurrently.",
+)
+@click.option(
+    "--image-host-limit",
+    type=click.IntRange(min=1),
+    default=images.DEFAULT_PER_HOST,
+    show_default=True,
+    help="Maximum concurrent image downloads per host.",
+)
+@click.option(
+    "--image-max-mb",
+    type=click.IntRange(min=0),
+    default=images.DEFAULT_MAX_TOTAL_SIZE // (1024 * 1024),
+    show_default=True,
+    help="Stop downloading images after this many megabytes.",
+)
+@click.option(
+    "--svg-files",
+    is_flag=True,
+    default=False,
+    help="Write inline SVGs to --assets-dir instead of embedding them as base64.",
+)
+@click.option("--minify-svg", is_flag=True, default=False, help="Strip comments and indentation from SVG files.")
 @click.option(
     "-s",
     "--save",
@@ -67,19 +153,68 @@ def cli(): ...
     flag_value="./",
     default=None,
 )
-def parse_article(url_or_path: str, save: str | None, no_verify_ssl: bool):
+def parse_article(
+    url_or_path: str,
+    save: str | None,
+    no_verify_ssl: bool,
+    no_cache: bool,
+    html_parser: str | None,
+    streaming: bool,
+    incremental: bool,
+    offline_gists: bool,
+    download_images: bool,
+    assets_dir: str,
+    image_workers: int,
+    image_host_limit: int,
+    image_max_mb: int,
+    svg_files: bool,
+    minify_svg: bool,
+):
     """
     Parses an article from a URL or local path and outputs/saves it as Markdown.
     """
     verify_ssl = not no_verify_ssl
+    localisers: list[assets.AssetLocaliser] = []
+    if svg_files:
+        localisers.append(assets.SvgExporter(assets_dir=assets_dir, minify=minify_svg))
+    if download_images:
+        localisers.append(
+            images.ImageDownloader(
+                assets_dir=assets_dir,
+                workers=image_workers,
+                per_host=image_host_limit,
+                max_total_size=image_max_mb * 1024 * 1024,
+                verify_ssl=verify_ssl,
+                reporter=stderr_reporter,
+            )
+        )
     try:
-        handler = OmniArticleMarkdown(url_or_path, reporter=stderr_reporter, verify_ssl=verify_ssl)
-        handler.parse()
-        if save is None:
-            click.echo(handler.result())
+        handler = OmniArticleMarkdown(
+            url_or_path,
+            reporter=stderr_reporter,
+            verify_ssl=verify_ssl,
+            use_cache=not no_cache,
+            html_parser=html_parser,
+            streaming=streaming,
+            offline_gists=offline_gists,
+            localisers=localisers,
+        )
+        if incremental:
+            if save is None:
+                chunks = handler.iter_markdown()
+                # 输出到标准输出时，资源文件保存在当前目录下
+                for chunk in handler.iter_localise(chunks, "."):
+                    click.echo(chunk, nl=False)
+                click.echo()
+                return
+            save_path = handler.save_incremental(save)
         else:
+            handler.parse()
+            if save is None:
+                click.echo(handler.localise(handler.result(), "."))
+                return
             save_path = handler.save(save)
-            stderr_reporter(f"Article saved to: {save_path}")
+        stderr_reporter(f"Article saved to: {save_path}")
     except Exception as e:
         stderr(f"Error: {str(e)}")
         sys.exit(1)
@@ -90,19 +225,21 @@ def parse_article(url_or_path: str, save: str | None, no_verify_ssl: bool):
 @click.option(
     "--no-verify-ssl", is_flag=True, default=False, help="Disable SSL certificate verification (not recommended)."
 )
+@click.option("--no-cache", is_flag=True, default=False, help="Bypass the local cache.")
+@click.option("--parser", "html_parser", type=click.Choice([AUTO, *PARSER_BACKENDS]), default=None, help="HTML parser.")
 @click.option("-p", "--prettify", is_flag=True, default=False, help="Prettify the HTML output.")
-def read(url_or_path: str, no_verify_ssl: bool, prettify: bool):
+def read(url_or_path: str, no_verify_ssl: bool, no_cache: bool, html_parser: str | None, prettify: bool):
     """
     Reads and formats an article from a URL or local path.
     """
     verify_ssl = not no_verify_ssl
     try:
-        reader = ReaderFactory.create(url_or_path, reporter=stderr_reporter, verify_ssl=verify_ssl)
+        reader = ReaderFactory.create(
+            url_or_path, reporter=stderr_reporter, verify_ssl=verify_ssl, use_cache=not no_cache
+        )
         raw_html = reader.read()
         if prettify:
-            from bs4 import BeautifulSoup
-
-            soup = BeautifulSoup(raw_html, "html5lib")
+            soup = make_soup(raw_html, html_parser)
             click.echo(soup.prettify())
         else:
             click.echo(raw_html)
@@ -111,5 +248,143 @@ def read(url_or_path: str, no_verify_ssl: bool, prettify: bool):
         sys.exit(1)
 
 
+@cli.command(name="batch")
+@click.argument("input_file", type=click.File("r", encoding="utf-8"), default="-")
+@click.option(
+    "--no-verify-ssl", is_flag=True, default=False, help="Disable SSL certificate verification (not recommended)."
+)
+@click.option("--no-cache", is_flag=True, default=False, help="Bypass the local cache.")
+@click.option("--parser", "html_parser", type=click.Choice([AUTO, *PARSER_BACKENDS]), default=None, help="HTML parser.")
+@click.option(
+    "--streaming", is_flag=True, default=False, help="Convert without building a DOM tree when the page allows it."
+)
+@click.option(
+    "-s",
+    "--save",
+    help="Directory to save the results to.",
+    type=click.Path(file_okay=False, dir_okay=True, writable=True),
+    default="./",
+    show_default=True,
+)
+@click.option(
+    "--host-limit",
+    "host_limits",
+    multiple=True,
+    callback=lambda ctx, param, values: _parse_host_limits(values),
+    metavar="DOMAIN=RATE[,BURST[,MAX_IN_FLIGHT]]",
+    help="Per-domain request rate (per second), burst and concurrency. Repeatable.",
+)
+@click.option(
+    "-j",
+    "--workers",
+    help="Number of articles converted concurrently.",
+    type=click.IntRange(min=1),
+    default=DEFAULT_WORKERS,
+    show_default=True,
+)
+def batch(
+    input_file,
+    save: str,
+    workers: int,
+    no_verify_ssl: bool,
+    no_cache: bool,
+    html_parser: str | None,
+    streaming: bool,
+    host_limits: dict[str, HostLimit],
+):
+    """
+    Converts every URL or path listed in INPUT_FILE (one per line, `-` for stdin) and saves them as Markdown.
+    """
+    verify_ssl = not no_verify_ssl
+    _size_connection_pool(workers)
+    configure_rate_limits(host_limits)
+    succeeded = failed = 0
+    for result in convert_batch(
+        iter_urls(input_file),
+        save_path=save,
+        workers=workers,
+        reporter=stderr_reporter,
+        verify_ssl=verify_ssl,
+        use_cache=not no_cache,
+        html_parser=html_parser,
+        streaming=streaming,
+    ):
+        if result.ok:
+            succeeded += 1
+            click.echo(f"OK\t{result.url}\t{result.save_path}\t{result.elapsed:.2f}s", err=True)
+        else:
+            failed += 1
+            stderr(f"FAILED\t{result.url}\t{result.error}")
+    stderr_reporter(f"Done: {succeeded} succeeded, {failed} failed.")
+    if failed:
+        sys.exit(1)
+
+
+@cli.command(name="serve")
+@click.option("--host", default=server.DEFAULT_HOST, show_default=True, help="Interface to bind to.")
+@click.option("--port", default=server.DEFAULT_PORT, show_default=True, type=click.IntRange(0, 65535))
+@click.option(
+    "--host-limit",
+    "host_limits",
+    multiple=True,
+    callback=lambda ctx, param, values: _parse_host_limits(values),
+    metavar="DOMAIN=RATE[,BURST[,MAX_IN_FLIGHT]]",
+    help="Per-domain request rate (per second), burst and concurrency. Repeatable.",
+)
+@click.option(
+    "-j",
+    "--workers",
+    help="Number of articles converted concurrently.",
+    type=click.IntRange(min=1),
+    default=server.DEFAULT_WORKERS,
+    show_default=True,
+)
+@click.option(
+    "--no-verify-ssl", is_flag=True, default=False, help="Disable SSL certificate verification (not recommended)."
+)
+@click.option("--no-cache", is_flag=True, default=False, help="Bypass the local cache.")
+@click.option("--parser", "html_parser", type=click.Choice([AUTO, *PARSER_BACKENDS]), default=None, help="HTML parser.")
+def serve(
+    host: str,
+    port: int,
+    workers: int,
+    no_verify_ssl: bool,
+    no_cache: bool,
+    html_parser: str | None,
+    host_limits: dict[str, HostLimit],
+):
+    """
+    Runs a local HTTP service: POST {"url": ...} or {"html": ...} as JSON to /convert.
+    """
+    _size_connection_pool(workers)
+    configure_rate_limits(host_limits)
+    server.serve(
+        host=host,
+        port=port,
+        workers=workers,
+        verify_ssl=not no_verify_ssl,
+        reporter=stderr_reporter,
+        use_cache=not no_cache,
+        html_parser=html_parser,
+    )
+
+
+@cli.command(name="routes")
+@click.argument("url", required=False)
+def routes(url: str | None):
+    """
+    Lists the reader routing table, or shows which reader handles URL.
+    """
+    if url:
+        try:
+            click.echo(type(ReaderFactory.create(url)).__name__)
+        except Exception as e:
+            stderr(f"Error: {str(e)}")
+            sys.exit(1)
+        return
+    for pattern, reader_cls in ReaderFactory.routing_table():
+        click.echo(f"{pattern}\t{reader_cls.__name__}")
+
+
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,347 @@
+import json
+import re
+from collections import Counter
+from functools import lru_cache
+from pathlib import PurePosixPath
+
+# 只检查代码块开头的这么多字符，超长的代码块（压缩后的 js、日志等）不会拖慢转换
+DETECT_LIMIT = 4096
+
+# 得分低于该值，或与第二名差距不够大时认为无法判断，返回空字符串
+_MIN_SCORE = 6
+_MIN_RATIO = 1.5
+_STRONG_WEIGHT = 2
+
+# 同一个词出现多次最多按这么多次计分，避免一个词主导结果
+_MAX_COUNT = 3
+
+EXTENSIONS: dict[str, str] = {
+    ".py": "python",
+    ".pyi": "python",
+    ".ipynb": "json",
+    ".js": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".jsx": "jsx",
+    ".ts": "typescript",
+    ".tsx": "tsx",
+    ".java": "java",
+    ".kt": "kotlin",
+    ".kts": "kotlin",
+    ".scala": "scala",
+    ".groovy": "groovy",
+    ".go": "go",
+    ".rs": "rust",
+    ".c": "c",
+    ".h": "c",
+    ".cc": "cpp",
+    ".cpp": "cpp",
+    ".cxx": "cpp",
+    ".hpp": "cpp",
+    ".cs": "csharp",
+    ".swift": "swift",
+    ".m": "objectivec",
+    ".rb": "ruby",
+    ".php": "php",
+    ".pl": "perl",
+    ".lua": "lua",
+    ".r": "r",
+    ".dart": "dart",
+    ".ex": "elixir",
+    ".exs": "elixir",
+    ".erl": "erlang",
+    ".hs": "haskell",
+    ".clj": "clojure",
+    ".sh": "bash",
+    ".bash": "bash",
+    ".zsh": "zsh",
+    ".ps1": "powershell",
+    ".bat": "batch",
+    ".sql": "sql",
+    ".html": "html",
+    ".htm": "html",
+    ".xml": "xml",
+    ".vue": "vue",
+    ".css": "css",
+    ".scss": "scss",
+    ".less": "less",
+    ".json": "json",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".toml": "toml",
+    ".ini": "ini",
+    ".md": "markdown",
+    ".tex": "latex",
+    ".diff": "diff",
+    ".patch": "diff",
+    ".proto": "protobuf",
+    ".graphql": "graphql",
+    ".tf": "hcl",
+}
+
+FILE_NAMES: dict[str, str] = {
+    "dockerfile": "dockerfile",
+    "makefile": "makefile",
+    "cmakelists.txt": "cmake",
+    "gemfile": "ruby",
+    "rakefile": "ruby",
+}
+
+# 关键词索引：语言 -> {权重: 以空格分隔的词}。只收录在其他语言中少见的词，常见词（if、for、return）
+# 以及与英文常用词相同的词（and、or、in、with）不计分
+KEYWORDS: dict[str, dict[int, str]] = {
+    "python": {
+        4: "__init__ __name__",
+        3: "def elif except nonlocal isinstance",
+        2: "self None lambda print range len pass raise",
+        1: "True False import from yield async await dict list np pd",
+    },
+    "javascript": {
+        4: "console.log module.exports",
+        3: "=== !== document window undefined",
+        2: "function const let var => require Promise JSON",
+        1: "null async await this new export default",
+    },
+    "typescript": {
+        4: "keyof",
+        3: "interface readonly number boolean",
+        2: "namespace string any unknown never",
+        1: "type implements enum const let => export import undefined",
+    },
+    "java": {
+        5: "System.out @Override",
+        4: "throws",
+        3: "ArrayList",
+        2: "public implements final String package",
+        1: "private protected static void class extends import new boolean int List",
+    },
+    "kotlin": {
+        5: "lateinit mutableListOf",
+        4: "fun companion suspend listOf",
+        3: "val",
+        2: "override when println",
+        1: "var object data it",
+    },
+    "go": {
+        5: "fmt.Println fmt.Printf fmt.Sprintf",
+        4: "defer",
+        3: "func := chan nil",
+        2: "package err make",
+        1: "go struct interface string int range map var type import",
+    },
+    "rust": {
+        4: "fn mut impl crate unwrap usize",
+        3: "pub Vec trait &mut",
+        2: "mod Some Ok Err Option Result println",
+        1: "let struct enum match use None :: -> self",
+    },
+    "c": {
+        4: "#include malloc",
+        3: "printf sizeof typedef NULL",
+        2: "char free unsigned",
+        1: "int void struct return static const",
+    },
+    "cpp": {
+        5: "nullptr",
+        4: "std cout endl typename",
+        3: "#include cin template virtual vector",
+        2: ":: namespace auto",
+        1: "class public int void const",
+    },
+    "csharp": {
+        6: "Console.WriteLine",
+        3: "using Task",
+        2: "namespace",
+        1: "public private static void class string var async await get set override readonly new int",
+    },
+    "swift": {
+        5: "@State SwiftUI UIKit",
+        4: "guard",
+        3: "extension protocol Foundation",
+        2: "func some View init",
+        1: "let var import struct self nil print override",
+    },
+    "ruby": {
+        5: "attr_accessor elsif",
+        4: "puts",
+        3: "end unless",
+        2: "def require module each",
+        1: "do nil self class",
+    },
+    "php": {
+        10: "<?php",
+        5: "$this",
+        2: "array foreach",
+        1: "echo function public namespace use -> =>",
+    },
+    "bash": {
+        5: "esac",
+        4: "fi sudo brew chmod $HOME $PATH wget",
+        3: "mkdir curl apt pip npm npx $1 kubectl yarn pnpm",
+        2: "echo then done export cd grep git docker rm ls source uv",
+        1: "do install cat",
+    },
+    "sql": {
+        5: "VARCHAR",
+        4: "SELECT INSERT",
+        3: "WHERE INTO UPDATE TABLE JOIN VALUES PRIMARY",
+        2: "FROM DELETE CREATE GROUP ORDER BY KEY INDEX select LIMIT COUNT",
+        1: "AND NOT NULL where AS ON",
+    },
+    "html": {
+        8: "<!DOCTYPE",
+        6: "<html",
+        5: "<head <body <meta",
+        4: "<script <link",
+        3: "<div <span </div>",
+        2: "<a <p href",
+        1: "class src",
+    },
+    "css": {
+        5: "!important @media",
+        3: "margin padding display",
+        2: "color font background px border flex rem",
+        1: "width height em",
+    },
+    "yaml": {
+        6: "apiVersion",
+        3: "kind metadata spec uses jobs",
+        2: "steps runs services",
+        1: "name image version env on",
+    },
+    "dockerfile": {
+        6: "WORKDIR ENTRYPOINT EXPOSE",
+        4: "RUN COPY CMD",
+        3: "ENV ARG",
+        2: "FROM ADD",
+    },
+}
+
+# 结构特征：在行首或与标点配合出现的写法，每条按出现与否计一次分。
+# 只对关键词已经得分的语言检查，因此特征不能单独让一种语言胜出
+FEATURES: dict[str, tuple[tuple[str, int], ...]] = {
+    "python": (
+        (r"^[ \t]*def \w+\(.*\)( -> .+)?:[ \t]*$", 6),
+        (r"^[ \t]*(?:from [\w.]+ )?import [\w.]+", 2),
+        (r"^[ \t]*(?:if|elif|for|while|with|try|else|class .+)\b.*:[ \t]*$", 2),
+        (r"^>>> ", 6),
+    ),
+    "javascript": (
+        (r"console\.\w+\(", 3),
+        (r"^[ \t]*(?:const|let) \w+ = require\(", 6),
+        (r"\)\s*=>\s*\{", 2),
+        (r"function\s*\w*\([^)]*\)\s*\{", 3),
+    ),
+    "typescript": (
+        (r"^[ \t]*(?:export )?(?:interface|type) \w+(?:<[^>]*>)? (?:=|\{)", 5),
+        (r"\(\s*\w+\??:\s*\w+(?:\[\])?\s*[,)]", 4),
+        (r"\): \w+(?:<[^>]*>)?(?:\[\])? \{", 4),
+    ),
+    "java": (
+        (r"^[ \t]*public (?:static )?(?:final )?(?:class|void|[A-Z]\w*) \w+", 4),
+        (r"^[ \t]*import (?:static )?[a-z]\w*(?:\.\w+)+;", 5),
+    ),
+    "kotlin": ((r"^[ \t]*(?:private |override |suspend )*fun \w+\(", 5),),
+    "go": ((r"^package \w+[ \t]*$", 5), (r"^func (?:\([^)]*\) )?\w+\(", 6), (r"if err != nil\b", 8)),
+    "rust": ((r"^[ \t]*(?:pub )?fn \w+(?:<[^>]*>)?\(", 6), (r"let mut \w+", 5)),
+    "c": ((r"^#include <\w+\.h>", 6), (r"^int main\(", 4)),
+    "cpp": ((r"^#include <\w+>", 6), (r"std::\w+", 5)),
+    "csharp": ((r"^using System(?:\.\w+)*;", 8), (r"\{ get; (?:private )?set; \}", 8)),
+    "ruby": ((r"^[ \t]*def \w+[?!]?(?:\(.*\))?[ \t]*$", 3), (r"^[ \t]*end[ \t]*$", 3), (r"do \|\w+\|", 6)),
+    "php": ((r"\$\w+\s*=", 3),),
+    "bash": (
+        (r"^[ \t]*\$ \w", 5),
+        (r"^#!/(?:usr/)?bin/(?:env )?(?:ba|z)?sh", 10),
+        (r" --?[a-z][\w-]*", 2),
+        (r"^[ \t]*(?:if|while) \[\[? ", 6),
+        (r"^[ \t]*(?:sudo|docker|git|npm|pip|curl|brew|kubectl|cd|mkdir) ", 4),
+    ),
+    "sql": ((r"(?i)^[ \t]*select\b.+\bfrom\b", 6), (r"(?i)^[ \t]*create table\b", 8), (r"(?i)^[ \t]*insert into\b", 8)),
+    "html": ((r"^[ \t]*<(?:!--|[a-z][\w-]*(?:\s[^>]*)?>)", 3), (r"</[a-z][\w-]*>", 2)),
+    "css": ((r"^[ \t]*[.#]?[\w-]+(?:[ .#:>][\w-]+)*\s*\{[ \t]*$", 4), (r"^[ \t]*[a-z-]+: [^;]+;[ \t]*$", 5)),
+    "yaml": ((r"^[ \t]*[\w-]+:(?: [^{;]*)?$", 2), (r"^[ \t]*- [\w-]+:", 4), (r"^---[ \t]*$", 3)),
+    "dockerfile": ((r"^FROM [\w./-]+(?::[\w.-]+)?(?: AS \w+)?[ \t]*$", 8),),
+}
+
+_TOKEN_RE = re.compile(
+    r"<\?php|<!DOCTYPE|<[a-z]+|</[a-z]+>|#include|![a-z]+|[$@&]?[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_]\w*)?|\$\d"
+    r"|===|!==|:=|=>|->|::"
+)
+
+
+def _build_index() -> tuple[tuple[str, ...], dict[str, tuple[tuple[int, int], ...]]]:
+    """
+    把 KEYWORDS 倒排成 词 -> ((语言序号, 权重), ...)，计分时每个词只查一次字典。
+    """
+    languages = tuple(KEYWORDS)
+    index: dict[str, list[tuple[int, int]]] = {}
+    for i, language in enumerate(languages):
+        for weight, words in KEYWORDS[language].items():
+            for word in words.split():
+                index.setdefault(word, []).append((i, weight))
+    return languages, {word: tuple(entries) for word, entries in index.items()}
+
+
+_LANGUAGES, _INDEX = _build_index()
+_FEATURES = tuple(
+    (_LANGUAGES.index(language), re.compile(pattern, re.MULTILINE), weight)
+    for language, features in FEATURES.items()
+    for pattern, weight in features
+)
+
+
+def language_from_file_name(file_name: str) -> str:
+    path = PurePosixPath(file_name.lower())
+    return FILE_NAMES.get(path.name) or EXTENSIONS.get(path.suffix, "")
+
+
+def detect_language(file_name: str | None, code: str) -> str:
+    """
+    先按文件名（扩展名）判断，否则根据代码开头 DETECT_LIMIT 个字符中的关键词和结构特征打分。
+    无法判断时返回空字符串。
+    """
+    if file_name:
+        language = language_from_file_name(file_name)
+        if language:
+            return language
+    return _detect_code(code[:DETECT_LIMIT])
+
+
+# 文档站点中同一段代码（安装命令、配置片段）常重复出现，按截断后的代码缓存结果
+@lru_cache(maxsize=2048)
+def _detect_code(code: str) -> str:
+    text = code.strip()
+    if not text:
+        return ""
+    if text.startswith("#!"):
+        shebang = text.partition("\n")[0]
+        for name, language in (("python", "python"), ("node", "javascript"), ("ruby", "ruby"), ("sh", "bash")):
+            if name in shebang:
+                return language
+    if text[0] in "[{" and text[-1] in "]}" and len(code) < DETECT_LIMIT:
+        try:
+            json.loads(text)
+            return "json"
+        except ValueError:
+            pass
+
+    scores = [0] * len(_LANGUAGES)
+    # 至少命中一个权重不低于 _STRONG_WEIGHT 的词或一条结构特征，只靠弱关键词累积的分数不足以判断
+    strong = [False] * len(_LANGUAGES)
+    for word, count in Counter(_TOKEN_RE.findall(text)).items():
+        entries = _INDEX.get(word)
+        if entries:
+            count = min(count, _MAX_COUNT)
+            for i, weight in entries:
+                scores[i] += weight * count
+                strong[i] = strong[i] or weight >= _STRONG_WEIGHT
+    for i, pattern, weight in _FEATURES:
+        if scores[i] and pattern.search(text):
+            scores[i] += weight
+            strong[i] = True
+
+    ranked = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+    best, second = scores[ranked[0]], scores[ranked[1]]
+    if best < _MIN_SCORE or best < second * _MIN_RATIO or not strong[ranked[0]]:
+        return ""
+    return _LANGUAGES[ranked[0]]
@@ -0,0 +1,106 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+
+
+class DiskCache:
+    """
+    磁盘缓存的公共部分：每个条目由若干同名（key）文件组成，其中 `<key>.json` 保存元数据。
+
+    元数据文件的修改时间记录条目的最近访问时间；总大小超过 max_size 时按 LRU 淘汰，
+    最近访问时间早于 max_age 秒的条目同时被删除。
+    """
+
+    def __init__(self, path: Path, max_size: int, max_age: float):
+        self.path = path
+        self.max_size = max_size
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._total_size: int | None = None
+
+    def clear(self):
+        with self._lock:
+            for file in self._files():
+                file.unlink(missing_ok=True)
+            self._total_size = 0
+
+    def _load_meta(self, key: str) -> dict[str, Any] | None:
+        meta_path = self.path / f"{key}.json"
+        try:
+            with open(meta_path, encoding="utf8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - meta.get("stored_at", 0) > self.max_age:
+            self._remove(key)
+            return None
+        with suppress(OSError):
+            os.utime(meta_path)
+        return meta
+
+    def _write(self, key: str, files: dict[str, bytes]):
+        """写入一个条目，files 的键为文件后缀，`.json` 应最后写入。"""
+        self.path.mkdir(parents=True, exist_ok=True)
+        for suffix, data in files.items():
+            _atomic_write(self.path / f"{key}{suffix}", data)
+        with self._lock:
+            if self._total_size is None:
+                self._total_size = sum(p.stat().st_size for p in self._files())
+            else:
+                self._total_size += sum(len(data) for data in files.values())
+            if self._total_size > self.max_size:
+                self._evict()
+
+    def _files(self) -> list[Path]:
+        if not self.path.is_dir():
+            return []
+        return [p for p in self.path.iterdir() if not p.name.startswith(".tmp-")]
+
+    def _evict(self):
+        now = time.time()
+        sizes: dict[str, int] = {}
+        for file in self._files():
+            with suppress(OSError):
+                sizes[file.stem] = sizes.get(file.stem, 0) + file.stat().st_size
+        entries = []
+        for key, size in sizes.items():
+            try:
+                accessed = (self.path / f"{key}.json").stat().st_mtime
+            except OSError:
+                self._remove(key)
+                continue
+            if now - accessed > self.max_age:
+                self._remove(key)
+                continue
+            entries.append((accessed, key, size))
+        entries.sort()
+        total = sum(size for _, _, size in entries)
+        # 淘汰到上限的 90%，避免每次写入都触发一次完整扫描
+        target = self.max_size * 0.9
+        for _, key, size in entries:
+            if total <= target:
+                break
+            self._remove(key)
+            total -= size
+        self._total_size = total
+
+    def _remove(self, key: str):
+        for file in self.path.glob(f"{key}.*"):
+            file.unlink(missing_ok=True)
+
+
+def _atomic_write(path: Path, data: bytes):
+    # 先写入临时文件再替换，避免并发读取到写了一半的文件
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
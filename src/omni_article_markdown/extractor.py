@@ -1,43 +1,60 @@
 import re
-from abc import ABC, abstractmethod
-from collections.abc import Callable
+from functools import cache
 from typing import final, override
 
 from bs4 import BeautifulSoup
-from bs4.element import Comment, Tag
+from bs4.element import Tag
 
 from .article import Article
-from .plugins import load_plugins
+from .cleaning import CleanCondition, CleanRule, CleanRuleSet
+from .html_parser import make_soup, resolve_parser, strip_raw_text
+from .page_meta import MetaDispatcher, MetaRule, PageMeta
+from .plugins import plugin_classes
+from .postprocess import POST_RULES, PostRule, PostRuleSet
 from .utils import filter_tag, get_attr_text, get_canonical_url, get_og_description, get_og_title, get_og_url, get_title
 
-type TagPredicate = Callable[[Tag], bool]
+DISPLAY_NONE_PATTERN = re.compile(r"display\s*:\s*none", re.IGNORECASE)
 
-TAGS_TO_CLEAN: list[TagPredicate] = [
-    lambda el: el.name in ("style", "link", "button", "footer", "header"),
-    lambda el: el.name == "script" and "src" not in el.attrs,
-    lambda el: (
-        el.name == "script"
-        and el.has_attr("src")
-        and not get_attr_text(el.attrs["src"]).startswith("https://gist.github.com")
+TAGS_TO_CLEAN: list[CleanCondition] = [
+    CleanRule(tags=("style", "link", "button", "footer", "header")),
+    # 保留 gist 脚本，由 Parser 展开为代码块
+    CleanRule(
+        tags=("script",), when=lambda el: not get_attr_text(el.attrs.get("src")).startswith("https://gist.github.com")
     ),
 ]
 
-ATTRS_TO_CLEAN: list[TagPredicate] = [
-    lambda el: (
-        "style" in el.attrs
-        and re.search(r"display\s*:\s*none", get_attr_text(el.attrs.get("style")), re.IGNORECASE) is not None
-    ),
-    lambda el: "hidden" in el.attrs,
-    lambda el: "class" in el.attrs and "katex-html" in el.attrs["class"],  # katex
-    lambda el: "aria-hidden" in el.attrs and "true" in el.attrs["aria-hidden"],
+ATTRS_TO_CLEAN: list[CleanCondition] = [
+    CleanRule(attr="style", when=lambda el: DISPLAY_NONE_PATTERN.search(get_attr_text(el.attrs["style"])) is not None),
+    CleanRule(attr="hidden"),
+    CleanRule(class_="katex-html"),  # katex
+    CleanRule(attr="aria-hidden", contains="true"),
 ]
-
 ARTICLE_CONTAINERS = [("article", None), ("main", None), ("body", None)]
 
 
-class Extractor(ABC):
-    def __init__(self, soup: BeautifulSoup):
+class Extractor:
+    # 提取逻辑发生变化时递增，使结果缓存中由该提取器生成的条目失效
+    VERSION = 1
+    # 匹配优先级，数值越大越先尝试
+    PRIORITY = 0
+    # 基于页面元数据的声明式匹配规则，任意一条满足即视为匹配
+    MATCH: tuple[MetaRule, ...] = ()
+    # 依赖特定解析器的建树行为时指定，如 "html5lib"；为 None 时使用调用方选择的解析器
+    PARSER: str | None = None
+    # 提取时需要读取内联脚本的内容（如页面内嵌的 JSON 数据）
+    KEEP_SCRIPTS = False
+    # 覆盖了 can_handle() 并依赖正文判断时声明：原始 HTML 中必须全部出现的字符串，供两段式解析预筛选
+    RAW_HINTS: tuple[str, ...] = ()
+
+    def __init__(self, soup: BeautifulSoup, meta: PageMeta | None = None):
         self.soup = soup
+        self._meta = meta
+
+    @property
+    def meta(self) -> PageMeta:
+        if self._meta is None:
+            self._meta = PageMeta.from_soup(self.soup)
+        return self._meta
 
     @final
     def extract(self) -> Article | None:
@@ -54,16 +71,7 @@ class Extractor(ABC):
             if article_tag:
                 title = self.extract_title()
                 description = self.extract_description()
-                for el in article_tag.find_all():
-                    tag = filter_tag(el)
-                    if tag:
-                        if any(cond(tag) for cond in self.get_tags_to_clean()):
-                            tag.decompose()
-                            continue
-                        if tag.attrs and any(cond(tag) for cond in self.get_attrs_to_clean()):
-                            tag.decompose()
-                for comment in article_tag.find_all(string=lambda text: isinstance(text, Comment)):
-                    comment.extract()
+                self.clean_rules().prune(article_tag)
                 self.extract_img(article_tag)
                 url = self.extract_url()
                 article = Article(title=title, url=url, description=description, body=article_tag)
@@ -71,15 +79,33 @@ class Extractor(ABC):
                 return article
         return None
 
-    @abstractmethod
-    def can_handle(self) -> bool: ...
+    def can_handle(self) -> bool:
+        """
+        默认根据 MATCH 判断。声明了 MATCH 又覆盖此方法时，MATCH 作为预筛选条件，只有满足规则的页面才会调用此方法。
+        """
+        return any(rule.matches(self.meta) for rule in self.MATCH)
 
-    def get_tags_to_clean(self) -> list[Callable[[Tag], bool]]:
+    def get_tags_to_clean(self) -> list[CleanCondition]:
         return list(TAGS_TO_CLEAN)
 
-    def get_attrs_to_clean(self) -> list[Callable[[Tag], bool]]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return list(ATTRS_TO_CLEAN)
 
+    def clean_rules(self) -> CleanRuleSet:
+        """
+        get_tags_to_clean() 与 get_attrs_to_clean() 编译后的规则索引，按提取器类缓存。
+        """
+        return _compile_clean_rules(type(self), self)
+
+    def get_post_rules(self) -> list[PostRule]:
+        return list(POST_RULES)
+
+    def post_rules(self) -> PostRuleSet:
+        """
+        get_post_rules() 编译后的后处理规则，按提取器类缓存。
+        """
+        return _compile_post_rules(type(self), self)
+
     def article_container(self) -> tuple | list[tuple]:
         return ARTICLE_CONTAINERS
 
@@ -121,10 +147,66 @@ class Extractor(ABC):
 class ExtractorFactory:
     @staticmethod
     def create(soup: BeautifulSoup) -> Extractor:
-        for extract in _load_extractors(soup):
+        meta = PageMeta.from_soup(soup)
+        matched = _extractor_dispatcher().match(meta)
+        # 按注册表顺序选择第一个匹配的提取器，声明了 MATCH 的提取器由索引结果直接判定
+        for cls in plugin_classes(Extractor, "extractors"):
+            if cls.MATCH:
+                if cls not in matched:
+                    continue
+                if cls.can_handle is Extractor.can_handle:
+                    return cls(soup, meta)
+            extract = cls(soup, meta)
             if extract.can_handle():
                 return extract
-        return DefaultExtractor(soup)
+        return DefaultExtractor(soup, meta)
+
+    @staticmethod
+    def create_from_html(raw_html: str, parser: str | None = None) -> Extractor:
+        """
+        两段式解析：先只解析页面元数据选出提取器，再按该提取器的需要解析整个文档——
+        使用它指定的解析器，并且除非声明了 KEEP_SCRIPTS，否则跳过 script / style 的内容。
+        元数据不足以判定时退回到完整解析后再分发。
+        """
+        parser = resolve_parser(parser)
+        cls = ExtractorFactory.select_from_meta(raw_html)
+        if cls is not None:
+            markup = raw_html if cls.KEEP_SCRIPTS else strip_raw_text(raw_html)
+            extract = cls(make_soup(markup, cls.PARSER or parser))
+            if cls.can_handle is Extractor.can_handle or extract.can_handle():
+                return extract
+        extract = ExtractorFactory.create(make_soup(raw_html, parser))
+        if extract.PARSER and parser != extract.PARSER:
+            # 提取器依赖特定解析器时重新解析
+            extract = type(extract)(make_soup(raw_html, extract.PARSER))
+        return extract
+
+    @staticmethod
+    def select_from_meta(raw_html: str) -> type[Extractor] | None:
+        """
+        只根据元数据选择提取器。未声明 RAW_HINTS 的 can_handle() 只能看到元数据标签；
+        返回的类若覆盖了 can_handle()，仍需在完整文档上确认。
+        这类 can_handle() 在元数据上不成立时无法排除，若此后只剩 DefaultExtractor 则返回 None，由调用方完整解析后再分发。
+        """
+        head = make_soup(PageMeta.meta_markup(raw_html), "html.parser")
+        meta = PageMeta.from_soup(head)
+        matched = _extractor_dispatcher().match(meta)
+        undecided = False
+        for cls in plugin_classes(Extractor, "extractors"):
+            if cls.MATCH and cls not in matched:
+                continue
+            if cls.can_handle is Extractor.can_handle:
+                if cls.MATCH:
+                    return cls
+                continue
+            if cls.RAW_HINTS:
+                if all(hint in raw_html for hint in cls.RAW_HINTS):
+                    return cls
+                continue
+            if cls(head, meta).can_handle():
+                return cls
+            undecided = True
+        return None if undecided else DefaultExtractor
 
 
 class DefaultExtractor(Extractor):
@@ -133,5 +215,32 @@ class DefaultExtractor(Extractor):
         return True
 
 
-def _load_extractors(soup: BeautifulSoup) -> list[Extractor]:
-    return load_plugins(Extractor, "extractors", soup)
+_clean_rules_cache: dict[type[Extractor], CleanRuleSet] = {}
+
+
+def _compile_clean_rules(cls: type[Extractor], extractor: Extractor) -> CleanRuleSet:
+    rules = _clean_rules_cache.get(cls)
+    if rules is None:
+        rules = CleanRuleSet(extractor.get_tags_to_clean() + extractor.get_attrs_to_clean())
+        _clean_rules_cache[cls] = rules
+    return rules
+
+
+_post_rules_cache: dict[type[Extractor], PostRuleSet] = {}
+
+
+def _compile_post_rules(cls: type[Extractor], extractor: Extractor) -> PostRuleSet:
+    rules = _post_rules_cache.get(cls)
+    if rules is None:
+        rules = PostRuleSet(extractor.get_post_rules())
+        _post_rules_cache[cls] = rules
+    return rules
+
+
+@cache
+def _extractor_dispatcher() -> MetaDispatcher[type[Extractor]]:
+    dispatcher: MetaDispatcher[type[Extractor]] = MetaDispatcher()
+    for cls in plugin_classes(Extractor, "extractors"):
+        for rule in cls.MATCH:
+            dispatcher.add(rule, cls)
+    return dispatcher
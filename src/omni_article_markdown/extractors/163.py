@@ -1,7 +1,7 @@
 from typing import override
 
 from ..extractor import Extractor
-from ..utils import is_matched_canonical
+from ..page_meta import MetaRule
 
 
 class Netease163Extractor(Extractor):
@@ -9,9 +9,7 @@ class Netease163Extractor(Extractor):
     163.com
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return is_matched_canonical("https://www.163.com", self.soup)
+    MATCH = (MetaRule("canonical", "prefix", "https://www.163.com"),)
 
     @override
     def article_container(self) -> tuple:
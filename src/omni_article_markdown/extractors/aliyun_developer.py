@@ -1,7 +1,7 @@
 from typing import override
 
 from ..extractor import Extractor
-from ..utils import is_matched_canonical
+from ..page_meta import MetaRule
 
 
 class AliyunDeveloperExtractor(Extractor):
@@ -9,9 +9,7 @@ class AliyunDeveloperExtractor(Extractor):
     developer.aliyun.com
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return is_matched_canonical("https://developer.aliyun.com", self.soup)
+    MATCH = (MetaRule("canonical", "prefix", "https://developer.aliyun.com"),)
 
     @override
     def article_container(self) -> tuple:
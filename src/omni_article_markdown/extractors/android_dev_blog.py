@@ -1,7 +1,7 @@
 from typing import override
 
 from ..extractor import Extractor
-from ..utils import get_og_site_name
+from ..page_meta import MetaRule
 
 
 class AndroidDevelopersBlogExtractor(Extractor):
@@ -9,9 +9,7 @@ class AndroidDevelopersBlogExtractor(Extractor):
     Android Developers Blog
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_site_name(self.soup) == "Android Developers Blog"
+    MATCH = (MetaRule("og:site_name", "eq", "Android Developers Blog"),)
 
     @override
     def article_container(self) -> tuple:
@@ -1,7 +1,7 @@
 from typing import override
 
 from ..extractor import Extractor
-from ..utils import get_title
+from ..page_meta import MetaRule
 
 
 class ClaudeDocExtractor(Extractor):
@@ -9,9 +9,7 @@ class ClaudeDocExtractor(Extractor):
     Anthropic
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_title(self.soup).endswith(" \\ Anthropic")
+    MATCH = (MetaRule("title", "suffix", " \\ Anthropic"),)
 
     @override
     def article_container(self) -> tuple:
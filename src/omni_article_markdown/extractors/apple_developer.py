@@ -1,7 +1,7 @@
 from typing import override
 
-from ..extractor import Extractor, TagPredicate
-from ..utils import get_og_site_name
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
 
 
 class AppleDevelopExtractor(Extractor):
@@ -9,16 +9,14 @@ class AppleDevelopExtractor(Extractor):
     Apple Developer Documentation
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_site_name(self.soup) == "Apple Developer Documentation"
+    MATCH = (MetaRule("og:site_name", "eq", "Apple Developer Documentation"),)
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "class" in el.attrs and "eyebrow" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "platform" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "title" in el.attrs["class"],
+            CleanRule(class_="eyebrow"),
+            CleanRule(class_="platform"),
+            CleanRule(class_="title"),
         ]
 
     @override
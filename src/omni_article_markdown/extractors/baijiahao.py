@@ -1,6 +1,7 @@
 from typing import override
 
 from ..extractor import Extractor
+from ..page_meta import MetaRule
 from ..utils import filter_tag
 
 
@@ -9,6 +10,9 @@ class Netease163Extractor(Extractor):
     百家号
     """
 
+    MATCH = (MetaRule("data-testid", "eq", "article"),)
+    RAW_HINTS = ("bjh-p",)
+
     @override
     def can_handle(self) -> bool:
         tag1 = filter_tag(self.soup.find("div", {"data-testid": "article"}))
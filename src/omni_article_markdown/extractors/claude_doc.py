@@ -1,7 +1,7 @@
 from typing import override
 
-from ..extractor import Extractor, TagPredicate
-from ..utils import get_og_title
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
 
 
 class ClaudeDocExtractor(Extractor):
@@ -9,15 +9,13 @@ class ClaudeDocExtractor(Extractor):
     docs.claude.com
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_title(self.soup).endswith(" - Claude Docs")
+    MATCH = (MetaRule("og:title", "suffix", " - Claude Docs"),)
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "data-component-part" in el.attrs and "code-block-header" in el.attrs["data-component-part"],
-            lambda el: "data-component-part" in el.attrs and "code-group-tab-bar" in el.attrs["data-component-part"],
+            CleanRule(attr="data-component-part", contains="code-block-header"),
+            CleanRule(attr="data-component-part", contains="code-group-tab-bar"),
         ]
 
     @override
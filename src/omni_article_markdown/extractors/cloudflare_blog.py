@@ -1,7 +1,7 @@
 from typing import override
 
 from ..extractor import Extractor
-from ..utils import is_matched_canonical
+from ..page_meta import MetaRule
 
 
 class CloudflareBlogExtractor(Extractor):
@@ -9,9 +9,7 @@ class CloudflareBlogExtractor(Extractor):
     blog.cloudflare.com
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return is_matched_canonical("https://blog.cloudflare.com", self.soup)
+    MATCH = (MetaRule("canonical", "prefix", "https://blog.cloudflare.com"),)
 
     @override
     def article_container(self) -> tuple:
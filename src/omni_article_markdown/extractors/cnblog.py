@@ -1,7 +1,7 @@
 from typing import override
 
-from ..extractor import Extractor, TagPredicate
-from ..utils import is_matched_canonical
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
 
 
 class CnBlogsExtractor(Extractor):
@@ -9,15 +9,13 @@ class CnBlogsExtractor(Extractor):
     博客园
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return is_matched_canonical("https://www.cnblogs.com", self.soup)
+    MATCH = (MetaRule("canonical", "prefix", "https://www.cnblogs.com"),)
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "id" in el.attrs and "blog_post_info_block" in el.attrs["id"],
-            lambda el: "class" in el.attrs and "postDesc" in el.attrs["class"],
+            CleanRule(attr="id", contains="blog_post_info_block"),
+            CleanRule(class_="postDesc"),
         ]
 
     @override
@@ -1,7 +1,8 @@
 from typing import override
 
-from ..extractor import Extractor, TagPredicate
-from ..utils import filter_tag, is_matched_canonical
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
+from ..utils import filter_tag
 
 
 class DropboxTechExtractor(Extractor):
@@ -9,24 +10,22 @@ class DropboxTechExtractor(Extractor):
     dropbox.tech
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return is_matched_canonical("https://dropbox.tech", self.soup)
+    MATCH = (MetaRule("canonical", "prefix", "https://dropbox.tech"),)
 
     @override
     def article_container(self) -> tuple:
         return ("div", {"class": "dr-article-content__content"})
 
     @override
-    def get_tags_to_clean(self) -> list[TagPredicate]:
+    def get_tags_to_clean(self) -> list[CleanCondition]:
         return super().get_tags_to_clean() + [
-            lambda el: el.name == "nav",
+            CleanRule(tags=("nav",)),
         ]
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "id" in el.attrs and "cta" in el.attrs["id"],
+            CleanRule(attr="id", contains="cta"),
         ]
 
     @override
@@ -1,7 +1,8 @@
 import re
 from typing import override
 
-from ..extractor import Extractor, TagPredicate
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
 from ..utils import filter_tag, get_attr_text, get_title
 
 
@@ -10,14 +11,12 @@ class FeishuExtractor(Extractor):
     飞书云文档
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_title(self.soup).endswith(" - 飞书云文档")
+    MATCH = (MetaRule("title", "suffix", " - 飞书云文档"),)
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "data-type" in el.attrs and "print-forbidden-placeholder" in el.attrs["data-type"],
+            CleanRule(attr="data-type", contains="print-forbidden-placeholder"),
         ]
 
     @override
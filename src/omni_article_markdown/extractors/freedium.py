@@ -1,6 +1,7 @@
 from typing import override
 
 from ..extractor import Extractor
+from ..page_meta import MetaRule
 from ..utils import filter_tag
 
 
@@ -9,11 +10,7 @@ class FreediumExtractor(Extractor):
     freedium.cfd
     """
 
-    @override
-    def can_handle(self) -> bool:
-        title_tag = self.soup.title
-        title = title_tag.get_text(strip=True) if title_tag else None
-        return title is not None and title.endswith(" - Freedium")
+    MATCH = (MetaRule("title", "suffix", " - Freedium"),)
 
     @override
     def article_container(self) -> tuple:
@@ -1,7 +1,7 @@
 from typing import override
 
-from ..extractor import Extractor, TagPredicate
-from ..utils import get_og_title
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
 
 
 class GoogleBlogExtractor(Extractor):
@@ -9,21 +9,19 @@ class GoogleBlogExtractor(Extractor):
     developers.googleblog.com
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_title(self.soup).endswith("- Google Developers Blog")
+    MATCH = (MetaRule("og:title", "suffix", "- Google Developers Blog"),)
 
     @override
     def article_container(self) -> tuple:
         return ("div", {"class": "blog-detail-container"})
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "class" in el.attrs and "tags-container" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "summary-container" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "author-container" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "social-container" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "navigation-container" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "related-posts-container" in el.attrs["class"],
+            CleanRule(class_="tags-container"),
+            CleanRule(class_="summary-container"),
+            CleanRule(class_="author-container"),
+            CleanRule(class_="social-container"),
+            CleanRule(class_="navigation-container"),
+            CleanRule(class_="related-posts-container"),
         ]
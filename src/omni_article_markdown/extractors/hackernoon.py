@@ -1,10 +1,10 @@
 import json
 from typing import override
 
-from bs4 import BeautifulSoup
-
 from ..extractor import Article, Extractor
-from ..utils import filter_tag, get_og_title, is_matched_canonical
+from ..html_parser import make_soup, soup_parser
+from ..page_meta import MetaRule
+from ..utils import filter_tag
 
 
 class HackernoonExtractor(Extractor):
@@ -12,11 +12,11 @@ class HackernoonExtractor(Extractor):
     hackernoon.com
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return is_matched_canonical("https://hackernoon.com", self.soup) or get_og_title(self.soup).endswith(
-            " | HackerNoon"
-        )
+    MATCH = (
+        MetaRule("canonical", "prefix", "https://hackernoon.com"),
+        MetaRule("og:title", "suffix", " | HackerNoon"),
+    )
+    KEEP_SCRIPTS = True
 
     @override
     def article_container(self) -> tuple:
@@ -33,6 +33,6 @@ class HackernoonExtractor(Extractor):
             body = data.get("parsed", "")
             if image:
                 body = f'<img src="{image}" />\n{body}'
-            return Article(data.get("title", ""), None, data.get("tldr", ""), BeautifulSoup(body, "html5lib"))
+            return Article(data.get("title", ""), None, data.get("tldr", ""), make_soup(body, soup_parser(self.soup)))
 
         return None
@@ -8,9 +8,7 @@ class HugoExtractor(Extractor):
     Hugo博客
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return False
+    # 未声明 MATCH，不参与自动匹配
 
     @override
     def article_container(self) -> tuple:
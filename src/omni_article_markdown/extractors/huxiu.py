@@ -1,15 +1,13 @@
 from typing import override
 
 from ..extractor import Extractor
-from ..utils import get_og_site_name
+from ..page_meta import MetaRule
 
 
 class HuxiuExtractor(Extractor):
     """虎嗅网"""
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_site_name(self.soup) == "虎嗅网"
+    MATCH = (MetaRule("og:site_name", "eq", "虎嗅网"),)
 
     @override
     def extract_title(self) -> str:
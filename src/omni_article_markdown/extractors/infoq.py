@@ -1,7 +1,7 @@
 from typing import override
 
-from ..extractor import Extractor, TagPredicate
-from ..utils import is_matched_canonical
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
 
 
 class InfoQExtractor(Extractor):
@@ -9,14 +9,12 @@ class InfoQExtractor(Extractor):
     www.infoq.com
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return is_matched_canonical("https://www.infoq.com", self.soup)
+    MATCH = (MetaRule("canonical", "prefix", "https://www.infoq.com"),)
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "class" in el.attrs and "author-section-full" in el.attrs["class"],
+            CleanRule(class_="author-section-full"),
         ]
 
     @override
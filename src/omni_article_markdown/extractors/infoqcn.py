@@ -1,7 +1,7 @@
 from typing import override
 
 from ..extractor import Extractor
-from ..utils import is_matched_canonical
+from ..page_meta import MetaRule
 
 
 class InfoQCNExtractor(Extractor):
@@ -9,9 +9,7 @@ class InfoQCNExtractor(Extractor):
     www.infoq.cn
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return is_matched_canonical("https://www.infoq.cn", self.soup)
+    MATCH = (MetaRule("canonical", "prefix", "https://www.infoq.cn"),)
 
     @override
     def article_container(self) -> tuple:
@@ -1,7 +1,7 @@
 from typing import override
 
-from ..extractor import Extractor, TagPredicate
-from ..utils import get_og_site_name
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
 
 
 class JetbrainsBlogExtractor(Extractor):
@@ -9,18 +9,16 @@ class JetbrainsBlogExtractor(Extractor):
     blog.jetbrains.com
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_site_name(self.soup) == "The JetBrains Blog"
+    MATCH = (MetaRule("og:site_name", "eq", "The JetBrains Blog"),)
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "class" in el.attrs and "content__row" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "content__pagination" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "content__form" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "tag" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "author-post" in el.attrs["class"],
+            CleanRule(class_="content__row"),
+            CleanRule(class_="content__pagination"),
+            CleanRule(class_="content__form"),
+            CleanRule(class_="tag"),
+            CleanRule(class_="author-post"),
         ]
 
     @override
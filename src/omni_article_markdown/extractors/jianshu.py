@@ -3,7 +3,8 @@ from typing import override
 from bs4.element import Tag
 
 from ..extractor import Extractor
-from ..utils import filter_tag, get_attr_text, get_og_site_name
+from ..page_meta import MetaRule
+from ..utils import filter_tag, get_attr_text
 
 
 class JianshuExtractor(Extractor):
@@ -11,9 +12,7 @@ class JianshuExtractor(Extractor):
     www.jianshu.com
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_site_name(self.soup) == "简书"
+    MATCH = (MetaRule("og:site_name", "eq", "简书"),)
 
     @override
     def extract_description(self) -> str:
@@ -1,7 +1,8 @@
 from typing import override
 
 from ..extractor import Extractor
-from ..utils import filter_tag, is_matched_canonical
+from ..page_meta import MetaRule
+from ..utils import filter_tag
 
 
 class JuejinExtractor(Extractor):
@@ -9,9 +10,7 @@ class JuejinExtractor(Extractor):
     juejin.cn
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return is_matched_canonical("https://juejin.cn/", self.soup)
+    MATCH = (MetaRule("canonical", "prefix", "https://juejin.cn/"),)
 
     @override
     def article_container(self) -> tuple:
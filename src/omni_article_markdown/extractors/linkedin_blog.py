@@ -2,8 +2,9 @@ from typing import override
 
 from bs4.element import Tag
 
-from ..extractor import Extractor, TagPredicate
-from ..utils import filter_tag, get_attr_text, get_og_url
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
+from ..utils import filter_tag, get_attr_text
 
 
 class LinkedInBlogExtractor(Extractor):
@@ -11,15 +12,13 @@ class LinkedInBlogExtractor(Extractor):
     www.linkedin.com
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_url(self.soup).startswith("https://www.linkedin.com/blog/")
+    MATCH = (MetaRule("og:url", "prefix", "https://www.linkedin.com/blog/"),)
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "data-component-type" in el.attrs and "articleHeadline" in el.attrs["data-component-type"],
-            lambda el: "data-component-type" in el.attrs and "postList" in el.attrs["data-component-type"],
+            CleanRule(attr="data-component-type", contains="articleHeadline"),
+            CleanRule(attr="data-component-type", contains="postList"),
         ]
 
     @override
@@ -1,7 +1,7 @@
 from typing import override
 
-from ..extractor import Extractor, TagPredicate
-from ..utils import get_og_site_name
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
 
 
 class MediumExtractor(Extractor):
@@ -9,15 +9,13 @@ class MediumExtractor(Extractor):
     Medium
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_site_name(self.soup) == "Medium"
+    MATCH = (MetaRule("og:site_name", "eq", "Medium"),)
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "data-testid" in el.attrs,
-            lambda el: "class" in el.attrs and "speechify-ignore" in el.attrs["class"],
+            CleanRule(attr="data-testid"),
+            CleanRule(class_="speechify-ignore"),
         ]
 
     @override
@@ -1,7 +1,7 @@
 from typing import override
 
-from ..extractor import Extractor, TagPredicate
-from ..utils import get_og_url
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
 
 
 class MicrosoftLearnExtractor(Extractor):
@@ -9,16 +9,14 @@ class MicrosoftLearnExtractor(Extractor):
     微软技术文档
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_url(self.soup).startswith("https://learn.microsoft.com")
+    MATCH = (MetaRule("og:url", "prefix", "https://learn.microsoft.com"),)
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "id" in el.attrs and "article-header" in el.attrs["id"],
-            lambda el: "id" in el.attrs and "article-metadata" in el.attrs["id"],
-            lambda el: "id" in el.attrs and "site-user-feedback-footer" in el.attrs["id"],
+            CleanRule(attr="id", contains="article-header"),
+            CleanRule(attr="id", contains="article-metadata"),
+            CleanRule(attr="id", contains="site-user-feedback-footer"),
         ]
 
     @override
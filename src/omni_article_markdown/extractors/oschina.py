@@ -1,6 +1,7 @@
 from typing import override
 
 from ..extractor import Extractor
+from ..page_meta import MetaRule
 
 
 class OsChinaExtractor(Extractor):
@@ -8,11 +9,7 @@ class OsChinaExtractor(Extractor):
     开源中国
     """
 
-    @override
-    def can_handle(self) -> bool:
-        title_tag = self.soup.title
-        title = title_tag.get_text(strip=True) if title_tag else None
-        return title is not None and title.endswith(" - OSCHINA - 中文开源技术交流社区")
+    MATCH = (MetaRule("title", "suffix", " - OSCHINA - 中文开源技术交流社区"),)
 
     @override
     def article_container(self) -> tuple:
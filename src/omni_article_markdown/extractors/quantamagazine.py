@@ -1,7 +1,7 @@
 from typing import override
 
-from ..extractor import Extractor, TagPredicate
-from ..utils import get_og_site_name
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
 
 
 class QuantamagazineExtractor(Extractor):
@@ -9,14 +9,12 @@ class QuantamagazineExtractor(Extractor):
     quantamagazine.org
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_site_name(self.soup) == "Quanta Magazine"
+    MATCH = (MetaRule("og:site_name", "eq", "Quanta Magazine"),)
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "class" in el.attrs and "post__title__title" in el.attrs["class"],
+            CleanRule(class_="post__title__title"),
         ]
 
     @override
@@ -1,7 +1,7 @@
 from typing import override
 
-from ..extractor import Extractor, TagPredicate
-from ..utils import is_matched_canonical
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
 
 
 class SnowflakeBlogExtractor(Extractor):
@@ -9,14 +9,12 @@ class SnowflakeBlogExtractor(Extractor):
     Snowflake 技术博客
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return is_matched_canonical("https://www.snowflake.com/en/blog/", self.soup)
+    MATCH = (MetaRule("canonical", "prefix", "https://www.snowflake.com/en/blog/"),)
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "class" in el.attrs and "snowflake-header-container" in el.attrs["class"],
+            CleanRule(class_="snowflake-header-container"),
         ]
 
     @override
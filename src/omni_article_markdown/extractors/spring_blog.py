@@ -1,7 +1,7 @@
 from typing import override
 
 from ..extractor import Extractor
-from ..utils import get_og_url
+from ..page_meta import MetaRule
 
 
 class SpringBlogExtractor(Extractor):
@@ -9,9 +9,7 @@ class SpringBlogExtractor(Extractor):
     spring.io/blog
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_url(self.soup).startswith("https://spring.io/blog/")
+    MATCH = (MetaRule("og:url", "prefix", "https://spring.io/blog/"),)
 
     @override
     def article_container(self) -> tuple:
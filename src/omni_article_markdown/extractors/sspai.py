@@ -1,7 +1,7 @@
 from typing import override
 
-from ..extractor import Extractor, TagPredicate
-from ..utils import get_og_site_name
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
 
 
 class SspaiExtractor(Extractor):
@@ -9,15 +9,13 @@ class SspaiExtractor(Extractor):
     少数派
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_site_name(self.soup) == "少数派 - 高品质数字消费指南"
+    MATCH = (MetaRule("og:site_name", "eq", "少数派 - 高品质数字消费指南"),)
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "class" in el.attrs and "comment__list" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "comment__footer__wrapper" in el.attrs["class"],
+            CleanRule(class_="comment__list"),
+            CleanRule(class_="comment__footer__wrapper"),
         ]
 
     @override
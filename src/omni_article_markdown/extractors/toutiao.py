@@ -3,6 +3,7 @@ from typing import override
 from bs4.element import Tag
 
 from ..extractor import Extractor
+from ..page_meta import MetaRule
 from ..utils import filter_tag, get_attr_text
 
 
@@ -11,11 +12,7 @@ class ToutiaoExtractor(Extractor):
     今日头条
     """
 
-    @override
-    def can_handle(self) -> bool:
-        title_tag = self.soup.title
-        title = title_tag.get_text(strip=True) if title_tag else None
-        return title is not None and title.endswith(" - 今日头条")
+    MATCH = (MetaRule("title", "suffix", " - 今日头条"),)
 
     @override
     def article_container(self) -> tuple:
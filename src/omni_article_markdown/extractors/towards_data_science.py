@@ -1,7 +1,7 @@
 from typing import override
 
-from ..extractor import Extractor, TagPredicate
-from ..utils import get_og_site_name
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
 
 
 class TowardsDataScienceExtractor(Extractor):
@@ -9,24 +9,22 @@ class TowardsDataScienceExtractor(Extractor):
     towardsdatascience.com
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_site_name(self.soup) == "Towards Data Science"
+    MATCH = (MetaRule("og:site_name", "eq", "Towards Data Science"),)
 
     @override
-    def get_tags_to_clean(self) -> list[TagPredicate]:
+    def get_tags_to_clean(self) -> list[CleanCondition]:
         return super().get_tags_to_clean() + [
-            lambda el: el.name == "time",
+            CleanRule(tags=("time",)),
         ]
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "class" in el.attrs and "taxonomy-post_tag" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "tds-cta-box" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "wp-block-buttons" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "wp-block-outermost-social-sharing" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "wp-block-tenup-post-time-to-read" in el.attrs["class"],
+            CleanRule(class_="taxonomy-post_tag"),
+            CleanRule(class_="tds-cta-box"),
+            CleanRule(class_="wp-block-buttons"),
+            CleanRule(class_="wp-block-outermost-social-sharing"),
+            CleanRule(class_="wp-block-tenup-post-time-to-read"),
         ]
 
     @override
@@ -1,7 +1,8 @@
 from typing import override
 
-from ..extractor import Extractor, TagPredicate
-from ..utils import filter_tag, get_og_site_name, get_tag_text
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
+from ..utils import filter_tag, get_tag_text
 
 
 class TwitterExtractor(Extractor):
@@ -9,16 +10,14 @@ class TwitterExtractor(Extractor):
     Twitter/X 推文提取器
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_site_name(self.soup) == "X (formerly Twitter)"
+    MATCH = (MetaRule("og:site_name", "eq", "X (formerly Twitter)"),)
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "data-testid" in el.attrs and "simpleTweet" in el.attrs["data-testid"],
-            lambda el: "aria-live" in el.attrs and "polite" in el.attrs["aria-live"],
-            lambda el: "role" in el.attrs and "group" in el.attrs["role"],
+            CleanRule(attr="data-testid", contains="simpleTweet"),
+            CleanRule(attr="aria-live", contains="polite"),
+            CleanRule(attr="role", contains="group"),
         ]
 
     @override
@@ -2,8 +2,9 @@ from typing import override
 
 from bs4.element import Tag
 
-from ..extractor import Extractor, TagPredicate
-from ..utils import filter_tag, get_attr_text, get_og_site_name
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
+from ..utils import filter_tag, get_attr_text
 
 
 class WechatGZHExtractor(Extractor):
@@ -11,14 +12,14 @@ class WechatGZHExtractor(Extractor):
     微信公众号
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_site_name(self.soup) == "微信公众平台"
+    MATCH = (MetaRule("og:site_name", "eq", "微信公众平台"),)
+    # 正文中的 SVG 会原样嵌入，lxml 与 html.parser 会把 viewBox 等属性名转成小写
+    PARSER = "html5lib"
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "id" in el.attrs and el.attrs["id"] == "meta_content",
+            CleanRule(id="meta_content"),
         ]
 
     @override
@@ -1,6 +1,7 @@
 from typing import override
 
-from ..extractor import Extractor, TagPredicate
+from ..extractor import CleanCondition, CleanRule, Extractor
+from ..page_meta import MetaRule
 from ..utils import get_canonical_url
 
 
@@ -9,33 +10,30 @@ class WikipediaExtractor(Extractor):
     wikipedia.org
     """
 
-    @override
-    def can_handle(self) -> bool:
-        canonical_url = get_canonical_url(self.soup)
-        return bool(canonical_url and "wikipedia.org/wiki/" in canonical_url)
+    MATCH = (MetaRule("canonical", "contains", "wikipedia.org/wiki/"),)
 
     @override
     def article_container(self) -> tuple:
         return ("div", {"id": "bodyContent"})
 
     @override
-    def get_attrs_to_clean(self) -> list[TagPredicate]:
+    def get_attrs_to_clean(self) -> list[CleanCondition]:
         return super().get_attrs_to_clean() + [
-            lambda el: "id" in el.attrs and "siteSub" in el.attrs["id"],
-            lambda el: "class" in el.attrs and "vector-body-before-content" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "mw-editsection" in el.attrs["class"],
-            lambda el: "role" in el.attrs and "navigation" in el.attrs["role"],
-            lambda el: "role" in el.attrs and "presentation" in el.attrs["role"],
-            lambda el: "class" in el.attrs and "printfooter" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "side-box" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "reflist" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "div-col" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "mw-references" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "mw-references-wrap" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "mw-references-columns" in el.attrs["class"],
-            lambda el: "class" in el.attrs and "refbegin" in el.attrs["class"],
-            lambda el: "id" in el.attrs and "catlinks" in el.attrs["id"],
-            lambda el: el.name == "sup" and ("class" in el.attrs and "reference" in el.attrs["class"]),
+            CleanRule(attr="id", contains="siteSub"),
+            CleanRule(class_="vector-body-before-content"),
+            CleanRule(class_="mw-editsection"),
+            CleanRule(attr="role", contains="navigation"),
+            CleanRule(attr="role", contains="presentation"),
+            CleanRule(class_="printfooter"),
+            CleanRule(class_="side-box"),
+            CleanRule(class_="reflist"),
+            CleanRule(class_="div-col"),
+            CleanRule(class_="mw-references"),
+            CleanRule(class_="mw-references-wrap"),
+            CleanRule(class_="mw-references-columns"),
+            CleanRule(class_="refbegin"),
+            CleanRule(attr="id", contains="catlinks"),
+            CleanRule(tags=("sup",), class_="reference"),
         ]
 
     @override
@@ -1,7 +1,7 @@
 from typing import override
 
 from ..extractor import Extractor
-from ..utils import get_og_url
+from ..page_meta import MetaRule
 
 
 class WoShiPMExtractor(Extractor):
@@ -9,9 +9,7 @@ class WoShiPMExtractor(Extractor):
     人人都是产品经理
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_url(self.soup).startswith("https://www.woshipm.com")
+    MATCH = (MetaRule("og:url", "prefix", "https://www.woshipm.com"),)
 
     @override
     def article_container(self) -> tuple:
@@ -4,7 +4,8 @@ from typing import override
 
 from ..extractor import Article, Extractor
 from ..http_client import get_session
-from ..utils import filter_tag, get_og_url
+from ..page_meta import MetaRule
+from ..utils import filter_tag
 
 
 class YuqueExtractor(Extractor):
@@ -12,9 +13,8 @@ class YuqueExtractor(Extractor):
     语雀
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_url(self.soup).startswith("https://www.yuque.com")
+    MATCH = (MetaRule("og:url", "prefix", "https://www.yuque.com"),)
+    KEEP_SCRIPTS = True
 
     @override
     def article_container(self) -> tuple:
@@ -1,7 +1,7 @@
 from typing import override
 
 from ..extractor import Extractor
-from ..utils import get_og_site_name
+from ..page_meta import MetaRule
 
 
 class ZhihuExtractor(Extractor):
@@ -9,9 +9,7 @@ class ZhihuExtractor(Extractor):
     知乎专栏
     """
 
-    @override
-    def can_handle(self) -> bool:
-        return get_og_site_name(self.soup) == "知乎专栏"
+    MATCH = (MetaRule("og:site_name", "eq", "知乎专栏"),)
 
     @override
     def article_container(self) -> tuple:
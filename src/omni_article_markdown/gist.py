@@ -0,0 +1,136 @@
+import json
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cache
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from .http_cache import HttpCache, cached_get
+from .http_client import get_session
+from .reporter import Reporter
+from .store import Store
+
+GIST_API_URL = "https://api.github.com/gists"
+DEFAULT_WORKERS = 8
+DEFAULT_TIMEOUT = 10
+
+
+@dataclass(frozen=True)
+class GistRef:
+    """
+    gist 嵌入脚本指向的内容：`https://gist.github.com/<user>/<id>[/<revision>].js[?file=<name>]`。
+    """
+
+    gist_id: str
+    revision: str = ""
+    file: str = ""
+
+    @property
+    def api_path(self) -> str:
+        return f"{self.gist_id}/{self.revision}" if self.revision else self.gist_id
+
+
+def parse_gist_src(src: str) -> GistRef | None:
+    parsed = urlparse(src)
+    if parsed.netloc != "gist.github.com":
+        return None
+    # [id]、[user, id] 或 [user, id, revision]
+    parts = [part for part in parsed.path.removesuffix(".js").split("/") if part]
+    if len(parts) == 3:
+        gist_id, revision = parts[1], parts[2]
+    elif parts and len(parts) < 3:
+        gist_id, revision = parts[-1], ""
+    else:
+        return None
+    if not _is_hex(gist_id) or not _is_hex(revision):
+        return None
+    file = parse_qs(parsed.query).get("file", [""])[0]
+    return GistRef(gist_id, revision, file)
+
+
+@cache
+def get_gist_cache() -> HttpCache:
+    """获取全局复用的 gist 缓存，与网页缓存分开存放，避免被大量网页挤出。"""
+    return HttpCache(Store().path / "gist_cache")
+
+
+class GistFetcher:
+    """
+    获取 gist 的文件内容。
+
+    prefetch() 在转换之前并发请求文章中的所有 gist；响应按 gist ID（以及固定的 revision）缓存在磁盘上，
+    再次请求时携带 If-None-Match 条件请求，固定 revision 的内容不会变化，命中缓存后不再请求。
+    offline 为 True 时只读取缓存，不访问网络。获取失败的 gist ID 记录在 failed 中。
+    """
+
+    def __init__(
+        self,
+        http_cache: HttpCache | None = None,
+        verify_ssl: bool = True,
+        offline: bool = False,
+        reporter: Reporter | None = None,
+        api_url: str = GIST_API_URL,
+        workers: int = DEFAULT_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self.http_cache = http_cache
+        self.verify_ssl = verify_ssl
+        self.offline = offline
+        self.reporter = reporter
+        self.api_url = api_url.rstrip("/")
+        self.workers = workers
+        self.timeout = timeout
+        self.failed: set[str] = set()
+        self._files: dict[str, dict[str, str] | None] = {}
+
+    def prefetch(self, refs: Iterable[GistRef]):
+        paths = list(dict.fromkeys(ref.api_path for ref in refs if ref.api_path not in self._files))
+        if len(paths) == 1:
+            self._files[paths[0]] = self._fetch(paths[0])
+        elif paths:
+            with ThreadPoolExecutor(min(self.workers, len(paths))) as pool:
+                self._files.update(zip(paths, pool.map(self._fetch, paths), strict=True))
+
+    def files(self, ref: GistRef) -> dict[str, str]:
+        """
+        返回 {文件名: 内容}，ref 指定了文件时只包含该文件；获取失败时返回空字典。
+        """
+        if ref.api_path not in self._files:
+            self.prefetch([ref])
+        files = self._files[ref.api_path] or {}
+        if ref.file and ref.file in files:
+            return {ref.file: files[ref.file]}
+        return files
+
+    def _fetch(self, path: str) -> dict[str, str] | None:
+        url = f"{self.api_url}/{path}"
+        entry = self.http_cache.lookup(url) if self.http_cache else None
+        try:
+            if entry and (self.offline or "/" in path):
+                text = entry.text()
+            elif self.offline:
+                self._report(f"Gist {path} is not cached, skipped in offline mode.")
+                text = None
+            else:
+                text = cached_get(get_session(self.verify_ssl), url, self.http_cache, timeout=self.timeout)
+            data = json.loads(text) if text is not None else None
+        except (requests.RequestException, ValueError) as e:
+            self._report(f"Fetch gist error: {path}: {e}")
+            data = None
+        if not isinstance(data, dict) or not isinstance(data.get("files"), dict):
+            if isinstance(data, dict):
+                self._report(f"Fetch gist error: {path}: {data.get('message', 'unexpected response')}")
+            self.failed.add(path)
+            return None
+        return {name: info.get("content") or "" for name, info in data["files"].items()}
+
+    def _report(self, message: str):
+        if self.reporter:
+            self.reporter(message)
+
+
+def _is_hex(value: str) -> bool:
+    # revision 为空时同样成立
+    return all(c in "0123456789abcdef" for c in value.lower())
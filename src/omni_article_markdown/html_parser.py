@@ -0,0 +1,142 @@
+import re
+from collections.abc import Iterator
+from functools import cache
+from importlib.util import find_spec
+
+from bs4 import BeautifulSoup
+
+AUTO = "auto"
+# BeautifulSoup 支持的解析器（tree builder）
+PARSER_BACKENDS = ("html5lib", "lxml", "html.parser")
+
+_default_parser = AUTO
+
+# 按 HTML 词法切分标记：属性值中的 `<script>`、`<!--` 都不是标签
+_MARKUP_START_PATTERN = re.compile(r"<(?:(!--)|(/?[a-zA-Z])|[!?/])")
+_ATTR_VALUE = r"""(?:"[^"]*+"|'[^']*+'|[^\t\n\f\r >"'][^\t\n\f\r >]*+|(?=>))"""
+_ATTR = rf"[^\t\n\f\r />][^\t\n\f\r /=>]*+(?:[\t\n\f\r ]*+=[\t\n\f\r ]*+{_ATTR_VALUE}|(?![\t\n\f\r ]*+=))"
+_TAG_PATTERN = re.compile(rf"</?([a-zA-Z][^\t\n\f\r />]*+)(?:[\t\n\f\r /]*+{_ATTR})*+[\t\n\f\r /]*+>")
+_RAW_TEXT_TAGS = frozenset(("script", "style"))
+# 这些元素的内容同样按文本处理，其中的 `<script>` 不是标签
+_TEXT_ONLY_TAGS = frozenset(("title", "textarea", "xmp", "iframe", "noembed", "noframes"))
+_TAG_NAME_END = frozenset("\t\n\f\r />")
+
+
+def set_default_parser(name: str):
+    """
+    设置全局默认解析器，可选值为 `auto` 或 PARSER_BACKENDS 之一。
+    """
+    global _default_parser
+    _check_name(name)
+    _default_parser = name
+
+
+def get_default_parser() -> str:
+    return _default_parser
+
+
+def resolve_parser(name: str | None = None) -> str:
+    """
+    返回实际使用的解析器名称。`auto` 在安装了 lxml 时使用 lxml，否则使用 html5lib。
+    """
+    name = name or _default_parser
+    _check_name(name)
+    if name == AUTO:
+        return "lxml" if _lxml_available() else "html5lib"
+    if name == "lxml" and not _lxml_available():
+        raise ValueError("The lxml parser is not installed. Install it with: pip install 'omni-article-markdown[fast]'")
+    return name
+
+
+def make_soup(markup: str, parser: str | None = None) -> BeautifulSoup:
+    return BeautifulSoup(markup, resolve_parser(parser))
+
+
+def strip_raw_text(markup: str) -> str:
+    """
+    清空 `<script>` 和 `<style>` 的内容，保留标签本身及其属性，不改变文档的树结构。
+    这些内容的文本量往往远大于正文，而提取时它们都会被清理掉。
+    """
+    parts = []
+    pos = 0
+    for is_comment, _, body_start, body_end, _ in iter_raw_text(markup):
+        # 脚本中出现 `<!--` 时，解析器判断脚本结束位置的规则更复杂，保持原样
+        if is_comment or body_start == body_end or markup.find("<!--", body_start, body_end) >= 0:
+            continue
+        parts.append(markup[pos:body_start])
+        pos = body_end
+    parts.append(markup[pos:])
+    return "".join(parts)
+
+
+def iter_raw_text(markup: str) -> Iterator[tuple[bool, int, int, int, int]]:
+    """
+    按顺序返回注释以及 script / style 元素的位置：(是否为注释, 开始, 内容开始, 内容结束, 结束)。
+    逐个标签扫描并跳过属性值，注释和属性值中的 `<script>` 不会被当成标签，未闭合的元素延伸到文档末尾。
+    遇到无法确定边界的标签（例如引号未闭合）时停止，之后的内容保持原样。
+    """
+    pos = 0
+    end = len(markup)
+    while match := _MARKUP_START_PATTERN.search(markup, pos):
+        start = match.start()
+        if match.group(1):
+            # `<!-->` 和 `<!--->` 也是完整的注释
+            close = markup.find("-->", start + 2)
+            if close < 0:
+                yield True, start, match.end(), end, end
+                return
+            yield True, start, min(match.end(), close), close, close + 3
+            pos = close + 3
+            continue
+        if match.group(2) is None:
+            # `<!DOCTYPE>`、`<?xml?>` 等，到下一个 `>` 结束
+            close = markup.find(">", match.end())
+            if close < 0:
+                return
+            pos = close + 1
+            continue
+        tag = _TAG_PATTERN.match(markup, start)
+        if tag is None:
+            return
+        pos = tag.end()
+        name = tag.group(1).lower()
+        if markup[start + 1] == "/" or (name not in _RAW_TEXT_TAGS and name not in _TEXT_ONLY_TAGS):
+            continue
+        end_tag = _find_end_tag(markup, name, pos)
+        if end_tag is None:
+            if name in _RAW_TEXT_TAGS:
+                yield False, start, pos, end, end
+            return
+        if name in _RAW_TEXT_TAGS:
+            yield False, start, pos, *end_tag
+        pos = end_tag[1]
+
+
+def _find_end_tag(markup: str, name: str, pos: int) -> tuple[int, int] | None:
+    # 内容通常很长，先用 str.find 定位 `</` 再确认标签名，比正则逐字符扫描快得多
+    size = len(name)
+    close = markup.find("</", pos)
+    while close >= 0:
+        after = close + 2 + size
+        if markup[close + 2 : after].lower() == name and markup[after : after + 1] in _TAG_NAME_END:
+            tag_end = markup.find(">", after)
+            return (close, tag_end + 1) if tag_end >= 0 else None
+        close = markup.find("</", close + 2)
+    return None
+
+
+def soup_parser(soup: BeautifulSoup) -> str:
+    """
+    返回构建 soup 时使用的解析器名称。
+    """
+    return soup.builder.NAME
+
+
+def _check_name(name: str):
+    if name != AUTO and name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown HTML parser: {name}. Choose from: {', '.join((AUTO, *PARSER_BACKENDS))}")
+
+
+@cache
+def _lxml_available() -> bool:
+    return find_spec("lxml") is not None
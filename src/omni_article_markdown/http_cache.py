@@ -0,0 +1,178 @@
+import hashlib
+import json
+import time
+from collections.abc import Mapping
+from contextlib import suppress
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from .disk_cache import DiskCache, _atomic_write
+from .store import Store
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+DEFAULT_MAX_AGE = 7 * 24 * 3600
+
+
+@dataclass
+class CacheEntry:
+    key: str
+    body_path: Path
+    meta: dict[str, Any]
+
+    def is_fresh(self) -> bool:
+        expires_at = self.meta.get("expires_at")
+        return expires_at is not None and time.time() < expires_at and not self.meta.get("no_cache")
+
+    def validators(self) -> dict[str, str]:
+        headers = {}
+        if self.meta.get("etag"):
+            headers["If-None-Match"] = self.meta["etag"]
+        if self.meta.get("last_modified"):
+            headers["If-Modified-Since"] = self.meta["last_modified"]
+        return headers
+
+    def text(self) -> str:
+        return self.body_path.read_bytes().decode("utf-8", errors="replace")
+
+
+class HttpCache(DiskCache):
+    """
+    基于条件请求的磁盘 HTTP 缓存。
+
+    响应体连同 ETag / Last-Modified / Cache-Control 一起保存；在有效期内直接从磁盘返回，
+    过期后携带 If-None-Match / If-Modified-Since 重新验证，服务端返回 304 时继续使用缓存。
+    总大小超过 max_size 时按最近访问时间（LRU）淘汰，存放超过 max_age 秒的条目会被删除。
+    """
+
+    def __init__(
+        self, path: Path | str | None = None, max_size: int = DEFAULT_MAX_SIZE, max_age: float = DEFAULT_MAX_AGE
+    ):
+        super().__init__(Path(path) if path else Store().path / "http_cache", max_size, max_age)
+
+    def lookup(self, url: str, variant: str = "") -> CacheEntry | None:
+        key = _cache_key(url, variant)
+        body_path = self.path / f"{key}.body"
+        meta = self._load_meta(key)
+        if meta is None:
+            return None
+        if not body_path.exists():
+            self._remove(key)
+            return None
+        return CacheEntry(key=key, body_path=body_path, meta=meta)
+
+    def store(self, url: str, variant: str, body: bytes, headers: Mapping[str, str]):
+        meta = _cache_meta(url, headers)
+        if meta is None:
+            return
+        key = _cache_key(url, variant)
+        self._write(key, {".body": body, ".json": json.dumps(meta, ensure_ascii=False).encode("utf-8")})
+
+    def revalidated(self, entry: CacheEntry, headers: Mapping[str, str]):
+        """服务端返回 304 后，用新的响应头刷新条目的有效期。"""
+        meta = _cache_meta(entry.meta["url"], headers, entry.meta) or entry.meta
+        entry.meta = meta
+        _atomic_write(self.path / f"{entry.key}.json", json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+
+@cache
+def get_http_cache() -> HttpCache:
+    """获取全局复用的 HttpCache 单例。"""
+    return HttpCache()
+
+
+def cached_get(
+    session: requests.Session,
+    url: str,
+    http_cache: HttpCache | None,
+    headers: dict[str, str] | None = None,
+    variant: str = "",
+    **kwargs: Any,
+) -> str:
+    """
+    带缓存的 GET 请求，返回按 UTF-8 解码的响应文本。
+    http_cache 为 None 时等价于直接调用 session.get()。
+    """
+    entry = http_cache.lookup(url, variant) if http_cache else None
+    if entry and entry.is_fresh():
+        return entry.text()
+    request_headers = dict(headers or {})
+    if entry:
+        request_headers.update(entry.validators())
+    response = session.get(url, headers=request_headers or None, **kwargs)
+    if http_cache and entry and response.status_code == 304:
+        http_cache.revalidated(entry, response.headers)
+        return entry.text()
+    response.encoding = "utf-8"
+    if http_cache and response.status_code == 200:
+        http_cache.store(url, variant, response.content, response.headers)
+    return response.text
+
+
+async def acached_get(
+    client: Any,
+    url: str,
+    http_cache: HttpCache | None,
+    headers: dict[str, str] | None = None,
+    variant: str = "",
+) -> str:
+    """cached_get 的异步版本，client 为 httpx.AsyncClient。"""
+    entry = http_cache.lookup(url, variant) if http_cache else None
+    if entry and entry.is_fresh():
+        return entry.text()
+    request_headers = dict(headers or {})
+    if entry:
+        request_headers.update(entry.validators())
+    response = await client.get(url, headers=request_headers or None)
+    if http_cache and entry and response.status_code == 304:
+        http_cache.revalidated(entry, response.headers)
+        return entry.text()
+    response.encoding = "utf-8"
+    if http_cache and response.status_code == 200:
+        http_cache.store(url, variant, response.content, response.headers)
+    return response.text
+
+
+def _cache_key(url: str, variant: str) -> str:
+    return hashlib.sha256(f"{variant}\n{url}".encode()).hexdigest()
+
+
+def _cache_meta(url: str, headers: Mapping[str, str], previous: dict[str, Any] | None = None) -> dict[str, Any] | None:
+    """
+    根据响应头生成缓存元数据；不可缓存（no-store，或既无校验信息也无有效期）时返回 None。
+    """
+    directives = _parse_cache_control(headers.get("Cache-Control", ""))
+    if "no-store" in directives:
+        return None
+    previous = previous or {}
+    now = time.time()
+    meta: dict[str, Any] = {
+        "url": url,
+        "etag": headers.get("ETag") or previous.get("etag"),
+        "last_modified": headers.get("Last-Modified") or previous.get("last_modified"),
+        "no_cache": "no-cache" in directives,
+        "stored_at": now,
+        "expires_at": None,
+    }
+    max_age = directives.get("max-age")
+    if max_age is not None and max_age.isdigit():
+        meta["expires_at"] = now + int(max_age)
+    elif headers.get("Expires"):
+        with suppress(TypeError, ValueError):
+            meta["expires_at"] = parsedate_to_datetime(headers["Expires"]).timestamp()
+    if not meta["etag"] and not meta["last_modified"] and not meta["expires_at"]:
+        return None
+    return meta
+
+
+def _parse_cache_control(value: str) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in value.split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
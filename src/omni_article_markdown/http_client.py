@@ -1,7 +1,14 @@
+import asyncio
+import threading
 from functools import cache
+from typing import Any, override
+from weakref import WeakKeyDictionary
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+
+from .rate_limit import HostRateLimiter, get_rate_limiter
 
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/146.0.0.0 Safari/537.36 Edg/146.0.0.0"
 
@@ -13,20 +20,154 @@ REQUEST_HEADERS = {
 }
 
 
-@cache
+# requests 默认不设超时，服务端不响应时会一直等待；(连接, 读取) 秒，调用方显式传入 timeout 时以调用方为准
+DEFAULT_TIMEOUT = (10, 30)
+# 连接池按主机划分：pool_connections 为缓存的主机数，pool_maxsize 为每个主机保留的连接数
+DEFAULT_POOL_CONNECTIONS = 16
+DEFAULT_POOL_MAXSIZE = 32
+
+
+class _HostAdapter(HTTPAdapter):
+    """补上默认超时，并让每个请求（包括重定向的每一跳）经过按主机的限速，见 rate_limit.HostRateLimiter。"""
+
+    def __init__(
+        self, timeout: float | tuple[float, float] | None, rate_limiter: HostRateLimiter | None = None, **kwargs
+    ):
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+
+    @override
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):  # type: ignore[override]
+        if timeout is None:
+            timeout = self.timeout
+        # 未指定时使用全局限制器，configure_rate_limits() 对已创建的 Session 同样生效
+        with (self.rate_limiter or get_rate_limiter()).slot(request.url):
+            return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+
+class SessionManager:
+    """
+    为每个线程提供各自的 requests.Session。
+
+    requests.Session 并不保证线程安全（Cookie、请求头、适配器等状态在请求之间会被修改），
+    因此每个线程使用独立的 Session；所有 Session 挂载同一个 HTTPAdapter，连接池（urllib3 PoolManager，线程安全）
+    在线程之间共享，线程池中短生命周期的线程同样可以复用连接。线程结束后它的 Session 随之释放。
+    close() 关闭连接池中的所有连接，之后再发起的请求会重新建立连接。
+    rate_limiter 为 None 时使用全局的 rate_limit.get_rate_limiter()。
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        timeout: float | tuple[float, float] | None = DEFAULT_TIMEOUT,
+        rate_limiter: HostRateLimiter | None = None,
+    ):
+        self.adapter = _HostAdapter(timeout, rate_limiter, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self._local = threading.local()
+
+    def session(self, verify_ssl: bool = True) -> requests.Session:
+        sessions: dict[bool, requests.Session] | None = getattr(self._local, "sessions", None)
+        if sessions is None:
+            sessions = self._local.sessions = {}
+        session = sessions.get(verify_ssl)
+        if session is None:
+            session = sessions[verify_ssl] = self._new_session(verify_ssl)
+        return session
+
+    def close(self):
+        self.adapter.close()
+
+    def _new_session(self, verify_ssl: bool) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(REQUEST_HEADERS)
+        session.verify = verify_ssl
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+
+        # 如果禁用了 SSL 验证，在此处统一屏蔽警告
+        if not verify_ssl:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        return session
+
+
+_session_manager = SessionManager()
+_session_manager_lock = threading.Lock()
+
+
 def get_session(verify_ssl: bool = True) -> requests.Session:
     """
-    获取全局复用的 requests.Session 单例。
-    利用 @cache 装饰器，相同参数的调用将永远返回同一个 Session 实例，
-    完美实现连接池共享和参数化单例。
-    如果是长期运行的服务，建议定期调用 session.close() 来清理过期连接。
+    获取当前线程复用的 requests.Session，见 SessionManager。
+    Session 不应传给其他线程使用，需要时在对应线程中重新调用 get_session()。
+    """
+    return _session_manager.session(verify_ssl)
+
+
+def configure_sessions(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    timeout: float | tuple[float, float] | None = DEFAULT_TIMEOUT,
+):
+    """
+    以新的连接池大小和默认超时替换全局的 SessionManager，并关闭原有的连接。
+    应在发起请求之前调用，例如并发数较大的批量转换开始前把 pool_maxsize 调整为不小于线程数。
+    """
+    global _session_manager
+    with _session_manager_lock:
+        previous = _session_manager
+        _session_manager = SessionManager(pool_connections, pool_maxsize, timeout)
+    previous.close()
+
+
+def close_sessions():
+    """关闭全局连接池中的所有连接，应在程序或服务退出前调用。"""
+    _session_manager.close()
+
+
+_async_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[bool, Any]] = WeakKeyDictionary()
+
+
+def get_async_client(verify_ssl: bool = True) -> Any | None:
+    """
+    获取当前事件循环中复用的 httpx.AsyncClient。
+    httpx 是可选依赖（`pip install omni-article-markdown[async]`），未安装时返回 None，
+    调用方应退回到在线程中执行同步请求。
+    AsyncClient 绑定在创建它的事件循环上，因此按 (事件循环, verify_ssl) 分别缓存。
     """
-    session = requests.Session()
-    session.headers.update(REQUEST_HEADERS)
-    session.verify = verify_ssl
+    try:
+        import httpx
+    except ImportError:
+        return None
+
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(verify_ssl)
+    if client is None or client.is_closed:
+        transport = _limited_transport_class()(verify=verify_ssl)
+        client = httpx.AsyncClient(headers=REQUEST_HEADERS, transport=transport, follow_redirects=True)
+        clients[verify_ssl] = client
+        if not verify_ssl:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    return client
+
+
+@cache
+def _limited_transport_class() -> type:
+    import httpx
+
+    class LimitedTransport(httpx.AsyncHTTPTransport):
+        """与同步请求共用全局限制器的 AsyncHTTPTransport。"""
+
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            async with get_rate_limiter().aslot(str(request.url)):
+                return await super().handle_async_request(request)
+
+    return LimitedTransport
 
-    # 如果禁用了 SSL 验证，在此处统一屏蔽警告
-    if not verify_ssl:
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-    return session
+async def close_async_clients():
+    """关闭当前事件循环中创建的所有 AsyncClient，应在事件循环结束前调用。"""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
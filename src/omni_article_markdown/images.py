@@ -0,0 +1,151 @@
+import mimetypes
+import re
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from urllib.parse import urlparse
+
+import requests
+
+from .assets import DEFAULT_ASSETS_DIR, AssetLocaliser, AssetStore, split_code_fences
+from .http_client import get_session
+from .reporter import Reporter
+
+DEFAULT_WORKERS = 8
+DEFAULT_PER_HOST = 4
+DEFAULT_MAX_TOTAL_SIZE = 200 * 1024 * 1024
+DEFAULT_TIMEOUT = 30
+
+_CHUNK_SIZE = 64 * 1024
+_IMAGE_SUFFIXES = frozenset((".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg", ".avif", ".bmp", ".ico"))
+
+# URL 中可以有一层成对的括号，例如 Wikimedia 的 Foo_(bar).png
+_IMAGE_RE = re.compile(r"!\[([^\]\n]*)\]\((https?://(?:[^()\s]++|\([^()\s]*+\))++)\)")
+
+
+class ImageDownloader(AssetLocaliser):
+    """
+    把 Markdown 中引用的远程图片下载到本地，并把链接改写为相对路径。
+
+    图片保存在 Markdown 文件所在目录下的 assets_dir 中（见 AssetStore），内容相同的图片只保存一份，
+    已经下载过的 URL 不再请求。下载通过共享的 Session 并发进行，同时在途的请求总数不超过 workers，
+    同一主机不超过 per_host；累计下载超过 max_total_size 字节后，其余图片保留原链接。
+    下载失败的图片同样保留原链接。
+    """
+
+    def __init__(
+        self,
+        assets_dir: str = DEFAULT_ASSETS_DIR,
+        workers: int = DEFAULT_WORKERS,
+        per_host: int = DEFAULT_PER_HOST,
+        max_total_size: int = DEFAULT_MAX_TOTAL_SIZE,
+        verify_ssl: bool = True,
+        reporter: Reporter | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        super().__init__(assets_dir)
+        self.workers = workers
+        self.per_host = per_host
+        self.max_total_size = max_total_size
+        self.verify_ssl = verify_ssl
+        self.reporter = reporter
+        self.timeout = timeout
+        self.downloaded_size = 0
+        self._hosts: dict[str, threading.BoundedSemaphore] = {}
+        self._size_exceeded = False
+
+    def localise(self, markdown: str, base_dir: Path | str) -> str:
+        store = self.store_for(base_dir)
+        segments = list(split_code_fences(markdown))
+        urls = [match[2] for text, is_code in segments if not is_code for match in _IMAGE_RE.finditer(text)]
+        names = self.download(store, urls)
+        if not names:
+            return markdown
+        links = {url: store.relative_to(base_dir, name) for url, name in names.items()}
+
+        def replace(match: re.Match[str]) -> str:
+            path = links.get(match[2])
+            return f"![{match[1]}]({path})" if path else match[0]
+
+        return "".join(text if is_code else _IMAGE_RE.sub(replace, text) for text, is_code in segments)
+
+    def download(self, store: AssetStore, urls: Iterable[str]) -> dict[str, str]:
+        """并发下载 urls，返回成功保存的 URL -> 文件名。"""
+        names: dict[str, str] = {}
+        pending = []
+        for url in dict.fromkeys(urls):
+            name = store.lookup_url(url)
+            if name:
+                names[url] = name
+            else:
+                pending.append(url)
+        if pending:
+            with ThreadPoolExecutor(min(self.workers, len(pending)), thread_name_prefix="mdcli-image") as pool:
+                for url, name in zip(pending, pool.map(lambda url: self._fetch(store, url), pending), strict=True):
+                    if name:
+                        names[url] = name
+            store.flush()
+        return names
+
+    def _fetch(self, store: AssetStore, url: str) -> str | None:
+        if self._size_exceeded:
+            return None
+        with self._host_slot(urlparse(url).hostname or ""):
+            try:
+                with get_session(self.verify_ssl).get(url, stream=True, timeout=self.timeout) as response:
+                    response.raise_for_status()
+                    content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+                    suffix = _suffix(url, content_type)
+                    if suffix is None:
+                        self._report(f"Skip image {url}: not an image ({content_type or 'unknown type'}).")
+                        return None
+                    data = self._read(response)
+            except requests.RequestException as e:
+                self._report(f"Download image error: {url}: {e}")
+                return None
+        if data is None:
+            return None
+        name = store.put(data, suffix)
+        store.record_url(url, name)
+        return name
+
+    def _read(self, response: requests.Response) -> bytes | None:
+        parts = []
+        for part in response.iter_content(_CHUNK_SIZE):
+            with self._lock:
+                self.downloaded_size += len(part)
+                exceeded = self.downloaded_size > self.max_total_size
+                first = exceeded and not self._size_exceeded
+                self._size_exceeded = self._size_exceeded or exceeded
+            if first:
+                self._report(f"Image size limit ({self.max_total_size} bytes) reached, keeping remaining links.")
+            if exceeded:
+                return None
+            parts.append(part)
+        return b"".join(parts)
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._hosts.get(host)
+            if slot is None:
+                slot = self._hosts[host] = threading.BoundedSemaphore(self.per_host)
+        return slot
+
+    def _report(self, message: str):
+        if self.reporter:
+            self.reporter(message)
+
+
+def _suffix(url: str, content_type: str) -> str | None:
+    """
+    根据 Content-Type 确定扩展名，服务端没有给出图片类型时退回 URL 中的扩展名；都不是图片时返回 None。
+    """
+    if content_type.startswith("image/"):
+        if content_type == "image/jpeg":
+            return ".jpg"
+        return mimetypes.guess_extension(content_type) or f".{content_type.removeprefix('image/').split('+')[0]}"
+    suffix = PurePosixPath(urlparse(url).path).suffix.lower()
+    if content_type in ("", "application/octet-stream", "binary/octet-stream") and suffix in _IMAGE_SUFFIXES:
+        return suffix
+    return None
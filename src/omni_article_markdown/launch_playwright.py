@@ -1,11 +1,18 @@
+import asyncio
+import atexit
 import subprocess
 import sys
-from collections.abc import Generator
-from contextlib import contextmanager
+import threading
+from collections.abc import AsyncGenerator, Generator
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager, contextmanager, suppress
+from functools import cache
 from importlib import resources
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from .http_client import REQUEST_HEADERS, USER_AGENT
+from .rate_limit import get_rate_limiter
 from .reporter import Reporter
 
 
@@ -66,6 +73,16 @@ def ensure_playwright_installed(reporter: Reporter | None = None):
     return sync_playwright
 
 
+def ensure_async_playwright_installed(reporter: Reporter | None = None):
+    """
+    ensure_playwright_installed 的异步版本，返回 async_playwright 上下文管理器。
+    """
+    ensure_playwright_installed(reporter)
+    from playwright.async_api import async_playwright
+
+    return async_playwright
+
+
 def try_launch_browser(p, reporter: Reporter | None = None):
     """
     接收传入的 playwright 对象，尝试启动浏览器。
@@ -97,47 +114,289 @@ def try_launch_browser(p, reporter: Reporter | None = None):
         raise
 
 
-@contextmanager
-def create_stealth_page(reporter: Reporter | None = None, verify_ssl: bool = True) -> Generator[tuple[Any, Any]]:
+async def try_launch_browser_async(p, reporter: Reporter | None = None):
     """
-    提供一个开箱即用的、自带 Stealth 防爬插件的 Playwright Page 和 Context。
-    使用 @contextmanager 确保在 yield 结束后，浏览器资源会被妥善关闭。
+    try_launch_browser 的异步版本，p 为 playwright.async_api.Playwright。
     """
-    # 1. 确保环境安装
-    playwright_context_manager = ensure_playwright_installed(reporter)
+    try:
+        return await p.chromium.launch(headless=True)
+    except Exception as e:
+        error_msg = str(e)
+        if "Executable doesn't exist" in error_msg or "playwright install" in error_msg:
+            if reporter:
+                reporter("Playwright 引擎已就绪，但缺失对应的浏览器内核。")
+            # 安装过程是阻塞的子进程调用，放到线程中执行以免阻塞事件循环
+            await asyncio.to_thread(_install_chromium_browser, reporter)
+            if reporter:
+                reporter("环境配置完毕，正在启动无头浏览器...")
+            return await p.chromium.launch(headless=True)
+        raise
 
-    # 2. 启动 Playwright
-    with playwright_context_manager() as p:
-        browser = try_launch_browser(p, reporter=reporter)
 
-        # 3. 创建带有统一配置的 Context
-        context = browser.new_context(
-            user_agent=USER_AGENT,
-            java_script_enabled=True,
-            extra_http_headers=REQUEST_HEADERS,
-            ignore_https_errors=not verify_ssl,  # 统一处理 SSL 验证
-        )
+# 单个浏览器累计服务多少个页面后重启，防止长时间运行导致内存膨胀
+MAX_PAGES_PER_BROWSER = 50
 
-        # 4. 注入 Stealth 插件
-        try:
-            with resources.path("omni_article_markdown.libs", "stealth.min.js") as js_path:
-                context.add_init_script(path=str(js_path))
-        except Exception as e:
-            if reporter:
-                reporter(f"无法加载 stealth 插件，将使用标准模式: {e}")
+# 异步浏览器池中同时保持的浏览器数量
+ASYNC_POOL_SIZE = 2
+
+# close_worker_browser_pools() 等待所有工作线程就绪的最长时间（秒）
+_CLOSE_WAIT = 5.0
+
+
+def _context_options(verify_ssl: bool) -> dict[str, Any]:
+    return {
+        "user_agent": USER_AGENT,
+        "java_script_enabled": True,
+        "extra_http_headers": REQUEST_HEADERS,
+        "ignore_https_errors": not verify_ssl,  # 统一处理 SSL 验证
+    }
+
+
+@cache
+def _stealth_script() -> str:
+    """Stealth 插件脚本只从包资源中读取一次。"""
+    return resources.files("omni_article_markdown.libs").joinpath("stealth.min.js").read_text(encoding="utf-8")
 
-        page = context.new_page()
 
+def _stealth_script_or_none(reporter: Reporter | None) -> str | None:
+    try:
+        return _stealth_script()
+    except Exception as e:
+        if reporter:
+            reporter(f"无法加载 stealth 插件，将使用标准模式: {e}")
+        return None
+
+
+class BrowserPool:
+    """
+    同步 API 的浏览器池。
+
+    Playwright 进程和浏览器在首次使用时启动，并在之后的读取中一直复用，
+    每次读取只创建一个全新的、相互隔离的 Context 和 Page。
+    sync_playwright 的对象只能在创建它的线程中使用，因此每个线程持有独立的池，
+    通过 get_browser_pool() 获取。
+    """
+
+    def __init__(self, max_pages_per_browser: int = MAX_PAGES_PER_BROWSER):
+        self.max_pages_per_browser = max_pages_per_browser
+        self._playwright = None
+        self._browser = None
+        self._pages_served = 0
+        self._active = 0
+
+    @contextmanager
+    def page(self, reporter: Reporter | None = None, verify_ssl: bool = True) -> Generator[tuple[Any, Any]]:
+        browser = self._acquire_browser(reporter)
+        self._active += 1
+        context = page = None
         try:
-            # 将 page 和 context 作为元组 yield 出去，供业务代码在 with 块中使用
-            # 返回 context 是因为有些业务（如知乎）需要调用 context.cookies()
+            context = browser.new_context(**_context_options(verify_ssl))
+            script = _stealth_script_or_none(reporter)
+            if script:
+                context.add_init_script(script=script)
+            page = context.new_page()
             yield page, context
-
         finally:
-            # 无论业务代码是否抛出异常，这里都会在 with 块结束时完美释放资源
-            for obj in (page, context, browser):
+            self._active -= 1
+            for obj in (page, context):
                 try:
                     if obj:
                         obj.close()
                 except Exception:
                     pass
+
+    def close(self):
+        self._close_browser()
+        if self._playwright is not None:
+            with suppress(Exception):
+                self._playwright.stop()
+            self._playwright = None
+
+    def _acquire_browser(self, reporter: Reporter | None):
+        if self._playwright is None:
+            self._playwright = ensure_playwright_installed(reporter)().start()
+        if self._browser is not None and (
+            not self._browser.is_connected() or (self._pages_served >= self.max_pages_per_browser and self._active == 0)
+        ):
+            self._close_browser()
+        if self._browser is None:
+            self._browser = try_launch_browser(self._playwright, reporter=reporter)
+            self._pages_served = 0
+        self._pages_served += 1
+        return self._browser
+
+    def _close_browser(self):
+        if self._browser is not None:
+            with suppress(Exception):
+                self._browser.close()
+            self._browser = None
+
+
+class AsyncBrowserPool:
+    """
+    异步 API 的浏览器池，按事件循环分别创建，通过 get_async_browser_pool() 获取。
+    池中保持 size 个浏览器，新页面总是分配给当前打开页面最少的浏览器。
+    """
+
+    def __init__(self, size: int = ASYNC_POOL_SIZE, max_pages_per_browser: int = MAX_PAGES_PER_BROWSER):
+        self.size = size
+        self.max_pages_per_browser = max_pages_per_browser
+        self._playwright_cm = None
+        self._playwright = None
+        self._slots: list[dict[str, Any]] = [{"browser": None, "served": 0, "active": 0} for _ in range(size)]
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def page(self, reporter: Reporter | None = None, verify_ssl: bool = True) -> AsyncGenerator[tuple[Any, Any]]:
+        slot = await self._acquire_slot(reporter)
+        context = page = None
+        try:
+            context = await slot["browser"].new_context(**_context_options(verify_ssl))
+            script = _stealth_script_or_none(reporter)
+            if script:
+                await context.add_init_script(script=script)
+            page = await context.new_page()
+            yield page, context
+        finally:
+            slot["active"] -= 1
+            for obj in (page, context):
+                try:
+                    if obj:
+                        await obj.close()
+                except Exception:
+                    pass
+
+    async def close(self):
+        async with self._lock:
+            for slot in self._slots:
+                await self._close_slot(slot)
+            if self._playwright_cm is not None:
+                with suppress(Exception):
+                    await self._playwright_cm.__aexit__(None, None, None)
+                self._playwright_cm = self._playwright = None
+
+    async def _acquire_slot(self, reporter: Reporter | None) -> dict[str, Any]:
+        async with self._lock:
+            if self._playwright is None:
+                async_playwright = await asyncio.to_thread(ensure_async_playwright_installed, reporter)
+                # 启动成功后才记录上下文管理器，close() 只会退出已进入的那一个
+                playwright_cm = async_playwright()
+                self._playwright = await playwright_cm.__aenter__()
+                self._playwright_cm = playwright_cm
+            slot = min(self._slots, key=lambda s: s["active"])
+            browser = slot["browser"]
+            if browser is not None and (
+                not browser.is_connected() or (slot["served"] >= self.max_pages_per_browser and slot["active"] == 0)
+            ):
+                await self._close_slot(slot)
+            if slot["browser"] is None:
+                slot["browser"] = await try_launch_browser_async(self._playwright, reporter=reporter)
+                slot["served"] = 0
+            slot["served"] += 1
+            slot["active"] += 1
+            return slot
+
+    @staticmethod
+    async def _close_slot(slot: dict[str, Any]):
+        if slot["browser"] is not None:
+            with suppress(Exception):
+                await slot["browser"].close()
+            slot["browser"] = None
+
+
+_local = threading.local()
+_async_pools: WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncBrowserPool] = WeakKeyDictionary()
+
+
+def get_browser_pool() -> BrowserPool:
+    """获取当前线程的浏览器池，不存在时创建。"""
+    pool = getattr(_local, "pool", None)
+    if pool is None:
+        pool = BrowserPool()
+        _local.pool = pool
+    return pool
+
+
+def close_browser_pool():
+    """
+    关闭当前线程的浏览器池。Playwright 的同步对象只能在创建它的线程中使用，
+    因此每个用到浏览器的线程应在退出前自行调用，线程池见 close_worker_browser_pools()。
+    """
+    pool = getattr(_local, "pool", None)
+    if pool is not None:
+        _local.pool = None
+        pool.close()
+
+
+def close_worker_browser_pools(executor: Executor, workers: int, timeout: float = _CLOSE_WAIT):
+    """
+    在线程池的每个工作线程中调用 close_browser_pool()，应在已提交的任务完成后、关闭线程池之前调用。
+
+    提交 workers 个任务，它们先在同一个 Barrier 上等待，因此分布在 workers 个不同的线程上；
+    少数情况下线程池没有为每个任务分配线程，等待 timeout 秒后各任务仍会关闭所在线程的浏览器池。
+    """
+    barrier = threading.Barrier(workers)
+
+    def close():
+        with suppress(threading.BrokenBarrierError):
+            barrier.wait(timeout)
+        close_browser_pool()
+
+    for future in [executor.submit(close) for _ in range(workers)]:
+        with suppress(Exception):
+            future.result()
+
+
+def get_async_browser_pool() -> AsyncBrowserPool:
+    """获取当前事件循环的异步浏览器池，不存在时创建。"""
+    loop = asyncio.get_running_loop()
+    pool = _async_pools.get(loop)
+    if pool is None:
+        pool = AsyncBrowserPool()
+        _async_pools[loop] = pool
+    return pool
+
+
+async def close_async_browser_pool():
+    """关闭当前事件循环的异步浏览器池，应在事件循环结束前调用。"""
+    pool = _async_pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
+
+
+@atexit.register
+def _close_browser_pools():
+    # 只能关闭主线程的浏览器池，其他线程的池由各自的线程关闭
+    if threading.current_thread() is threading.main_thread():
+        close_browser_pool()
+
+
+def create_stealth_page(reporter: Reporter | None = None, verify_ssl: bool = True):
+    """
+    提供一个开箱即用的、自带 Stealth 防爬插件的 Playwright Page 和 Context。
+    浏览器来自当前线程的浏览器池，with 块结束后只关闭本次使用的 Page 和 Context。
+    返回 context 是因为有些业务（如知乎）需要调用 context.cookies()。
+    """
+    return get_browser_pool().page(reporter, verify_ssl)
+
+
+def create_stealth_page_async(reporter: Reporter | None = None, verify_ssl: bool = True):
+    """
+    create_stealth_page 的异步版本，浏览器来自当前事件循环的浏览器池。
+    """
+    return get_async_browser_pool().page(reporter, verify_ssl)
+
+
+def navigate(page, url: str, **kwargs):
+    """
+    page.goto() 的包装，导航与 HTTP 请求共用按主机的限速（见 rate_limit.HostRateLimiter）。
+    页面内的子资源请求由浏览器发出，不计入限制。
+    """
+    with get_rate_limiter().slot(url):
+        return page.goto(url, **kwargs)
+
+
+async def anavigate(page, url: str, **kwargs):
+    """navigate() 的异步版本。"""
+    async with get_rate_limiter().aslot(url):
+        return await page.goto(url, **kwargs)
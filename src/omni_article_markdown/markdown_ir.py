@@ -0,0 +1,390 @@
+"""
+HtmlMarkdownParser 的中间表示：转换时先建出由下列节点组成的树，最后一次性渲染成 Markdown。
+
+块级元素之间的换行用 BREAK 表示，由最近的外层节点决定如何输出：链接和强调中丢弃，
+引用中变为新的 `> ` 行，列表项和代码块中变为换行，顶层连续的多个 BREAK 合并为一个空行。
+每个节点在创建时记录了父节点做判断所需的摘要，渲染只需遍历一次，不再反复复制和替换字符串。
+渲染使用显式栈而不是递归，嵌套再深也不会超出 Python 的递归深度限制。
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+
+from .utils import move_spaces
+
+# BREAK 的输出方式
+KEEP = 0  # 保留 BREAK，由外层处理
+DROP = 1  # 丢弃
+NEWLINE = 2  # 输出为换行
+QUOTE = 3  # 输出为新的引用行
+
+# 节点以 KEEP 方式渲染时，第一个（最后一个）非空输出的类型
+NONE = 0  # 没有输出
+BREAK_EDGE = 1  # BREAK
+TEXT_EDGE = 2  # 文字
+
+
+class Node(ABC):
+    """
+    - has_break: 是否包含 BREAK
+    - has_text: 去掉 BREAK 后是否还有内容
+    - all_space: 去掉 BREAK 后是否只有空白字符
+    - has_newline: 丢弃 BREAK 渲染时输出中是否可能有换行
+    - first / last: 第一个和最后一个非空输出的类型
+    """
+
+    __slots__ = ("has_break", "has_text", "all_space", "has_newline", "first", "last")
+
+    def __init__(
+        self,
+        has_break: bool,
+        has_text: bool,
+        all_space: bool,
+        has_newline: bool,
+        first: int = TEXT_EDGE,
+        last: int = TEXT_EDGE,
+    ):
+        self.has_break = has_break
+        self.has_text = has_text
+        self.all_space = all_space
+        self.has_newline = has_newline
+        self.first = first
+        self.last = last
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.has_break and not self.has_text
+
+    @property
+    def is_blank(self) -> bool:
+        # 只有空白字符（BREAK 不算空白）
+        return not self.has_break and self.all_space
+
+    @abstractmethod
+    def enter(self, out: list, mode: int, stack: list):
+        """
+        输出子节点之前的内容，并把之后要输出的子节点和字符串按逆序压入栈中，参见 _render()。
+        """
+
+    def leave(self, out: list, mode: int, start: int):
+        """
+        子节点输出完毕后调用，start 为 enter() 压栈时记录的位置。
+        """
+        return
+
+
+class Text(Node):
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        # 文字节点数量最多，直接赋值以减少创建开销
+        self.has_break = False
+        self.has_text = bool(text)
+        self.all_space = not text or text.isspace()
+        self.has_newline = "\n" in text
+        self.first = self.last = TEXT_EDGE if text else NONE
+        self.text = text
+
+    def enter(self, out: list, mode: int, stack: list):
+        out.append(self.text)
+
+
+class Break(Node):
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__(True, False, True, False, BREAK_EDGE, BREAK_EDGE)
+
+    def enter(self, out: list, mode: int, stack: list):
+        out.append(_BREAK_TOKENS[mode])
+
+
+BREAK = Break()
+EMPTY = Text("")
+# 各输出方式下 BREAK 的输出
+_BREAK_TOKENS = (BREAK, "", "\n", "\n> ")
+
+
+class Group(Node):
+    __slots__ = ("children",)
+
+    def __init__(self, children: list[Node]):
+        has_break = has_text = has_newline = False
+        all_space = True
+        first = last = NONE
+        for c in children:
+            has_break = has_break or c.has_break
+            has_text = has_text or c.has_text
+            all_space = all_space and c.all_space
+            has_newline = has_newline or c.has_newline
+            if c.first:
+                first = first or c.first
+                last = c.last
+        super().__init__(has_break, has_text, all_space, has_newline, first, last)
+        self.children = children
+
+    def enter(self, out: list, mode: int, stack: list):
+        children = self.children
+        # 开头的文字直接输出，省去压栈
+        i = 0
+        while i < len(children) and type(children[i]) is Text:
+            out.append(children[i].text)  # type: ignore[attr-defined]
+            i += 1
+        for j in range(len(children) - 1, i - 1, -1):
+            child = children[j]
+            stack.append(child.text if type(child) is Text else (child, mode, None))  # type: ignore[attr-defined]
+
+
+class Heading(Node):
+    __slots__ = ("level", "child")
+
+    def __init__(self, level: int, child: Node):
+        super().__init__(child.has_break, True, False, child.has_newline, TEXT_EDGE, child.last or TEXT_EDGE)
+        self.level = level
+        self.child = child
+
+    def enter(self, out: list, mode: int, stack: list):
+        out.append(f"{'#' * self.level} ")
+        child = self.child
+        stack.append(child.text if type(child) is Text else (child, mode, None))  # type: ignore[attr-defined]
+
+
+class Block(Node):
+    """
+    块级元素：前后各加一个 BREAK。
+    """
+
+    __slots__ = ("child",)
+
+    def __init__(self, child: Node):
+        super().__init__(True, child.has_text, child.all_space, child.has_newline, BREAK_EDGE, BREAK_EDGE)
+        self.child = child
+
+    def enter(self, out: list, mode: int, stack: list):
+        token = _BREAK_TOKENS[mode]
+        out.append(token)
+        stack.append(token)
+        child = self.child
+        stack.append(child.text if type(child) is Text else (child, mode, None))  # type: ignore[attr-defined]
+
+
+class Link(Node):
+    """
+    链接文字中的 BREAK 被丢弃；href 为空时只输出文字。child 应包含文字。
+    """
+
+    __slots__ = ("href", "child")
+
+    def __init__(self, href: str, child: Node):
+        super().__init__(False, True, child.all_space and not href, child.has_newline or "\n" in href)
+        self.href = href
+        self.child = child
+
+    def enter(self, out: list, mode: int, stack: list):
+        if self.href:
+            out.append("[")
+            stack.append(f"]({self.href})")
+        stack.append((self.child, DROP, None))
+
+
+class Emphasis(Node):
+    """
+    用 marker（`**` 或 `*`）包围内容，内容末尾的空白移到 marker 之后。child 应包含文字。
+    """
+
+    __slots__ = ("marker", "child")
+
+    def __init__(self, marker: str, child: Node):
+        super().__init__(False, True, False, child.has_newline)
+        self.marker = marker
+        self.child = child
+
+    def enter(self, out: list, mode: int, stack: list):
+        stack.append((self, mode, len(out)))
+        out.append(self.marker)
+        stack.append((self.child, DROP, None))
+
+    def leave(self, out: list, mode: int, start: int):
+        if self.child.has_newline:
+            # 少见的情况，交给 move_spaces() 处理整段文字
+            text = "".join(out[start:])
+            del out[start:]
+            out.append(move_spaces(f"{text}{self.marker}", self.marker))
+            return
+        # 没有换行时，move_spaces() 等价于把末尾的空白换成同样数量的空格放到 marker 之后
+        spaces = 0
+        for i in range(len(out) - 1, start, -1):
+            token = out[i]
+            stripped = token.rstrip()
+            spaces += len(token) - len(stripped)
+            out[i] = stripped
+            if stripped:
+                break
+        out.append(self.marker)
+        if spaces:
+            out.append(" " * spaces)
+
+
+class InlineCode(Node):
+    """
+    行内代码，child 不应包含 BREAK。
+    """
+
+    __slots__ = ("child",)
+
+    def __init__(self, child: Node):
+        super().__init__(False, True, False, child.has_newline)
+        self.child = child
+
+    def enter(self, out: list, mode: int, stack: list):
+        out.append("`")
+        stack.append("`")
+        stack.append((self.child, mode, None))
+
+
+class Quote(Node):
+    """
+    引用：去掉内容开头和结尾的一个 BREAK 后，以 BREAK 分行，每行加上 `> `。
+    """
+
+    __slots__ = ("child",)
+
+    def __init__(self, child: Node):
+        super().__init__(False, True, False, True)
+        self.child = child
+
+    def enter(self, out: list, mode: int, stack: list):
+        out.append("> ")
+        stack.append((self, mode, len(out)))
+        stack.append((self.child, QUOTE, None))
+
+    def leave(self, out: list, mode: int, start: int):
+        # 开头（结尾）是 BREAK 时，它就是第一个（最后一个）非空输出
+        if self.child.first == BREAK_EDGE:
+            _clear(out, range(start, len(out)))
+        if self.child.last == BREAK_EDGE:
+            _clear(out, range(len(out) - 1, start - 1, -1))
+
+
+def group(children: list[Node]) -> Node:
+    if not children:
+        return EMPTY
+    if len(children) == 1:
+        return children[0]
+    return Group(children)
+
+
+def render_text(node: Node) -> str:
+    """
+    渲染为纯文本，BREAK 输出为换行。
+    """
+    if type(node) is Text:
+        return node.text
+    out: list = []
+    _render(node, out, NEWLINE)
+    return "".join(out)
+
+
+def render_markdown(node: Node) -> str:
+    """
+    渲染整篇正文：连续的 BREAK 合并为一个空行，并去掉首尾空白。
+    """
+    out: list = []
+    _render(node, out, KEEP)
+    parts = []
+    pending = False
+    for token in out:
+        if token is BREAK:
+            pending = True
+        elif token:
+            if pending:
+                parts.append("\n\n")
+                pending = False
+            parts.append(token)
+    if pending:
+        parts.append("\n\n")
+    return "".join(parts).strip()
+
+
+def iter_render_markdown(nodes: Iterable[Node]) -> Iterator[str]:
+    """
+    render_markdown() 的增量版本：依次渲染各个顶层节点，在空行处分段产出，
+    各段直接拼接后与 render_markdown(group(list(nodes))) 相同（除第一段外，每段以分隔的空行开头）。
+    """
+    parts: list[str] = []
+    pending = False
+    started = False
+    # 暂不产出的末尾空白，后面还有内容时才输出
+    held = ""
+    for node in nodes:
+        for tokens in _iter_render(node):
+            for token in tokens:
+                if token is BREAK:
+                    pending = True
+                elif token:
+                    if pending:
+                        parts.append("\n\n")
+                        pending = False
+                    parts.append(token)
+            if not pending or not parts:
+                continue
+            text = "".join(parts)
+            parts = []
+            if not started:
+                text = text.lstrip()
+                if not text:
+                    continue
+                started = True
+            text = f"{held}{text}"
+            chunk = text.rstrip()
+            held = text[len(chunk) :]
+            if chunk:
+                yield chunk
+    text = "".join(parts)
+    chunk = (f"{held}{text}" if started else text.lstrip()).rstrip()
+    if chunk:
+        yield chunk
+
+
+def _iter_render(node: Node) -> Iterator[list]:
+    # 以 KEEP 方式渲染，每输出一个 BREAK 就产出之前的输出。
+    # BREAK 只在没有 Link / Emphasis / Quote 包围时输出，此时没有等待 leave() 的节点，可以清空 out
+    out: list = []
+    stack: list = [(node, KEEP, None)]
+    while stack:
+        item = stack.pop()
+        if type(item) is not tuple:
+            out.append(item)
+        else:
+            node, mode, start = item
+            if start is None:
+                node.enter(out, mode, stack)
+            else:
+                node.leave(out, mode, start)
+        if out and out[-1] is BREAK:
+            yield out
+            out = []
+    yield out
+
+
+def _render(node: Node, out: list, mode: int):
+    # 栈中的元素为直接输出的字符串（或 BREAK）、(节点, 输出方式, None) 或 (节点, 输出方式, leave() 的 start 参数)
+    stack: list = [(node, mode, None)]
+    while stack:
+        item = stack.pop()
+        if type(item) is not tuple:
+            out.append(item)
+            continue
+        node, mode, start = item
+        if start is None:
+            node.enter(out, mode, stack)
+        else:
+            node.leave(out, mode, start)
+
+
+def _clear(out: list, indexes: range):
+    # 清空 indexes 中第一个非空的输出
+    for i in indexes:
+        if out[i]:
+            out[i] = ""
+            return
@@ -1,12 +1,27 @@
+import asyncio
+import os
+import time
+import uuid
+from collections.abc import AsyncIterator, Generator, Iterable, Iterator, Sequence
+from concurrent.futures import Executor
+from contextlib import contextmanager
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
+from typing import TextIO
 
-from bs4 import BeautifulSoup
-
-from .extractor import Article, ExtractorFactory
+from .assets import AssetLocaliser
+from .extractor import Article, Extractor, ExtractorFactory
+from .gist import GistFetcher, get_gist_cache
+from .html_parser import resolve_parser
+from .http_client import close_async_clients
+from .launch_playwright import close_async_browser_pool
 from .parser import HtmlMarkdownParser
+from .postprocess import PostRuleSet
 from .reader import ReaderFactory
 from .reporter import Reporter
+from .result_cache import get_result_cache
+from .streaming import StreamingMarkdownParser, StreamingUnsupportedError
 from .utils import to_snake_case
 
 
@@ -18,6 +33,8 @@ class ReaderContext:
 @dataclass
 class ExtractorContext:
     article: Article
+    extractor: type[Extractor]
+    post_rules: PostRuleSet
 
 
 @dataclass
@@ -29,16 +46,54 @@ class ParserContext:
 class OmniArticleMarkdown:
     DEFAULT_SAVE_PATH = "./"
 
-    def __init__(self, url_or_path: str, reporter: Reporter | None = None, verify_ssl: bool = True):
+    def __init__(
+        self,
+        url_or_path: str,
+        reporter: Reporter | None = None,
+        verify_ssl: bool = True,
+        use_cache: bool = True,
+        html_parser: str | None = None,
+        streaming: bool = False,
+        offline_gists: bool = False,
+        localisers: Sequence[AssetLocaliser] = (),
+    ):
         self.url_or_path = url_or_path
         self.reporter = reporter
         self.verify_ssl = verify_ssl
+        self.use_cache = use_cache
+        # HTML 解析器，为 None 时使用全局默认值，见 html_parser.set_default_parser()
+        self.html_parser = html_parser
+        # 提取器支持时使用不构建 DOM 树的流式转换，见 streaming.StreamingMarkdownParser
+        self.streaming = streaming
+        # 只从本地缓存读取嵌入的 gist，不访问 GitHub API
+        self.offline_gists = offline_gists
+        # 保存时依次执行，把图片、SVG 等资源保存到 Markdown 文件旁并改写为相对路径，见 assets.AssetLocaliser
+        self.localisers = tuple(localisers)
         self.parser_ctx: ParserContext | None = None
+        # iter_markdown() 产出第一段时确定的标题
+        self.title: str | None = None
+        # 各阶段耗时（秒），键为 read / extract / parse
+        self.timings: dict[str, float] = {}
 
     def parse(self):
         reader_ctx = self._read_html(self.url_or_path)
-        extractor_ctx = self._extract_article(reader_ctx)
-        self.parser_ctx = self._parse_html(extractor_ctx)
+        self.parser_ctx = self._convert(reader_ctx)
+
+    def parse_html(self, raw_html: str):
+        """
+        直接转换已经获取到的 HTML，跳过 Reader 阶段。
+        """
+        self.parser_ctx = self._convert(ReaderContext(raw_html))
+
+    async def aparse(self, executor: Executor | None = None):
+        """
+        parse() 的异步版本。
+        网络读取在事件循环中以原生异步方式进行，CPU 密集的正文提取和 Markdown 转换
+        则交给 executor（默认为事件循环的线程池）执行，避免阻塞事件循环。
+        """
+        reader_ctx = await self._aread_html(self.url_or_path)
+        loop = asyncio.get_running_loop()
+        self.parser_ctx = await loop.run_in_executor(executor, self._convert, reader_ctx)
 
     def result(self):
         if not self.parser_ctx:
@@ -48,29 +103,227 @@ class OmniArticleMarkdown:
     def save(self, save_path: str = "") -> str:
         if not self.parser_ctx:
             raise ValueError("No parsed content to save. Please call parse() first.")
-        save_path = save_path or self.DEFAULT_SAVE_PATH
-        file_path = Path(save_path)
-        if file_path.is_dir():
-            filename = f"{to_snake_case(self.parser_ctx.title)}.md"
-            file_path = file_path / filename
-        with file_path.open("w", encoding="utf-8") as f:
-            f.write(self.parser_ctx.markdown)
+        file_path = self.file_path(save_path)
+        markdown = self.localise(self.parser_ctx.markdown, file_path.parent)
+        with _open_atomic(file_path) as f:
+            f.write(markdown)
+        return str(file_path.resolve())
+
+    def iter_markdown(self) -> Iterator[str]:
+        """
+        parse() 加 result() 的增量版本：读取页面后边转换边逐段产出 Markdown，全部拼接后与 result() 相同，
+        例外见 HtmlMarkdownParser.iter_finish()。第一段为标题和摘要，产出时 self.title 已经确定。
+        命中结果缓存时整篇作为一段产出；增量转换的结果不写入缓存。
+        """
+        ctx = self._read_html(self.url_or_path)
+        html_parser = resolve_parser(self.html_parser)
+        if self.use_cache:
+            variant = f"{html_parser}+stream" if self.streaming else html_parser
+            cached = get_result_cache().get(ctx.raw_html, variant=variant)
+            if cached:
+                self.title = cached[0]
+                yield cached[1]
+                return
+        streamed = self._iter_stream(ctx) if self.streaming else None
+        if streamed:
+            article, chunks = streamed
+        else:
+            extractor_ctx = self._extract_article(ctx, html_parser)
+            article = extractor_ctx.article
+            chunks = HtmlMarkdownParser(article, extractor_ctx.post_rules, self._gist_fetcher()).iter_markdown()
+        header = next(chunks)
+        self.title = article.title
+        yield header
+        yield from chunks
+
+    def save_incremental(self, save_path: str = "") -> str:
+        """
+        边转换边写入文件，见 iter_markdown()。
+        """
+        chunks = self.iter_markdown()
+        header = next(chunks)
+        file_path = self.file_path(save_path)
+        chunks = self.iter_localise(chunks, file_path.parent)
+        with _open_atomic(file_path) as f:
+            f.write(header)
+            for chunk in chunks:
+                f.write(chunk)
         return str(file_path.resolve())
 
+    def localise(self, markdown: str, base_dir: Path | str) -> str:
+        """把 markdown 引用的资源保存到 base_dir 下，返回改写了链接的 Markdown；没有设置 localisers 时原样返回。"""
+        for localiser in self.localisers:
+            markdown = localiser.localise(markdown, base_dir)
+        return markdown
+
+    def iter_localise(self, chunks: Iterable[str], base_dir: Path | str) -> Iterator[str]:
+        for localiser in self.localisers:
+            chunks = localiser.iter_localise(chunks, base_dir)
+        return iter(chunks)
+
+    def file_path(self, save_path: str = "") -> Path:
+        """
+        save() 写入的文件：save_path 为目录时按标题命名，否则即为 save_path 本身。需要在标题确定之后调用。
+        """
+        file_path = Path(save_path or self.DEFAULT_SAVE_PATH)
+        if file_path.is_dir():
+            title = self.parser_ctx.title if self.parser_ctx else self.title
+            file_path = file_path / f"{to_snake_case(title or '')}.md"
+        return file_path
+
+    def _gist_fetcher(self) -> GistFetcher:
+        http_cache = get_gist_cache() if self.use_cache or self.offline_gists else None
+        return GistFetcher(http_cache, self.verify_ssl, offline=self.offline_gists, reporter=self.reporter)
+
+    @contextmanager
+    def _timed(self, phase: str) -> Generator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] = time.perf_counter() - start
+
     def _read_html(self, url_or_path: str) -> ReaderContext:
-        reader = ReaderFactory.create(url_or_path, reporter=self.reporter, verify_ssl=self.verify_ssl)
-        raw_html = reader.read()
+        with self._timed("read"):
+            reader = ReaderFactory.create(
+                url_or_path, reporter=self.reporter, verify_ssl=self.verify_ssl, use_cache=self.use_cache
+            )
+            raw_html = reader.read()
+        return ReaderContext(raw_html)
+
+    async def _aread_html(self, url_or_path: str) -> ReaderContext:
+        with self._timed("read"):
+            reader = ReaderFactory.create(
+                url_or_path, reporter=self.reporter, verify_ssl=self.verify_ssl, use_cache=self.use_cache
+            )
+            raw_html = await reader.aread()
         return ReaderContext(raw_html)
 
-    def _extract_article(self, ctx: ReaderContext) -> ExtractorContext:
-        soup = BeautifulSoup(ctx.raw_html, "html5lib")
-        extract = ExtractorFactory.create(soup)
-        article = extract.extract()
+    def _convert(self, ctx: ReaderContext) -> ParserContext:
+        html_parser = resolve_parser(self.html_parser)
+        # 流式转换的结果与 html.parser 一致，不支持时退回所选解析器，因此单独缓存
+        variant = f"{html_parser}+stream" if self.streaming else html_parser
+        result_cache = get_result_cache() if self.use_cache else None
+        if result_cache:
+            cached = result_cache.get(ctx.raw_html, variant=variant)
+            if cached:
+                return ParserContext(title=cached[0], markdown=cached[1])
+        gists = self._gist_fetcher()
+        streamed = self._stream_html(ctx, gists) if self.streaming else None
+        if streamed:
+            extractor, parser_ctx = streamed
+        else:
+            extractor_ctx = self._extract_article(ctx, html_parser)
+            extractor = extractor_ctx.extractor
+            parser_ctx = self._parse_html(extractor_ctx, gists)
+        # 有 gist 获取失败时不缓存结果，下次转换时重试
+        if result_cache and not gists.failed:
+            result_cache.put(ctx.raw_html, extractor, parser_ctx.title, parser_ctx.markdown, variant=variant)
+        return parser_ctx
+
+    def _stream_html(self, ctx: ReaderContext, gists: GistFetcher) -> tuple[type[Extractor], ParserContext] | None:
+        with self._timed("extract"):
+            extractor = ExtractorFactory.select_from_meta(ctx.raw_html)
+        if extractor is None or not StreamingMarkdownParser.supports(extractor):
+            return None
+        with self._timed("parse"):
+            result = StreamingMarkdownParser(ctx.raw_html, extractor, gists).parse()
+        if result is None:
+            return None
+        return extractor, ParserContext(title=result[0], markdown=result[1])
+
+    def _iter_stream(self, ctx: ReaderContext) -> tuple[Article, Iterator[str]] | None:
+        with self._timed("extract"):
+            extractor = ExtractorFactory.select_from_meta(ctx.raw_html)
+        if extractor is None or not StreamingMarkdownParser.supports(extractor):
+            return None
+        parser = StreamingMarkdownParser(ctx.raw_html, extractor, self._gist_fetcher())
+        chunks = parser.iter_markdown()
+        try:
+            # 找不到正文容器时在产出任何内容之前就会失败，此时退回树解析
+            header = next(chunks)
+        except StreamingUnsupportedError:
+            return None
+        return parser.article, chain((header,), chunks)
+
+    def _extract_article(self, ctx: ReaderContext, html_parser: str) -> ExtractorContext:
+        with self._timed("extract"):
+            extract = ExtractorFactory.create_from_html(ctx.raw_html, html_parser)
+            article = extract.extract()
         if not article:
             raise ValueError("Failed to extract article content.")
-        return ExtractorContext(article)
+        return ExtractorContext(article, type(extract), extract.post_rules())
 
-    def _parse_html(self, ctx: ExtractorContext) -> ParserContext:
-        parser = HtmlMarkdownParser(ctx.article)
-        result = parser.parse()
+    def _parse_html(self, ctx: ExtractorContext, gists: GistFetcher) -> ParserContext:
+        with self._timed("parse"):
+            parser = HtmlMarkdownParser(ctx.article, ctx.post_rules, gists)
+            result = parser.parse()
         return ParserContext(title=result[0], markdown=result[1])
+
+
+async def convert_many(
+    urls: Iterable[str],
+    concurrency: int = 16,
+    reporter: Reporter | None = None,
+    verify_ssl: bool = True,
+    executor: Executor | None = None,
+    use_cache: bool = True,
+    html_parser: str | None = None,
+    streaming: bool = False,
+) -> AsyncIterator[tuple[OmniArticleMarkdown, Exception | None]]:
+    """
+    在同一个事件循环中并发转换多篇文章，按完成顺序逐个产出 (handler, error)。
+    转换成功时 error 为 None，可直接调用 handler.result() 或 handler.save()。
+    同时在途的任务数不超过 concurrency，输入会被按需消费。
+    结束时关闭当前事件循环中的 httpx 客户端和浏览器池，之后的请求会重新创建。
+    """
+    url_iter = iter(urls)
+    pending: set[asyncio.Task[tuple[OmniArticleMarkdown, Exception | None]]] = set()
+
+    async def run(handler: OmniArticleMarkdown) -> tuple[OmniArticleMarkdown, Exception | None]:
+        try:
+            await handler.aparse(executor)
+            return handler, None
+        except Exception as e:
+            return handler, e
+
+    try:
+        while True:
+            while len(pending) < concurrency:
+                url = next(url_iter, None)
+                if url is None:
+                    break
+                handler = OmniArticleMarkdown(
+                    url,
+                    reporter=reporter,
+                    verify_ssl=verify_ssl,
+                    use_cache=use_cache,
+                    html_parser=html_parser,
+                    streaming=streaming,
+                )
+                pending.add(asyncio.create_task(run(handler)))
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        # 客户端和浏览器绑定在事件循环上，asyncio.run() 结束后无法再关闭
+        await close_async_clients()
+        await close_async_browser_pool()
+
+
+@contextmanager
+def _open_atomic(path: Path) -> Generator[TextIO]:
+    # 先写入同目录下的临时文件再替换，其他进程或线程不会读到写了一半的文件，写入失败时保留原文件
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with tmp_path.open("x", encoding="utf-8") as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
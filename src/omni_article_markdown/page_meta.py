@@ -0,0 +1,137 @@
+import re
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from typing import Literal
+
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+
+from .html_parser import iter_raw_text
+from .utils import get_attr_text, get_tag_text
+
+type MatchOp = Literal["eq", "prefix", "suffix", "contains"]
+
+# 以 data-testid 为键的规则匹配页面中出现过的任意一个 data-testid 值
+TESTID_KEY = "data-testid"
+
+# 属性值中可能出现 `>`，需要按引号整体匹配
+_ATTRS = r"""(?:[^>"']|"[^"]*"|'[^']*')*"""
+_META_TAG_PATTERN = re.compile(
+    rf"<(?:meta|link)\b{_ATTRS}>|<title\b[^>]*>.*?</title\s*>|<[a-z][^\s/>]*\s{_ATTRS}?\b{TESTID_KEY}\b{_ATTRS}>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+@dataclass
+class PageMeta:
+    """
+    页面元数据索引，遍历一次文档即可得到提取器匹配所需的全部信息。
+
+    fields 的键为 `title`、`canonical`、`generator` 以及 `<meta property>` 的属性值（如 `og:site_name`），
+    同名标签只记录第一次出现的值，与 `soup.find()` 的结果一致。
+    """
+
+    fields: dict[str, str] = field(default_factory=dict)
+    testids: set[str] = field(default_factory=set)
+
+    @classmethod
+    def from_soup(cls, soup: BeautifulSoup) -> "PageMeta":
+        fields: dict[str, str] = {}
+        testids: set[str] = set()
+        for el in soup.descendants:
+            if not isinstance(el, Tag):
+                continue
+            attrs = el.attrs
+            if TESTID_KEY in attrs:
+                testids.add(get_attr_text(attrs[TESTID_KEY]))
+            name = el.name
+            if name == "meta":
+                prop = attrs.get("property")
+                if isinstance(prop, str) and prop not in fields:
+                    fields[prop] = get_tag_text(el, "content")
+                elif attrs.get("name") == "generator" and "generator" not in fields:
+                    fields["generator"] = get_tag_text(el, "content")
+            elif name == "link":
+                if "canonical" not in fields and "canonical" in get_attr_text(attrs.get("rel")).split():
+                    fields["canonical"] = get_tag_text(el, "href")
+            elif name == "title" and "title" not in fields:
+                fields["title"] = el.get_text(strip=True)
+        return cls(fields=fields, testids=testids)
+
+    @staticmethod
+    def meta_markup(raw_html: str) -> str:
+        """
+        从原始 HTML 中摘出 from_soup() 需要的标签：meta、link、title 以及带 data-testid 的开始标签，
+        跳过注释和 script / style 的内容。解析这段很短的标记即可得到与完整文档相同的 PageMeta。
+        """
+        parts: list[str] = []
+        pos = 0
+        for _, start, _, _, end in iter_raw_text(raw_html):
+            parts.extend(m.group(0) for m in _META_TAG_PATTERN.finditer(raw_html, pos, start))
+            pos = end
+        parts.extend(m.group(0) for m in _META_TAG_PATTERN.finditer(raw_html, pos))
+        return "".join(parts)
+
+    def get(self, key: str) -> str:
+        return self.fields.get(key, "")
+
+    def values(self, key: str) -> Collection[str]:
+        if key == TESTID_KEY:
+            return self.testids
+        value = self.fields.get(key)
+        return (value,) if value else ()
+
+
+@dataclass(frozen=True)
+class MetaRule:
+    """
+    基于页面元数据的匹配规则，例如 `MetaRule("og:site_name", "eq", "Medium")`。
+    """
+
+    key: str
+    op: MatchOp
+    value: str
+
+    def matches(self, meta: PageMeta) -> bool:
+        return any(self.test(v) for v in meta.values(self.key))
+
+    def test(self, value: str) -> bool:
+        match self.op:
+            case "eq":
+                return value == self.value
+            case "prefix":
+                return value.startswith(self.value)
+            case "suffix":
+                return value.endswith(self.value)
+            case "contains":
+                return self.value in value
+
+
+class MetaDispatcher[T]:
+    """
+    把多个目标的匹配规则编译成索引：`eq` 规则通过字典直接查找，其余规则逐条做字符串比较，
+    整个过程不再搜索 DOM 树。
+    """
+
+    def __init__(self):
+        self._eq: dict[tuple[str, str], list[T]] = {}
+        self._eq_keys: set[str] = set()
+        self._others: list[tuple[MetaRule, T]] = []
+
+    def add(self, rule: MetaRule, target: T):
+        if rule.op == "eq":
+            self._eq.setdefault((rule.key, rule.value), []).append(target)
+            self._eq_keys.add(rule.key)
+        else:
+            self._others.append((rule, target))
+
+    def match(self, meta: PageMeta) -> set[T]:
+        """返回规则与页面相符的全部目标。"""
+        matched: set[T] = set()
+        for key in self._eq_keys:
+            for value in meta.values(key):
+                matched.update(self._eq.get((key, value), ()))
+        for rule, target in self._others:
+            if target not in matched and rule.matches(meta):
+                matched.add(target)
+        return matched
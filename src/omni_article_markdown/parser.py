@@ -1,37 +1,40 @@
 import base64
-import re
-from collections.abc import Callable
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
 from urllib.parse import urljoin
 
-from bs4.element import NavigableString, Tag
+from bs4.element import AttributeValueWithCharsetSubstitution, CData, NavigableString, PageElement, Tag
 
+from .code_language import detect_language
 from .extractor import Article
-from .http_client import get_session
+from .gist import GistFetcher, get_gist_cache, parse_gist_src
+from .markdown_ir import (
+    BREAK,
+    EMPTY,
+    Block,
+    Emphasis,
+    Heading,
+    InlineCode,
+    Link,
+    Node,
+    Quote,
+    Text,
+    group,
+    iter_render_markdown,
+    render_markdown,
+    render_text,
+)
+from .postprocess import DEFAULT_POST_RULES, PostRuleSet
 from .utils import (
     collapse_spaces,
-    detect_language,
+    contains_words,
     filter_tag,
     get_attr_text,
     is_sequentially_increasing,
-    move_spaces,
 )
 
-LB_SYMBOL = "[|lb_bl|]"
-
-POST_HANDLERS: list[Callable[[str], str]] = [
-    # 添加换行使文章更美观
-    lambda el: re.sub(f"(?:{re.escape(LB_SYMBOL)})+", LB_SYMBOL, el).replace(LB_SYMBOL, "\n\n").strip(),
-    # 纠正不规范格式 `**code**` 替换为 **`code`**
-    lambda el: re.sub(r"`\*\*(.*?)\*\*`", r"**`\1`**", el),
-    # 纠正不规范格式 `*code*` 替换为 *`code`*
-    lambda el: re.sub(r"`\*(.*?)\*`", r"*`\1`*", el),
-    # 纠正不规范格式 `[code](url)` 替换为 [`code`](url)
-    lambda el: re.sub(r"`\s*\[([^\]]+)\]\(([^)]+)\)\s*`", r"[`\1`](\2)", el),
-    # 将 \( ... \) 替换为 $ ... $
-    lambda el: re.sub(r"\\\((.+?)\\\)", r"$\1$", el),
-    # 将 \[ ... \] 替换为 $$ ... $$
-    lambda el: re.sub(r"\\\[(.+?)\\\]", r"$$\1$$", el),
-]
+# 转换逻辑发生变化时递增，使结果缓存中的所有条目失效
+PARSER_VERSION = 4
 
 INLINE_ELEMENTS = ["span", "code", "li", "a", "strong", "em", "b", "i", "sup"]
 
@@ -60,16 +63,68 @@ TRUSTED_ELEMENTS = INLINE_ELEMENTS + BLOCK_ELEMENTS
 
 
 class HtmlMarkdownParser:
-    def __init__(self, article: Article):
+    def __init__(
+        self, article: Article, post_rules: PostRuleSet = DEFAULT_POST_RULES, gists: GistFetcher | None = None
+    ):
         self.article = article
+        self.post_rules = post_rules
+        # 为 None 时在遇到第一个 gist 时创建，使用全局的 gist 缓存
+        self.gists = gists
 
     def parse(self) -> tuple[str, str]:
         if isinstance(self.article.body, str):
-            markdown = self.article.body
+            body: Node = Text(self.article.body)
         else:
-            markdown = self._process_children(self.article.body)
-        for handler in POST_HANDLERS:
-            markdown = handler(markdown)
+            self.prefetch_gists(_script_srcs(self.article.body))
+            body = self._process_children(self.article.body)
+        return self.finish(render_markdown(body))
+
+    def iter_markdown(self) -> Iterator[str]:
+        """
+        parse() 的增量版本：逐个转换正文的直接子节点，边渲染边逐段产出，全部拼接后与 parse()[1] 相同，
+        例外见 iter_finish()。
+        """
+        body = self.article.body
+        if isinstance(body, str):
+            nodes: Iterable[Node] = [Text(body)]
+            text = body
+        else:
+            self.prefetch_gists(_script_srcs(body))
+            # 每个子节点单独放进一个 _CHILDREN 栈帧，取舍规则与 _process_children() 相同
+            nodes = (self._convert(_Frame(_CHILDREN, body, 0, False, iter((child,)))) for child in body.contents)
+            text = _source_text(body)
+        description = self.article.description
+        may_describe = bool(description and contains_words(f"{text} {self.article.url}", description))
+        yield from self.iter_finish(iter_render_markdown(nodes), may_describe)
+
+    def iter_finish(self, chunks: Iterable[str], may_describe: bool = True) -> Iterator[str]:
+        """
+        finish() 的增量版本，chunks 为 iter_render_markdown() 的输出：先产出标题和摘要，再逐段产出做过后处理的正文。
+        后处理规则对每段单独执行，跨越空行的匹配不会被替换。
+        摘要可能出现在正文中时（may_describe），先缓存正文直到找到摘要或正文结束，才能决定是否输出摘要。
+        """
+        description = self.article.description
+        processed = (self.post_rules.apply(chunk) for chunk in chunks)
+        buffered = []
+        if description and may_describe:
+            tail = ""
+            for chunk in processed:
+                buffered.append(chunk)
+                window = f"{tail}{chunk}"
+                if description in window:
+                    description = ""
+                    break
+                tail = window[-len(description) :]
+        description = f"> {description}\n\n" if description else ""
+        yield f"# {self.article.title}\n\n{description}"
+        yield from buffered
+        yield from processed
+
+    def finish(self, markdown: str) -> tuple[str, str]:
+        """
+        对渲染后的正文做后处理，并加上标题和摘要。
+        """
+        markdown = self.post_rules.apply(markdown)
         if not self.article.description or self.article.description in markdown:
             description = ""
         else:
@@ -78,52 +133,38 @@ class HtmlMarkdownParser:
         # print(result)
         return (self.article.title, result)
 
-    def _process_element(self, element: Tag, level: int = 0, is_pre: bool = False) -> str:
-        parts = []
+    def _process_element(self, element: Tag, level: int = 0, is_pre: bool = False) -> Node:
+        start = self._start_element(element, level, is_pre)
+        return self._convert(start) if isinstance(start, _Frame) else start
+
+    def _process_children(self, element: Tag, level: int = 0, is_pre: bool = False) -> Node:
+        return self._convert(_Frame(_CHILDREN, element, level, is_pre, iter(element.contents)))
+
+    def _start_element(self, element: Tag, level: int, is_pre: bool) -> "Node | _Frame":
+        """
+        不需要转换子节点的元素直接返回转换结果，否则返回一个待处理的栈帧，由 _convert() 处理其子节点后调用 _finish()。
+        """
+        result: Node = EMPTY
         tag = element.name
         match tag:
             case "br":
-                parts.append(LB_SYMBOL)
+                result = BREAK
             case "hr":
-                parts.append("---")
-            case "h1" | "h2" | "h3" | "h4" | "h5" | "h6":
-                heading = self._process_children(element, level, is_pre=is_pre)
-                parts.append(f"{'#' * int(element.name[1])} {heading}")
+                result = Text("---")
             case "sup":
                 sup = element.get_text(strip=True)
                 if sup:
-                    parts.append(f"<sup>{sup}</sup>")
-            case "a":
-                link_text = self._process_children(element, level, is_pre=is_pre).replace(LB_SYMBOL, "")
-                if link_text:
-                    parts.append(self._process_link(element, link_text))
-            case "strong" | "b":
-                s = self._process_children(element, level, is_pre=is_pre).replace(LB_SYMBOL, "")
-                if s:
-                    parts.append(move_spaces(f"**{s}**", "**"))
-            case "em" | "i":
-                s = self._process_children(element, level, is_pre=is_pre).replace(LB_SYMBOL, "")
-                if s:
-                    parts.append(move_spaces(f"*{s}*", "*"))
+                    result = Text(f"<sup>{sup}</sup>")
             case "ul" | "ol":
-                parts.append(self._process_list(element, level))
+                return _Frame(_LIST, element, level, is_pre, iter(enumerate(element.find_all(recursive=False))))
             case "img":
-                parts.append(self._process_image(element, None))
-            case "blockquote":
-                blockquote = self._process_children(element, level, is_pre=is_pre)
-                if blockquote.startswith(LB_SYMBOL):
-                    blockquote = blockquote.removeprefix(LB_SYMBOL)
-                if blockquote.endswith(LB_SYMBOL):
-                    blockquote = blockquote.removesuffix(LB_SYMBOL)
-                parts.append("\n".join(f"> {line}" for line in blockquote.split(LB_SYMBOL)))
+                result = self._process_image(element, None)
             case "pre":
-                parts.append(self._process_codeblock(element, level))
-            case "code":  # inner code
-                code = self._process_children(element, level, is_pre=is_pre)
-                if LB_SYMBOL not in code:
-                    parts.append(f"`{code}`")
-                else:
-                    parts.append(code)
+                # 找出所有 code 标签（可能为 0 个、1 个或多个）
+                code_elements = element.find_all("code") or [element]
+                frame = _Frame(_CODE, element, level, is_pre, iter(code_elements))
+                frame.first_code = code_elements[0]
+                return frame
             case "picture":
                 source_elements = element.find_all("source")
                 img_element = filter_tag(element.find("img"))
@@ -131,90 +172,168 @@ class HtmlMarkdownParser:
                     el = source_elements[0]
                     src_el = filter_tag(el)
                     if src_el:
-                        parts.append(self._process_image(img_element, src_el))
+                        result = self._process_image(img_element, src_el)
                 elif img_element:
-                    parts.append(self._process_image(img_element, None))
-            case "figcaption":
-                figcaption = self._process_children(element, level, is_pre=is_pre).replace(LB_SYMBOL, "\n").strip()
-                figcaptions = figcaption.replace("\n\n", "\n").split("\n")
-                parts.append("\n".join([f"*{caption}*" for caption in figcaptions]))
+                    result = self._process_image(img_element, None)
             case "table":
-                parts.append(self._process_table(element, level))
+                table = self._process_table(element)
+                if table is None:
+                    return _Frame(_TABLE, element, level, False, iter(element.contents))
+                result = table
             case "math":  # 处理latex公式
                 semantics = filter_tag(element.find("semantics"))
                 if semantics:
                     tex = filter_tag(semantics.find(attrs={"encoding": "application/x-tex"}))
                     if tex:
-                        parts.append(f"$$ {tex.text} $$")
+                        result = Text(f"$$ {tex.text} $$")
             case "script":  # 处理github gist
-                parts.append(self._process_gist(element))
+                result = Text(self._process_gist(element))
             case "svg":  # 处理svg图片
                 if element.get("data-id") == "omnimd":
-                    parts.append(self._process_svg(element))
+                    result = Text(self._process_svg(element))
             case _:
-                parts.append(self._process_children(element, level, is_pre=is_pre))
-        result = "".join(parts)
-        if result and is_block_element(element.name) and (not element.children or not is_pure_block_children(element)):
-            result = f"{LB_SYMBOL}{result}{LB_SYMBOL}"
+                return _Frame(_ELEMENT, element, level, is_pre, iter(element.contents))
+        return self.wrap_block(tag, result, is_pure_block_children(element))
+
+    def _convert(self, root: "_Frame") -> Node:
+        """
+        用显式栈代替递归遍历 root 的子树，DOM 嵌套再深也只占用固定的 Python 调用栈。
+        """
+        stack = [root]
+        while True:
+            frame = stack[-1]
+            parts = frame.parts
+            sub: Node | _Frame
+            if frame.kind == _LIST:
+                for i, child in frame.items:
+                    child = filter_tag(child)
+                    if child:
+                        if child.name == "li":
+                            sub = _Frame(_CHILDREN, child, frame.level, False, iter(child.contents))
+                        elif child.name == "ul" or child.name == "ol":
+                            sub = self._start_element(child, frame.level + 1, False)
+                        else:
+                            continue  # 忽略其他元素
+                        if isinstance(sub, _Frame):
+                            sub.index = i
+                            stack.append(sub)
+                            break
+                        self._add_result(frame, i, child.name, sub)
+                else:
+                    frame.done = True
+            elif frame.kind == _CODE:
+                for code_el in frame.items:
+                    if isinstance(code_el, Tag):
+                        stack.append(_Frame(_CHILDREN, code_el, frame.level, True, iter(code_el.contents)))
+                        break
+                else:
+                    frame.done = True
+            else:
+                is_pre = frame.is_pre
+                for child in frame.items:
+                    if isinstance(child, NavigableString):
+                        if is_pre:
+                            parts.append(Text(child))
+                        else:
+                            text = collapse_spaces(child).replace("<", "&lt;").replace(">", "&gt;")
+                            if text.strip():
+                                parts.append(Text(text))
+                    elif isinstance(child, Tag):
+                        sub = self._start_element(child, frame.level, is_pre)
+                        if isinstance(sub, _Frame):
+                            stack.append(sub)
+                            break
+                        if is_pre or not sub.is_blank:
+                            parts.append(sub)
+                else:
+                    frame.done = True
+            if frame.done:
+                # 子节点已全部处理
+                stack.pop()
+                result = self._finish(frame)
+                if not stack:
+                    return result
+                parent = stack[-1]
+                if parent.kind == _LIST or parent.kind == _CODE:
+                    self._add_result(parent, frame.index, frame.element.name, result)
+                elif parent.is_pre or not result.is_blank:
+                    parent.parts.append(result)
+
+    def _finish(self, frame: "_Frame") -> Node:
+        element = frame.element
+        name = element.name
+        kind = frame.kind
+        if kind == _CHILDREN:
+            return group(frame.parts)
+        if kind == _ELEMENT:
+            result = self.format_content(name, element.attrs, group(frame.parts))
+        elif kind == _TABLE:
+            result = group(frame.parts)
+        elif kind == _LIST:
+            result = Text("\n".join(frame.parts))  # 所有内容都为空则为空字符串
+        else:
+            result = Text(self._format_codeblock(frame.first_code, frame.parts))
+        return self.wrap_block(name, result, is_pure_block_children(element))
+
+    def _add_result(self, frame: "_Frame", index: int, name: str, result: Node):
+        # 把列表项（index 和 name 为其在列表中的位置和标签名）或 code 标签的转换结果加入 ul / ol / pre 的栈帧
+        if frame.kind == _LIST:
+            entry = self.format_list_entry(frame.element.name == "ol", index, frame.level, name, result)
+            if entry:  # 忽略空内容
+                frame.parts.append(entry)
+        else:
+            frame.parts.append(render_text(result))
+
+    def format_content(self, name: str, attrs: Mapping[str, Any], content: Node) -> Node:
+        """
+        只依赖子节点转换结果的元素：根据标签名和属性把子节点的转换结果组装成该元素的节点。
+        """
+        match name:
+            case "h1" | "h2" | "h3" | "h4" | "h5" | "h6":
+                return Heading(int(name[1]), content)
+            case "a":
+                return self.format_link(get_attr_text(attrs.get("href")), content) if content.has_text else EMPTY
+            case "strong" | "b":
+                return Emphasis("**", content) if content.has_text else EMPTY
+            case "em" | "i":
+                return Emphasis("*", content) if content.has_text else EMPTY
+            case "blockquote":
+                return Quote(content)
+            case "code":  # inner code
+                return InlineCode(content) if not content.has_break else content
+            case "figcaption":
+                figcaption = render_text(content).strip()
+                figcaptions = figcaption.replace("\n\n", "\n").split("\n")
+                return Text("\n".join([f"*{caption}*" for caption in figcaptions]))
+            case _:
+                return content
+
+    def wrap_block(self, name: str, result: Node, pure_block_children: bool) -> Node:
+        # 块级元素前后加换行，子节点全部为块级元素时由子节点负责换行
+        if not pure_block_children and is_block_element(name) and not result.is_empty:
+            return Block(result)
         return result
 
-    def _process_children(self, element: Tag, level: int = 0, is_pre: bool = False) -> str:
-        parts = []
-        if element.children:
-            # new_level = level + 1 if element.name in HtmlMarkdownParser.TRUSTED_ELEMENTS else level
-            for child in element.children:
-                if isinstance(child, NavigableString):
-                    if is_pre:
-                        parts.append(child)
-                    else:
-                        result = collapse_spaces(child).replace("<", "&lt;").replace(">", "&gt;")
-                        if result.strip():
-                            parts.append(result)
-                        # print(element.name, level, result)
-                elif isinstance(child, Tag):
-                    result = self._process_element(child, level, is_pre=is_pre)
-                    if is_pre or result.strip():
-                        parts.append(result)
-        return "".join(parts) if is_pre or level > 0 else "".join(parts)
-
-    def _process_list(self, element: Tag, level: int) -> str:
-        indent = "  " * level
-        child_list = element.find_all(recursive=False)
-        is_ol = element.name == "ol"
-        parts = []
-        for i, child in enumerate(child_list):
-            child = filter_tag(child)
-            if child:
-                if child.name == "li":
-                    content = self._process_children(child, level).replace(LB_SYMBOL, "\n").strip()
-                    if content:  # 忽略空内容
-                        prefix = f"{i + 1}." if is_ol else "-"
-                        parts.append(f"{indent}{prefix} {content}")
-                elif child.name == "ul" or child.name == "ol":
-                    content = self._process_element(child, level + 1)
-                    if content:  # 忽略空内容
-                        parts.append(f"{content.replace(LB_SYMBOL, '\n')}")
-        if not parts:
-            return ""  # 所有内容都为空则返回空字符串
-        return "\n".join(parts)
-
-    def _process_codeblock(self, element: Tag, level: int) -> str:
-        # 找出所有 code 标签（可能为 0 个、1 个或多个）
-        code_elements = element.find_all("code") or [element]
-
-        # 处理每一个 code 标签并拼接
-        code_parts = [
-            self._process_children(code_el, level, is_pre=True).replace(LB_SYMBOL, "\n")
-            for code_el in code_elements
-            if isinstance(code_el, Tag)
-        ]
+    def format_list_entry(self, is_ol: bool, index: int, level: int, name: str, content: Node) -> str:
+        """
+        列表中第 index 个直接子元素（li 或嵌套的 ul / ol）对应的 Markdown，content 为其转换结果。
+        """
+        text = render_text(content)
+        if name == "li":
+            text = text.strip()
+            if not text:
+                return ""
+            prefix = f"{index + 1}." if is_ol else "-"
+            return f"{'  ' * level}{prefix} {text}"
+        return text
+
+    def _format_codeblock(self, first_code_el: Any, code_parts: list[str]) -> str:
         code = "\n".join(code_parts).strip()
 
         if is_sequentially_increasing(code):
             return ""  # 忽略行号
 
         # 尝试提取语言：从第一个 code 标签的 class 中提取 language
-        first_code_el = code_elements[0]
         language = (
             next((cls.split("-")[1] for cls in (first_code_el.get("class") or []) if cls.startswith("language-")), "")
             if isinstance(first_code_el, Tag)
@@ -224,82 +343,76 @@ class HtmlMarkdownParser:
             language = detect_language(None, code)
         return f"```{language}\n{code}\n```" if language else f"```\n{code}\n```"
 
-    def _process_table(self, element: Tag, level: int) -> str:
-        if element.find("pre"):
-            return self._process_children(element, level)
-        # 获取所有行，包括 thead 和 tbody
-        rows = element.find_all("tr")
+    def _process_table(self, element: Tag) -> Node | None:
+        """
+        第一行作为表头，rowspan / colspan 展开为多个内容相同的单元格，列数不足的行在末尾补空单元格。
+        包含代码块时返回 None，按一般内容处理。
+        """
+        rows = _table_rows(element)
+        if rows is None:
+            return None
         if not rows:
-            return ""
-        # 解析表头（如果有）
-        headers = []
-        first_row = filter_tag(rows.pop(0))
-        if first_row and first_row.find("th"):
-            headers = [th.get_text(strip=True) for th in first_row.find_all("th")]
-        # 解析表身
-        body = [[td.get_text(strip=True) for td in row.find_all("td")] for row in rows if isinstance(row, Tag)]
-        # 处理缺失的表头
-        if not headers and body:
-            headers = body.pop(0)
-        # 统一列数
-        col_count = max(len(headers), max((len(row) for row in body), default=0))
-        headers += [""] * (col_count - len(headers))
-        for row in body:
-            row += [""] * (col_count - len(row))
-        # 生成 Markdown 表格
-        markdown_table = []
-        markdown_table.append("| " + " | ".join(headers) + " |")
-        markdown_table.append("|-" + "-|-".join(["-" * len(h) for h in headers]) + "-|")
-        for row in body:
-            markdown_table.append("| " + " | ".join(row) + " |")
-        return "\n".join(markdown_table)
-
-    def _process_image(self, element: Tag, source: Tag | None) -> str:
+            return EMPTY
+        grid = _expand_spans(rows)
+        col_count = max(len(row) for row in grid)
+        headers = grid[0]
+        dashes = ["-" * len(h) for h in headers]
+        markdown_table = [
+            f"| {_join_cells(headers, col_count, ' | ')} |",
+            f"|-{_join_cells(dashes, col_count, '-|-')}-|",
+        ]
+        markdown_table.extend(f"| {_join_cells(row, col_count, ' | ')} |" for row in grid[1:])
+        return Text("\n".join(markdown_table))
+
+    def _process_image(self, element: Tag, source: Tag | None) -> Node:
         src = (
             get_attr_text(element.attrs.get("src"))
             if source is None
             else get_attr_text(source.attrs.get("srcset")).split()[0]
         )
-        alt = get_attr_text(element.attrs.get("alt"))
+        return self.format_image(src, get_attr_text(element.attrs.get("alt")))
+
+    def format_image(self, src: str, alt: str) -> Node:
         if src:
             if not src.startswith("http") and self.article.url:
                 src = urljoin(self.article.url, src)
-            return f"![{alt}]({src})"
-        return ""
+            return Text(f"![{alt}]({src})")
+        return EMPTY
 
-    def _process_link(self, element: Tag, link_text: str) -> str:
-        link = get_attr_text(element.get("href"))
-        if link:
-            if self.article.url and not link.startswith("http"):
-                link = urljoin(self.article.url, link)
-            return f"[{link_text}]({link})"
-        return link_text
+    def format_link(self, link: str, link_text: Node) -> Node:
+        if link and self.article.url and not link.startswith("http"):
+            link = urljoin(self.article.url, link)
+        return Link(link, link_text)
 
     def _process_svg(self, element: Tag) -> str:
-        svg_content = str(element)
+        svg_content = _svg_markup(element)
         if svg_content:
             return f"![](data:image/svg+xml;base64,{base64.b64encode(svg_content.encode()).decode()})"
         return ""
 
     def _process_gist(self, element: Tag) -> str:
-        src = get_attr_text(element.attrs.get("src"))
-        pattern = r"/([0-9a-f]+)(?:\.js)?$"
-        match = re.search(pattern, src)
-        if match:
-            gist_id = match.group(1)
-            url = f"https://api.github.com/gists/{gist_id}"
-            response = get_session().get(url)
-            response.encoding = "utf-8"
-            if response.status_code == 200:
-                data = response.json()
-                gists = []
-                for filename, info in data["files"].items():
-                    code = info["content"]
-                    language = detect_language(filename, code)
-                    gists.append(f"```{language}\n{code}\n```")
-                return "\n\n".join(gists)
-            print(f"Fetch gist error: {response.status_code}")
-        return ""
+        ref = parse_gist_src(get_attr_text(element.attrs.get("src")))
+        if ref is None:
+            return ""
+        files = self.gist_fetcher().files(ref)
+        return "\n\n".join(f"```{detect_language(name, code)}\n{code}\n```" for name, code in files.items())
+
+    def gist_fetcher(self) -> GistFetcher:
+        if self.gists is None:
+            self.gists = GistFetcher(get_gist_cache())
+        return self.gists
+
+    def prefetch_gists(self, srcs: Iterable[str]):
+        """
+        转换之前并发获取文章中嵌入的所有 gist，避免在转换过程中逐个串行请求。
+        """
+        refs = [ref for ref in map(parse_gist_src, srcs) if ref]
+        if refs:
+            self.gist_fetcher().prefetch(refs)
+
+
+def _script_srcs(element: Tag) -> list[str]:
+    return [get_attr_text(script.attrs.get("src")) for script in element.find_all("script", src=True)]
 
 
 def is_block_element(element_name: str) -> bool:
@@ -314,3 +427,198 @@ def is_pure_block_children(element: Tag) -> bool:
         elif isinstance(child, Tag) and not is_block_element(child.name):
             return False
     return True
+
+
+# 栈帧的类型，决定子节点处理完后如何组装
+_CHILDREN = 0  # 只拼接子节点
+_ELEMENT = 1  # 一般元素，交给 format_content()
+_TABLE = 2  # 包含代码块的表格，按一般内容处理
+_LIST = 3  # ul / ol，逐个处理 li 和嵌套的列表
+_CODE = 4  # pre，逐个处理其中的 code
+
+
+# 与 Tag.get_text() 默认取用的字符串类型一致
+_TEXT_TYPES = (NavigableString, CData)
+# 与浏览器一致的 colspan / rowspan 上限，避免异常的属性值展开出巨大的表格
+_MAX_COLSPAN = 1000
+_MAX_ROWSPAN = 65534
+
+
+def _table_rows(table: Tag) -> list[list[tuple[str, int, int]]] | None:
+    """
+    一次遍历收集表格中每一行的单元格 (文字, rowspan, colspan)，文字与 get_text(strip=True) 相同。
+    嵌套在单元格中的表格只作为单元格的文字；包含 pre 时返回 None。
+    """
+    rows: list[list[tuple[str, int, int]]] = []
+    stack = [iter(table.contents)]
+    while stack:
+        for child in stack[-1]:
+            if not isinstance(child, Tag):
+                continue
+            name = child.name
+            if name == "pre":
+                return None
+            if name == "tr":
+                rows.append([])
+            elif (name == "td" or name == "th") and rows:
+                parts = []
+                for el in child.descendants:
+                    if isinstance(el, Tag):
+                        if el.name == "pre":
+                            return None
+                    elif isinstance(el, NavigableString) and type(el) in _TEXT_TYPES:
+                        text = el.strip()
+                        if text:
+                            parts.append(text)
+                attrs = child.attrs
+                rowspan = _span(attrs["rowspan"], _MAX_ROWSPAN) if "rowspan" in attrs else 1
+                colspan = _span(attrs["colspan"], _MAX_COLSPAN) if "colspan" in attrs else 1
+                rows[-1].append(("".join(parts), rowspan, colspan))
+                continue
+            stack.append(iter(child.contents))
+            break
+        else:
+            stack.pop()
+    return rows
+
+
+def _span(value: Any, limit: int) -> int:
+    try:
+        return min(max(int(get_attr_text(value)), 1), limit)
+    except ValueError:
+        return 1
+
+
+def _expand_spans(rows: list[list[tuple[str, int, int]]]) -> list[list[str]]:
+    grid: list[list[str]] = []
+    # 每一列被上方 rowspan 占据时的 [文字, 剩余行数]
+    above: list[list | None] = []
+    for cells in rows:
+        row: list[str] = []
+        col = 0
+        for text, rowspan, colspan in cells:
+            col = _fill_above(row, above, col, None)
+            for _ in range(colspan):
+                row.append(text)
+                if rowspan > 1:
+                    if col >= len(above):
+                        above.extend([None] * (col + 1 - len(above)))
+                    above[col] = [text, rowspan - 1]
+                col += 1
+        _fill_above(row, above, col, len(above))
+        grid.append(row)
+    return grid
+
+
+def _fill_above(row: list[str], above: list, col: int, end: int | None) -> int:
+    # 从 col 开始填入上方 rowspan 延续下来的单元格，end 为 None 时遇到空位即停止，否则一直填到 end（中间的空位补空字符串）
+    stop = len(above) if end is None else end
+    while col < stop:
+        span = above[col]
+        if span is None:
+            if end is None:
+                break
+            # 只有后面还有被占据的列时才需要补空位
+            if not any(above[col:]):
+                break
+            row.append("")
+        else:
+            row.append(span[0])
+            span[1] -= 1
+            if not span[1]:
+                above[col] = None
+        col += 1
+    return col
+
+
+def _join_cells(cells: list[str], col_count: int, sep: str) -> str:
+    # 等价于 sep.join(cells + [""] * 缺少的列数)，不复制 cells
+    missing = col_count - len(cells)
+    if not missing:
+        return sep.join(cells)
+    if not cells:
+        return sep * (missing - 1)
+    return f"{sep.join(cells)}{sep * missing}"
+
+
+def _source_text(element: Tag) -> str:
+    # 转换结果中的文字都来自这些字符串和属性值（get_text() 不含 rt、template 等类型的字符串）。
+    # 相邻的字符串在结果中可能直接相连，因此不加分隔；属性值单独放在后面
+    strings: list[str] = []
+    values: list[str] = []
+    for el in element.descendants:
+        if isinstance(el, NavigableString):
+            strings.append(el)
+        elif isinstance(el, Tag) and el.attrs:
+            values.extend(str(value) for value in el.attrs.values())
+    return f"{''.join(strings)} {' '.join(values)}"
+
+
+def _svg_markup(element: Tag) -> str:
+    """
+    与 str(element) 的结果相同（minimal formatter），但不经过 BeautifulSoup 通用的事件流和 Formatter，
+    插图较多的文章中序列化 SVG 占了转换的大部分时间。
+    """
+    parts: list[str] = []
+    # 弹出的普通 str 是结束标签，其余为待输出的节点
+    stack: list[PageElement | str] = [element]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Tag):
+            name = f"{node.prefix}:{node.name}" if node.prefix else node.name
+            if not node.hidden:
+                attrs = "".join(_format_attr(key, value) for key, value in sorted(node.attrs.items()))
+                parts.append(f"<{name}{attrs}/>" if node.is_empty_element else f"<{name}{attrs}>")
+            if not node.is_empty_element:
+                stack.append("" if node.hidden else f"</{name}>")
+                stack.extend(reversed(node.contents))
+        elif type(node) is NavigableString:
+            parent = node.parent
+            parts.append(node if parent is not None and parent.name in _CDATA_CONTAINING else _escape_xml(node))
+        elif isinstance(node, NavigableString):
+            parts.append(node.output_ready("minimal"))
+        elif isinstance(node, str):
+            parts.append(node)
+    return "".join(parts)
+
+
+_CDATA_CONTAINING = frozenset(("script", "style"))
+
+
+def _escape_xml(text: str) -> str:
+    if "&" in text or "<" in text or ">" in text:
+        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return text
+
+
+def _format_attr(key: str, value: Any) -> str:
+    if value is None:
+        return f" {key}"
+    if isinstance(value, list | tuple):
+        value = " ".join(value)
+    elif isinstance(value, AttributeValueWithCharsetSubstitution):
+        value = value.substitute_encoding("utf-8")
+    elif not isinstance(value, str):
+        value = str(value)
+    value = _escape_xml(value)
+    # 引号的选择与 EntitySubstitution.quoted_attribute_value() 相同
+    if '"' not in value:
+        return f' {key}="{value}"'
+    if "'" not in value:
+        return f" {key}='{value}'"
+    return ' {}="{}"'.format(key, value.replace('"', "&quot;"))
+
+
+class _Frame:
+    __slots__ = ("kind", "element", "level", "is_pre", "items", "done", "parts", "index", "first_code")
+
+    def __init__(self, kind: int, element: Tag, level: int, is_pre: bool, items: Iterator):
+        self.kind = kind
+        self.element = element
+        self.level = level
+        self.is_pre = is_pre
+        self.items = items  # 待处理的子节点
+        self.done = False  # 子节点是否已全部处理
+        self.parts: list = []
+        self.index = 0  # 作为列表项时在父列表中的位置
+        self.first_code: Tag | None = None  # pre 中的第一个 code 标签
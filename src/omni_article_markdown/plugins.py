@@ -1,32 +1,66 @@
 import importlib
 import pkgutil
+from collections.abc import Iterator
+from functools import cache
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 
-def load_plugins[T](base_class: type[T], package_name: str, *args: Any, **kwargs: Any) -> list[T]:
+def import_plugin_modules(package_name: str) -> list[ModuleType]:
     """
-    通用插件加载器
-    :param base_class: 插件必须继承的基类 (如 Extractor 或 Reader)
+    导入子包下的所有插件模块
     :param package_name: 存放插件的子包名 (如 "extractors")
-    :param args/kwargs: 实例化插件类时透传的参数
     """
     package_path = Path(__file__).parent / package_name
-    plugins = []
-
-    # 遍历子包下的所有模块
+    modules = []
     for _, module_name, _ in pkgutil.iter_modules([str(package_path.resolve())]):
-        # 动态导入模块
         full_module_name = f"omni_article_markdown.{package_name}.{module_name}"
-        module = importlib.import_module(full_module_name)
+        modules.append(importlib.import_module(full_module_name))
+    return modules
+
 
-        # 遍历模块中的所有属性
+@cache
+def plugin_classes[T](base_class: type[T], package_name: str) -> tuple[type[T], ...]:
+    """
+    插件类注册表：每个子包只扫描一次，结果在进程内复用。
+
+    只收录在插件模块中定义的类（被其他模块导入的类不会重复收录），并按
+    PRIORITY（越大越靠前）、模块名、类名排序，保证匹配顺序稳定。
+    """
+    classes: list[tuple[int, str, str, type[T]]] = []
+    for module in import_plugin_modules(package_name):
         for attr_name in dir(module):
             cls = getattr(module, attr_name)
+            if (
+                isinstance(cls, type)
+                and issubclass(cls, base_class)
+                and cls is not base_class
+                and cls.__module__ == module.__name__
+            ):
+                classes.append((-getattr(cls, "PRIORITY", 0), module.__name__, attr_name, cls))
+    classes.sort(key=lambda item: item[:3])
+    return tuple(item[3] for item in classes)
 
-            # 校验逻辑：是类、继承自基类、且不是基类本身
-            if isinstance(cls, type) and issubclass(cls, base_class) and cls is not base_class:
-                # 实例化并传入参数
-                plugins.append(cls(*args, **kwargs))
 
-    return plugins
+def iter_plugins[T](base_class: type[T], package_name: str, *args: Any, **kwargs: Any) -> Iterator[T]:
+    """
+    按注册表顺序逐个实例化插件，调用方找到匹配的插件后即可停止迭代。
+    :param base_class: 插件必须继承的基类 (如 Extractor 或 Reader)
+    :param package_name: 存放插件的子包名 (如 "extractors")
+    :param args/kwargs: 实例化插件类时透传的参数
+    """
+    # mypy 无法确认泛型的 type[T] 满足 functools.cache 要求的 Hashable
+    base: type = base_class
+    for cls in plugin_classes(base, package_name):
+        yield cls(*args, **kwargs)
+
+
+def load_plugins[T](base_class: type[T], package_name: str, *args: Any, **kwargs: Any) -> list[T]:
+    """
+    通用插件加载器，一次性实例化所有插件
+    :param base_class: 插件必须继承的基类 (如 Extractor 或 Reader)
+    :param package_name: 存放插件的子包名 (如 "extractors")
+    :param args/kwargs: 实例化插件类时透传的参数
+    """
+    return list(iter_plugins(base_class, package_name, *args, **kwargs))
@@ -0,0 +1,54 @@
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+type Replacement = str | Callable[[re.Match[str]], str]
+
+
+@dataclass(frozen=True)
+class PostRule:
+    """
+    对渲染后的正文做的一次正则替换，pattern 与 repl 的含义同 re.sub()。
+    规则按顺序执行，后面的规则看到的是前面规则替换后的结果。
+    """
+
+    pattern: str
+    repl: Replacement
+    flags: int = 0
+
+
+POST_RULES: tuple[PostRule, ...] = (
+    # 纠正不规范格式 `**code**` 替换为 **`code`**
+    PostRule(r"`\*\*(.*?)\*\*`", r"**`\1`**"),
+    # 纠正不规范格式 `*code*` 替换为 *`code`*
+    PostRule(r"`\*(.*?)\*`", r"*`\1`*"),
+    # 纠正不规范格式 `[code](url)` 替换为 [`code`](url)
+    PostRule(r"`\s*\[([^\]]+)\]\(([^)]+)\)\s*`", r"[`\1`](\2)"),
+    # 将 \( ... \) 替换为 $ ... $
+    PostRule(r"\\\((.+?)\\\)", r"$\1$"),
+    # 将 \[ ... \] 替换为 $$ ... $$
+    PostRule(r"\\\[(.+?)\\\]", r"$$\1$$"),
+)
+
+
+class PostRuleSet:
+    """
+    预编译的后处理规则。
+
+    没有合并成一个多分支的正则：每条规则都以固定的字符串开头（如 "`**"、"\\("），
+    re 对这种模式用快速的子串查找跳过不相关的文字，没有匹配时既不逐字符检查也不复制字符串；
+    合并后开头只剩公共的 "`"，需要在每个反引号处尝试所有分支，实测反而慢一个数量级
+    （见 scripts/bench_post_rules.py）。提取器追加的规则同样应以固定的字符串开头。
+    """
+
+    def __init__(self, rules: Iterable[PostRule]):
+        self.rules = tuple(rules)
+        self._compiled = tuple((re.compile(rule.pattern, rule.flags), rule.repl) for rule in self.rules)
+
+    def apply(self, markdown: str) -> str:
+        for pattern, repl in self._compiled:
+            markdown = pattern.sub(repl, markdown)
+        return markdown
+
+
+DEFAULT_POST_RULES = PostRuleSet(POST_RULES)
@@ -0,0 +1,235 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+
+@dataclass(frozen=True)
+class HostLimit:
+    """
+    单个主机的限制：平均每秒 rate 个请求，最多连续突发 burst 个，同时在途的请求不超过 max_in_flight。
+    """
+
+    rate: float
+    burst: int = 1
+    max_in_flight: int = 1
+
+
+DEFAULT_HOST_LIMIT = HostLimit(rate=8, burst=16, max_in_flight=8)
+
+# 按域名后缀匹配，子域名共用上级域名的配置（如 zhuanlan.zhihu.com 使用 zhihu.com）。
+# 文章站点容易触发风控，持续稳定地抓取比短时间的突发更重要；图片 CDN 等其他主机使用 DEFAULT_HOST_LIMIT
+DEFAULT_HOST_LIMITS: dict[str, HostLimit] = {
+    "zhihu.com": HostLimit(rate=1, burst=2, max_in_flight=2),
+    "juejin.cn": HostLimit(rate=2, burst=4, max_in_flight=3),
+    "mp.weixin.qq.com": HostLimit(rate=1, burst=3, max_in_flight=2),
+    "toutiao.com": HostLimit(rate=1, burst=2, max_in_flight=2),
+    "yuque.com": HostLimit(rate=2, burst=4, max_in_flight=2),
+    "medium.com": HostLimit(rate=1, burst=3, max_in_flight=2),
+    "api.github.com": HostLimit(rate=2, burst=8, max_in_flight=4),
+}
+
+# 本机服务（本地代理、测试用的替身服务等）默认不限制，显式配置时除外
+_LOCAL_HOSTS = frozenset(("localhost", "127.0.0.1", "::1"))
+
+
+class _TokenBucket:
+    def __init__(self, limit: HostLimit, clock: Callable[[], float]):
+        self.rate = limit.rate
+        self.burst = limit.burst
+        self.tokens = float(limit.burst)
+        self.clock = clock
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        预订一个令牌，返回需要等待的秒数。令牌不足时余量记为负数，后来者排在后面，等待时间按顺序递增。
+        """
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class _InFlightSlots:
+    """
+    同步请求和各个事件循环中的异步请求共用的在途名额。等待者按先来后到排队，
+    release() 直接把名额交给队首的等待者：线程通过 Event 唤醒，协程通过所在事件循环的 Future 唤醒，不需要轮询。
+    """
+
+    def __init__(self, size: int):
+        self._available = size
+        self._waiters: deque[threading.Event | tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        with self._lock:
+            if self._available and not self._waiters:
+                self._available -= 1
+                return
+            event = threading.Event()
+            self._waiters.append(event)
+        event.wait()
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    async def acquire_async(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._available and not self._waiters:
+                self._available -= 1
+                return
+            future = loop.create_future()
+            waiter = (loop, future)
+            self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+            # 已经出队的名额由 _grant() 发现 Future 被取消后归还
+            raise
+
+    def release(self):
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if isinstance(waiter, threading.Event):
+                    waiter.set()
+                    return
+                loop, future = waiter
+                try:
+                    loop.call_soon_threadsafe(self._grant, future)
+                    return
+                except RuntimeError:
+                    # 事件循环已经关闭，交给下一个等待者
+                    continue
+            self._available += 1
+
+    def _grant(self, future: asyncio.Future):
+        if future.done():
+            self.release()
+        else:
+            future.set_result(None)
+
+
+class _HostState:
+    def __init__(self, limit: HostLimit, clock: Callable[[], float]):
+        self.limit = limit
+        self.bucket = _TokenBucket(limit, clock)
+        self.slots = _InFlightSlots(limit.max_in_flight)
+
+
+class HostRateLimiter:
+    """
+    按主机限制请求：令牌桶控制平均速率，信号量控制同时在途的请求数。所有线程共享同一个限制器。
+
+    limits 为 域名后缀 -> HostLimit，未匹配的主机使用 default；host 为空（本地文件等）或为本机且未显式配置时不做限制。
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, HostLimit] | None = None,
+        default: HostLimit = DEFAULT_HOST_LIMIT,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.limits = dict(DEFAULT_HOST_LIMITS if limits is None else limits)
+        self.default = default
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _HostState | None] = {}
+
+    def limit_for(self, host: str) -> HostLimit | None:
+        host = host.lower().rstrip(".")
+        if not host:
+            return None
+        labels = host.split(".")
+        for i in range(len(labels)):
+            limit = self.limits.get(".".join(labels[i:]))
+            if limit:
+                return limit
+        return None if host in _LOCAL_HOSTS else self.default
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """在 with 块中发起对 url 的请求：先占用在途名额，再按速率等待令牌。"""
+        state = self._state(url)
+        if state is None:
+            yield
+            return
+        with state.slots:
+            delay = state.bucket.reserve()
+            if delay > 0:
+                self.sleep(delay)
+            yield
+
+    @asynccontextmanager
+    async def aslot(self, url: str) -> AsyncIterator[None]:
+        """slot() 的异步版本，等待期间不阻塞事件循环。"""
+        state = self._state(url)
+        if state is None:
+            yield
+            return
+        await state.slots.acquire_async()
+        try:
+            delay = state.bucket.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield
+        finally:
+            state.slots.release()
+
+    def _state(self, url: str) -> _HostState | None:
+        host = (urlparse(url).hostname or "").lower()
+        with self._lock:
+            if host in self._hosts:
+                return self._hosts[host]
+            limit = self.limit_for(host)
+            state = self._hosts[host] = _HostState(limit, self.clock) if limit else None
+        return state
+
+
+def parse_host_limit(spec: str) -> tuple[str, HostLimit]:
+    """
+    解析 `DOMAIN=RATE[,BURST[,MAX_IN_FLIGHT]]`，如 `zhihu.com=0.5,2,1`。BURST 默认为 1，MAX_IN_FLIGHT 默认为 BURST。
+    """
+    domain, sep, values = spec.partition("=")
+    parts = values.split(",")
+    if not sep or not domain.strip() or not 1 <= len(parts) <= 3:
+        raise ValueError(f"Invalid host limit: {spec!r}, expected DOMAIN=RATE[,BURST[,MAX_IN_FLIGHT]].")
+    try:
+        rate = float(parts[0])
+        burst = int(parts[1]) if len(parts) > 1 else 1
+        max_in_flight = int(parts[2]) if len(parts) > 2 else burst
+    except ValueError:
+        raise ValueError(f"Invalid host limit: {spec!r}, expected DOMAIN=RATE[,BURST[,MAX_IN_FLIGHT]].") from None
+    if rate <= 0 or burst < 1 or max_in_flight < 1:
+        raise ValueError(f"Invalid host limit: {spec!r}, values must be positive.")
+    return domain.strip().lower(), HostLimit(rate, burst, max_in_flight)
+
+
+_rate_limiter = HostRateLimiter()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """获取全局共享的限制器，http_client 中的请求和浏览器导航都经过它。"""
+    return _rate_limiter
+
+
+def configure_rate_limits(limits: Mapping[str, HostLimit] | None = None, default: HostLimit = DEFAULT_HOST_LIMIT):
+    """
+    以新的配置替换全局限制器。limits 会覆盖 DEFAULT_HOST_LIMITS 中的同名域名，应在发起请求之前调用。
+    """
+    global _rate_limiter
+    _rate_limiter = HostRateLimiter({**DEFAULT_HOST_LIMITS, **(limits or {})}, default)
@@ -1,25 +1,59 @@
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from functools import cache
 from pathlib import Path
 from typing import override
 
-from .http_client import get_session
-from .plugins import load_plugins
+import requests
+
+from .http_cache import acached_get, cached_get, get_http_cache
+from .http_client import get_async_client, get_session
+from .plugins import plugin_classes
 from .reporter import Reporter
+from .routing import Route, RouteTable
 
 
 class Reader(ABC):
-    def __init__(self, url_or_path: str, reporter: Reporter | None = None, verify_ssl: bool = True):
+    # 匹配优先级，数值越大越先尝试
+    PRIORITY = 0
+    # 声明式的 URL 路由规则（写法见 routing.Route），由 ReaderFactory 统一编译为按 host 索引的路由表
+    ROUTES: tuple[str, ...] = ()
+
+    def __init__(
+        self, url_or_path: str, reporter: Reporter | None = None, verify_ssl: bool = True, use_cache: bool = True
+    ):
         self.url_or_path = url_or_path
         self.reporter = reporter
         self.verify_ssl = verify_ssl
+        self.use_cache = use_cache
+
+        self.http_cache = get_http_cache() if use_cache else None
 
-        self.session = get_session(verify_ssl=self.verify_ssl)
+    @property
+    def session(self) -> requests.Session:
+        # aread() 默认在其他线程中执行 read()，因此每次按当前线程获取
+        return get_session(verify_ssl=self.verify_ssl)
 
     @abstractmethod
     def read(self) -> str: ...
 
-    @abstractmethod
-    def can_handle(self) -> bool: ...
+    async def aread(self) -> str:
+        """
+        read() 的异步版本。
+        默认在线程池中执行阻塞的 read()，支持原生异步的 Reader 应覆盖此方法。
+        """
+        return await asyncio.to_thread(self.read)
+
+    def can_handle(self) -> bool:
+        """
+        默认根据 ROUTES 判断，没有声明路由规则的 Reader 需要覆盖此方法。
+        """
+        return self.matched_route() is not None
+
+    def matched_route(self) -> Route | None:
+        matched = _class_route_table(type(self)).match(self.url_or_path)
+        return matched[0] if matched else None
 
     def report(self, message: str):
         if self.reporter:
@@ -28,24 +62,41 @@ class Reader(ABC):
 
 class ReaderFactory:
     @staticmethod
-    def create(url_or_path: str, reporter: Reporter | None = None, verify_ssl: bool = True) -> Reader:
+    def create(
+        url_or_path: str, reporter: Reporter | None = None, verify_ssl: bool = True, use_cache: bool = True
+    ) -> Reader:
         if url_or_path.startswith("http"):
-            for reader in _load_readers(url_or_path, reporter=reporter, verify_ssl=verify_ssl):
+            matched = _reader_route_table().match(url_or_path)
+            if matched:
+                return matched[1](url_or_path, reporter=reporter, verify_ssl=verify_ssl, use_cache=use_cache)
+            for reader in _iter_readers(url_or_path, reporter=reporter, verify_ssl=verify_ssl, use_cache=use_cache):
                 if reader.can_handle():
                     return reader
-            return HtmlReader(url_or_path, reporter=reporter, verify_ssl=verify_ssl)
+            return HtmlReader(url_or_path, reporter=reporter, verify_ssl=verify_ssl, use_cache=use_cache)
         file_reader = FileReader(url_or_path, reporter=reporter)
         if file_reader.can_handle():
             return file_reader
         raise ValueError(f"No suitable reader found for: {url_or_path}")
 
+    @staticmethod
+    def routing_table() -> list[tuple[str, type["Reader"]]]:
+        """
+        返回 (路由规则, Reader 类) 列表，便于调试。
+        """
+        return [(route.pattern, cls) for route, cls in _reader_route_table().routes()]
+
 
 class HtmlReader(Reader):
     @override
     def read(self) -> str:
-        response = self.session.get(self.url_or_path)
-        response.encoding = "utf-8"
-        return response.text
+        return cached_get(self.session, self.url_or_path, self.http_cache)
+
+    @override
+    async def aread(self) -> str:
+        client = get_async_client(verify_ssl=self.verify_ssl)
+        if client is None:
+            return await super().aread()
+        return await acached_get(client, self.url_or_path, self.http_cache)
 
     @override
     def can_handle(self) -> bool:
@@ -63,5 +114,25 @@ class FileReader(Reader):
         return self.url_or_path.startswith("file://") or Path(self.url_or_path).is_file()
 
 
-def _load_readers(url_or_path: str, reporter: Reporter | None = None, verify_ssl: bool = True) -> list[Reader]:
-    return load_plugins(Reader, "readers", url_or_path, reporter=reporter, verify_ssl=verify_ssl)
+@cache
+def _reader_route_table() -> RouteTable[type[Reader]]:
+    table: RouteTable[type[Reader]] = RouteTable()
+    for cls in plugin_classes(Reader, "readers"):
+        table.add_all(cls.ROUTES, cls)
+    return table
+
+
+@cache
+def _class_route_table(cls: type[Reader]) -> RouteTable[type[Reader]]:
+    table: RouteTable[type[Reader]] = RouteTable()
+    table.add_all(cls.ROUTES, cls)
+    return table
+
+
+def _iter_readers(
+    url_or_path: str, reporter: Reporter | None = None, verify_ssl: bool = True, use_cache: bool = True
+) -> Iterator[Reader]:
+    # 没有声明路由规则的 Reader 仍然逐个调用 can_handle() 判断
+    for cls in plugin_classes(Reader, "readers"):
+        if not cls.ROUTES:
+            yield cls(url_or_path, reporter=reporter, verify_ssl=verify_ssl, use_cache=use_cache)
@@ -1,19 +1,21 @@
 from typing import override
 
-from ..launch_playwright import create_stealth_page
+from ..launch_playwright import anavigate, create_stealth_page, create_stealth_page_async, navigate
 from ..reader import Reader
 
 
 class BrowserReader(Reader):
+    # 路由规则 -> 等待出现的正文选择器
     TARGET_HOSTS = {
-        "https://developer.apple.com/documentation/": 'main[class="main"]',
-        "https://www.infoq.cn/": 'div[class="article-content-wrap"]',
-        "https://pcsx2.net/": "body",
-        "https://baijiahao.baidu.com/": "body",
-        "https://www.toutiao.com/article": 'div[class="article-content"]',
-        "https://medium.com": "article",
-        "https://www.huxiu.com/article": 'div[class="article__content"]',
+        "developer.apple.com/documentation/": 'main[class="main"]',
+        "www.infoq.cn/": 'div[class="article-content-wrap"]',
+        "pcsx2.net/": "body",
+        "baijiahao.baidu.com/": "body",
+        "www.toutiao.com/article": 'div[class="article-content"]',
+        "medium.com": "article",
+        "www.huxiu.com/article": 'div[class="article__content"]',
     }
+    ROUTES = tuple(TARGET_HOSTS)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -22,18 +24,22 @@ class BrowserReader(Reader):
     def read(self) -> str:
         with create_stealth_page(self.reporter, self.verify_ssl) as (page, context):
             try:
-                page.goto(self.url_or_path, wait_until="domcontentloaded", timeout=45000)
+                navigate(page, self.url_or_path, wait_until="domcontentloaded", timeout=45000)
                 page.wait_for_selector(self._get_matched_selector(), timeout=30000)
                 return page.content()
             except Exception as e:
                 raise Exception(f"页面加载失败: {str(e)}")
 
     @override
-    def can_handle(self) -> bool:
-        return self._get_matched_selector() is not None
+    async def aread(self) -> str:
+        async with create_stealth_page_async(self.reporter, self.verify_ssl) as (page, context):
+            try:
+                await anavigate(page, self.url_or_path, wait_until="domcontentloaded", timeout=45000)
+                await page.wait_for_selector(self._get_matched_selector(), timeout=30000)
+                return await page.content()
+            except Exception as e:
+                raise Exception(f"页面加载失败: {str(e)}")
 
     def _get_matched_selector(self) -> str | None:
-        for host, selector in self.TARGET_HOSTS.items():
-            if self.url_or_path.startswith(host):
-                return selector
-        return None
+        route = self.matched_route()
+        return self.TARGET_HOSTS[route.pattern] if route else None
@@ -1,20 +1,22 @@
 from typing import override
 
+from ..http_cache import acached_get, cached_get
+from ..http_client import get_async_client
 from ..reader import Reader
 
-TARGET_HOSTS = [
-    "https://wallstreetcn.com/articles/",
-]
+CURL_HEADERS = {"User-Agent": "curl/8.7.1"}
 
 
 class CurlReader(Reader):
+    ROUTES = ("wallstreetcn.com/articles/",)
+
     @override
     def read(self) -> str:
-        headers = {"User-Agent": "curl/8.7.1"}
-        response = self.session.get(self.url_or_path, headers=headers)
-        response.encoding = "utf-8"
-        return response.text
+        return cached_get(self.session, self.url_or_path, self.http_cache, headers=CURL_HEADERS, variant="curl")
 
     @override
-    def can_handle(self) -> bool:
-        return any(self.url_or_path.startswith(host) for host in TARGET_HOSTS)
+    async def aread(self) -> str:
+        client = get_async_client(verify_ssl=self.verify_ssl)
+        if client is None:
+            return await super().aread()
+        return await acached_get(client, self.url_or_path, self.http_cache, headers=CURL_HEADERS, variant="curl")
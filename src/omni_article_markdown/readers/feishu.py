@@ -1,7 +1,7 @@
 import time
 from typing import override
 
-from ..launch_playwright import create_stealth_page
+from ..launch_playwright import create_stealth_page, navigate
 from ..reader import Reader
 from ..utils import clean_text
 
@@ -18,6 +18,8 @@ class FeishuReader(Reader):
     - page.keyboard.press("End")
     """
 
+    ROUTES = ("*.feishu.cn",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -25,7 +27,7 @@ class FeishuReader(Reader):
     def read(self) -> str:
         with create_stealth_page(self.reporter, self.verify_ssl) as (page, context):
             try:
-                page.goto(self.url_or_path, wait_until="domcontentloaded", timeout=45000)
+                navigate(page, self.url_or_path, wait_until="domcontentloaded", timeout=45000)
                 js_function = """
                 () => {
                     return document.title.trim().endsWith(" - 飞书云文档");
@@ -178,7 +180,3 @@ class FeishuReader(Reader):
                 return clean_text(combined_html)
             except Exception as e:
                 raise Exception(f"页面加载失败: {str(e)}")
-
-    @override
-    def can_handle(self) -> bool:
-        return ".feishu.cn/" in self.url_or_path
@@ -1,19 +1,20 @@
 from typing import override
 
-from ..launch_playwright import create_stealth_page
+from ..launch_playwright import anavigate, create_stealth_page, create_stealth_page_async, navigate
 from .browser import BrowserReader
 
 
 class ScrollableBrowserReader(BrowserReader):
     TARGET_HOSTS = {
-        "https://x.com": 'article[data-testid="tweet"]',
+        "x.com": 'article[data-testid="tweet"]',
     }
+    ROUTES = tuple(TARGET_HOSTS)
 
     @override
     def read(self) -> str:
         with create_stealth_page(self.reporter, self.verify_ssl) as (page, context):
             try:
-                page.goto(self.url_or_path, wait_until="domcontentloaded", timeout=45000)
+                navigate(page, self.url_or_path, wait_until="domcontentloaded", timeout=45000)
                 page.wait_for_selector(self._get_matched_selector(), timeout=30000)
                 # 滚动页面以触发懒加载
                 page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
@@ -23,3 +24,17 @@ class ScrollableBrowserReader(BrowserReader):
                 return page.content()
             except Exception as e:
                 raise Exception(f"页面加载失败: {str(e)}")
+
+    @override
+    async def aread(self) -> str:
+        async with create_stealth_page_async(self.reporter, self.verify_ssl) as (page, context):
+            try:
+                await anavigate(page, self.url_or_path, wait_until="domcontentloaded", timeout=45000)
+                await page.wait_for_selector(self._get_matched_selector(), timeout=30000)
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                await page.wait_for_timeout(1000)
+                await page.evaluate("window.scrollTo(0, 0)")
+                await page.wait_for_timeout(1000)
+                return await page.content()
+            except Exception as e:
+                raise Exception(f"页面加载失败: {str(e)}")
@@ -1,10 +1,12 @@
 from typing import override
 
-from ..launch_playwright import create_stealth_page
+from ..launch_playwright import anavigate, create_stealth_page, create_stealth_page_async, navigate
 from ..reader import Reader
 
 
 class ToutiaoReader(Reader):
+    ROUTES = ("toutiao.com", "*.toutiao.com")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -12,11 +14,16 @@ class ToutiaoReader(Reader):
     def read(self) -> str:
         with create_stealth_page(self.reporter, self.verify_ssl) as (page, context):
             try:
-                page.goto(self.url_or_path, wait_until="networkidle", timeout=45000)
+                navigate(page, self.url_or_path, wait_until="networkidle", timeout=45000)
                 return page.content()
             except Exception as e:
                 raise Exception(f"页面加载失败: {str(e)}")
 
     @override
-    def can_handle(self) -> bool:
-        return "toutiao.com" in self.url_or_path
+    async def aread(self) -> str:
+        async with create_stealth_page_async(self.reporter, self.verify_ssl) as (page, context):
+            try:
+                await anavigate(page, self.url_or_path, wait_until="networkidle", timeout=45000)
+                return await page.content()
+            except Exception as e:
+                raise Exception(f"页面加载失败: {str(e)}")
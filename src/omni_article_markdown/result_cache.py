@@ -0,0 +1,79 @@
+import hashlib
+import importlib
+import json
+import time
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from .disk_cache import DiskCache
+from .extractor import Extractor
+from .parser import PARSER_VERSION
+from .store import Store
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+DEFAULT_MAX_AGE = 30 * 24 * 3600
+
+
+class ResultCache(DiskCache):
+    """
+    转换结果缓存：以原始 HTML 的哈希为键，保存提取器类、提取器版本、解析器版本以及转换得到的标题和 Markdown。
+
+    命中时只有当提取器的 VERSION 与 PARSER_VERSION 都与保存时一致才会返回结果，
+    因此提升某个提取器的版本号只会让该提取器产生的条目失效。
+    """
+
+    def __init__(
+        self, path: Path | str | None = None, max_size: int = DEFAULT_MAX_SIZE, max_age: float = DEFAULT_MAX_AGE
+    ):
+        super().__init__(Path(path) if path else Store().path / "result_cache", max_size, max_age)
+
+    def get(self, raw_html: str, variant: str = "") -> tuple[str, str] | None:
+        """返回 (title, markdown)，未命中或已失效时返回 None。"""
+        key = _cache_key(raw_html, variant)
+        meta = self._load_meta(key)
+        if meta is None:
+            return None
+        extractor = _resolve_extractor(meta.get("extractor", ""))
+        if (
+            extractor is None
+            or meta.get("extractor_version") != extractor.VERSION
+            or meta.get("parser_version") != PARSER_VERSION
+        ):
+            self._remove(key)
+            return None
+        return meta["title"], meta["markdown"]
+
+    def put(self, raw_html: str, extractor: type[Extractor], title: str, markdown: str, variant: str = ""):
+        meta: dict[str, Any] = {
+            "extractor": f"{extractor.__module__}:{extractor.__qualname__}",
+            "extractor_version": extractor.VERSION,
+            "parser_version": PARSER_VERSION,
+            "stored_at": time.time(),
+            "title": title,
+            "markdown": markdown,
+        }
+        self._write(_cache_key(raw_html, variant), {".json": json.dumps(meta, ensure_ascii=False).encode("utf-8")})
+
+
+@cache
+def get_result_cache() -> ResultCache:
+    """获取全局复用的 ResultCache 单例。"""
+    return ResultCache()
+
+
+def _cache_key(raw_html: str, variant: str) -> str:
+    return hashlib.sha256(f"{variant}\n{raw_html}".encode()).hexdigest()
+
+
+def _resolve_extractor(name: str) -> type[Extractor] | None:
+    module_name, _, qualname = name.partition(":")
+    try:
+        obj: Any = importlib.import_module(module_name)
+    except (ImportError, ValueError):
+        return None
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr, None)
+    if isinstance(obj, type) and issubclass(obj, Extractor):
+        return obj
+    return None
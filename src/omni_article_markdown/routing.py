@@ -0,0 +1,84 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+
+@dataclass(frozen=True)
+class Route:
+    """
+    URL 路由规则，写法为 `host/path-prefix`，例如 `www.infoq.cn/`、`wallstreetcn.com/articles/`。
+    host 以 `*.` 开头时匹配其所有子域名（不含该域名本身），省略路径时匹配该 host 下的所有页面。
+    """
+
+    pattern: str
+    host: str
+    path_prefix: str
+    wildcard: bool
+
+    @classmethod
+    def parse(cls, pattern: str) -> "Route":
+        host, slash, path = pattern.partition("/")
+        host = host.lower()
+        wildcard = host.startswith("*.")
+        if wildcard:
+            host = host[2:]
+        if not host:
+            raise ValueError(f"Invalid route: {pattern}")
+        return cls(pattern=pattern, host=host, path_prefix=slash + path, wildcard=wildcard)
+
+
+class RouteTable[T]:
+    """
+    按 host 建立索引的路由表。
+
+    先按完整 host 查找，再依次查找各级父域名的通配规则，因此匹配耗时只与 URL 的域名层级有关，
+    与规则数量无关。同一 host 下优先匹配最长的路径前缀，长度相同时先注册的规则优先。
+    """
+
+    def __init__(self):
+        self._exact: dict[str, list[tuple[Route, T]]] = {}
+        self._wildcard: dict[str, list[tuple[Route, T]]] = {}
+        self._routes: list[tuple[Route, T]] = []
+
+    def add(self, pattern: str, target: T):
+        route = Route.parse(pattern)
+        index = self._wildcard if route.wildcard else self._exact
+        candidates = index.setdefault(route.host, [])
+        candidates.append((route, target))
+        # sort 是稳定的，相同长度的前缀保持注册顺序
+        candidates.sort(key=lambda item: -len(item[0].path_prefix))
+        self._routes.append((route, target))
+
+    def add_all(self, patterns: Iterable[str], target: T):
+        for pattern in patterns:
+            self.add(pattern, target)
+
+    def match(self, url: str) -> tuple[Route, T] | None:
+        parts = urlsplit(url)
+        host = parts.hostname
+        if not host:
+            return None
+        path = parts.path or "/"
+        matched = _match_prefix(self._exact.get(host), path)
+        if matched:
+            return matched
+        labels = host.split(".")
+        for i in range(1, len(labels)):
+            matched = _match_prefix(self._wildcard.get(".".join(labels[i:])), path)
+            if matched:
+                return matched
+        return None
+
+    def routes(self) -> list[tuple[Route, T]]:
+        return list(self._routes)
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+
+def _match_prefix[T](candidates: list[tuple[Route, T]] | None, path: str) -> tuple[Route, T] | None:
+    if candidates:
+        for route, target in candidates:
+            if path.startswith(route.path_prefix):
+                return route, target
+    return None
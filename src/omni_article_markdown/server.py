@@ -0,0 +1,190 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from .extractor import Extractor
+from .http_client import close_sessions
+from .launch_playwright import close_worker_browser_pools
+from .omni_article_md import OmniArticleMarkdown
+from .plugins import plugin_classes
+from .reader import Reader
+from .reporter import Reporter
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_WORKERS = 4
+
+# 请求体大小上限，防止误传超大文件拖垮服务
+MAX_BODY_SIZE = 32 * 1024 * 1024
+
+
+class BadRequestError(ValueError):
+    pass
+
+
+class PayloadTooLargeError(BadRequestError):
+    pass
+
+
+class ConversionService:
+    """
+    常驻的转换服务。
+
+    插件模块在启动时预热；转换任务在固定数量的工作线程中执行，
+    因此每个工作线程中的浏览器池和 HTTP Session 在请求之间保持可用，连接池在线程之间共享。
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        verify_ssl: bool = True,
+        reporter: Reporter | None = None,
+        use_cache: bool = True,
+        html_parser: str | None = None,
+    ):
+        self.verify_ssl = verify_ssl
+        self.reporter = reporter
+        self.use_cache = use_cache
+        self.html_parser = html_parser
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mdcli-serve")
+
+    def warm_up(self):
+        plugin_classes(Reader, "readers")
+        plugin_classes(Extractor, "extractors")
+
+    def convert(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """
+        payload 中提供 `url`（http/https 链接）或 `html`（原始 HTML），二者选一。
+        """
+        url = payload.get("url")
+        html = payload.get("html")
+        if html is not None:
+            if not isinstance(html, str):
+                raise BadRequestError("`html` must be a string.")
+        elif not isinstance(url, str) or not url.startswith(("http://", "https://")):
+            raise BadRequestError("Provide either `html` or an http(s) `url`.")
+        return self.executor.submit(self._convert, url or "", html).result()
+
+    def close(self):
+        close_worker_browser_pools(self.executor, self.workers)
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        close_sessions()
+
+    def _convert(self, url: str, html: str | None) -> dict[str, Any]:
+        start = time.perf_counter()
+        handler = OmniArticleMarkdown(
+            url,
+            reporter=self.reporter,
+            verify_ssl=self.verify_ssl,
+            use_cache=self.use_cache,
+            html_parser=self.html_parser,
+        )
+        if html is None:
+            handler.parse()
+        else:
+            handler.parse_html(html)
+        parser_ctx = handler.parser_ctx
+        if parser_ctx is None:
+            raise ValueError("No parsed content available.")
+        timings = dict(handler.timings)
+        timings["total"] = time.perf_counter() - start
+        return {"title": parser_ctx.title, "markdown": parser_ctx.markdown, "timings": timings}
+
+
+class ConversionServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: ConversionService):
+        super().__init__(address, _ConversionRequestHandler)
+        self.service = service
+
+
+class _ConversionRequestHandler(BaseHTTPRequestHandler):
+    server: ConversionServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(HTTPStatus.OK, {"status": "ok"})
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found."})
+
+    def do_POST(self):
+        if self.path != "/convert":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found."})
+            return
+        try:
+            payload = self._read_json()
+            result = self.server.service.convert(payload)
+        except PayloadTooLargeError as e:
+            self._send_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": str(e)})
+        except BadRequestError as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+        except Exception as e:
+            self._send_json(HTTPStatus.UNPROCESSABLE_ENTITY, {"error": str(e) or e.__class__.__name__})
+        else:
+            self._send_json(HTTPStatus.OK, result)
+
+    def log_message(self, format: str, *args: Any):
+        reporter = self.server.service.reporter
+        if reporter:
+            reporter(f"{self.address_string()} - {format % args}")
+
+    def _read_json(self) -> dict[str, Any]:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length <= 0 or length > MAX_BODY_SIZE:
+            # 请求体没有读取，留在连接中会被当作下一个请求解析，回复后关闭连接
+            self.close_connection = True
+            if length > MAX_BODY_SIZE:
+                raise PayloadTooLargeError(f"Request body is larger than {MAX_BODY_SIZE} bytes.")
+            if length < 0:
+                raise BadRequestError("Invalid Content-Length header.")
+            raise BadRequestError("Request body is empty.")
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except ValueError:
+            raise BadRequestError("Request body must be valid JSON.")
+        if not isinstance(payload, dict):
+            raise BadRequestError("Request body must be a JSON object.")
+        return payload
+
+    def _send_json(self, status: HTTPStatus, body: dict[str, Any]):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    workers: int = DEFAULT_WORKERS,
+    verify_ssl: bool = True,
+    reporter: Reporter | None = None,
+    use_cache: bool = True,
+    html_parser: str | None = None,
+):
+    service = ConversionService(
+        workers=workers, verify_ssl=verify_ssl, reporter=reporter, use_cache=use_cache, html_parser=html_parser
+    )
+    service.warm_up()
+    with ConversionServer((host, port), service) as server:
+        if reporter:
+            reporter(f"Serving on http://{host}:{server.server_port} (POST /convert, GET /health)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            service.close()
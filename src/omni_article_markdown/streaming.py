@@ -0,0 +1,457 @@
+import html
+import re
+from bisect import bisect_right
+from collections.abc import Iterator
+from itertools import chain
+from typing import Any
+
+from bs4 import BeautifulSoup
+from bs4.builder import ParserRejectedMarkup
+from bs4.element import CData, Comment, NavigableString, Tag
+
+from .article import Article
+from .cleaning import CleanRuleSet
+from .extractor import DefaultExtractor, Extractor
+from .gist import GistFetcher
+from .html_parser import iter_raw_text, make_soup, strip_raw_text
+from .markdown_ir import BREAK, EMPTY, Node, Text, group, iter_render_markdown, render_markdown
+from .page_meta import PageMeta
+from .parser import HtmlMarkdownParser, is_block_element
+from .utils import collapse_spaces, contains_words, get_attr_text
+
+# 流式转换直接驱动 bs4 内部的分词器并模拟建树协议，这些接口不属于公开 API，
+# 新版本的 bs4 中不存在时不使用流式转换
+_Tokenizer: type | None
+_TreeBuilder: type | None
+try:
+    from bs4.builder._htmlparser import BeautifulSoupHTMLParser as _Tokenizer, HTMLParserTreeBuilder as _TreeBuilder
+except ImportError:
+    _Tokenizer = _TreeBuilder = None
+_BS4_INTERNALS = (
+    _Tokenizer is not None
+    and _TreeBuilder is not None
+    and hasattr(_TreeBuilder, "_replace_cdata_list_attribute_values")
+)
+
+# 覆盖了其中任意一个方法的提取器依赖完整的 DOM 树，只能走树解析
+_TREE_HOOKS = (
+    "pre_handle_soup",
+    "extract_article",
+    "extract_article_from_soup",
+    "extract_img",
+    "extract_title",
+    "extract_description",
+    "extract_url",
+    "remove_duplicate_titles",
+)
+
+# 需要整体查看子树才能转换的元素，在局部建出小树后交给 HtmlMarkdownParser 处理
+_SUBTREE_ELEMENTS = frozenset(("sup", "pre", "picture", "table", "math", "script"))
+
+# 与 Tag.get_text() 默认取用的字符串类型一致
+_TEXT_TYPES = (NavigableString, CData)
+
+_CHUNK_SIZE = 64 * 1024
+
+_TAG_RE = re.compile(r"<[^>]*>")
+_ATTR_VALUE_RE = re.compile(r"""=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+_GIST_SRC_RE = re.compile(r"""<script\s[^>]*?\bsrc\s*=\s*["']?(https://gist\.github\.com/[^"'\s>]+)""", re.IGNORECASE)
+
+# 元素在流式转换中的处理方式
+_OUTSIDE = 0  # 正文容器之外
+_SKIP = 1  # 被清理规则删除的元素及其子孙
+_IGNORE = 2  # 转换结果恒为空，但仍需参与标题去重和块级判断
+_CONVERT = 3  # 由子节点的转换结果组装
+_LIST = 4  # ul / ol
+_ENTRY = 5  # 列表中的 li
+_SUBTREE = 6  # 局部小树的根
+_TREE = 7  # 局部小树中的子孙元素
+
+
+class StreamingUnsupportedError(ValueError):
+    """
+    流式转换无法得到与树解析一致的结果，调用方应改用树解析。
+    """
+
+
+class _ContainerClosedError(Exception):
+    # 正文容器结束后不再需要继续分词
+    pass
+
+
+class _Frame:
+    # 同时作为 BeautifulSoupHTMLParser 需要的 Tag 替身，以及清理规则 when 条件收到的元素
+    __slots__ = ("name", "attrs", "mode", "level", "parts", "pure", "index", "tag", "is_empty_element")
+
+    def __init__(self, name: str, attrs: dict[str, Any], mode: int, level: int, is_empty_element: bool):
+        self.name = name
+        self.attrs = attrs
+        self.mode = mode
+        self.level = level
+        # 子节点的转换结果；列表中为各项的 Markdown 文本
+        self.parts: list = []
+        # 子节点是否全部为块级元素，见 parser.is_pure_block_children()
+        self.pure = True
+        # 列表中已出现的子元素个数
+        self.index = 0
+        self.tag: Tag | None = None
+        self.is_empty_element = is_empty_element
+
+
+class StreamingMarkdownParser:
+    """
+    不构建完整 DOM 树的 HTML→Markdown 转换，适用于只依赖通用提取逻辑的提取器（如 DefaultExtractor）。
+
+    直接复用 BeautifulSoup 的 html.parser 分词和建树规则，只是不保留树：元素在结束标签处由子节点的转换结果
+    组装成 Markdown，表格、代码块等需要整体查看的元素在局部建出小树后交给 HtmlMarkdownParser。
+    输出与使用 html.parser 时 Extractor.extract() 加 HtmlMarkdownParser.parse() 的结果一致，
+    内存占用只与正文中最深的嵌套以及最大的表格、代码块有关。
+    """
+
+    def __init__(self, raw_html: str, extractor: type[Extractor] = DefaultExtractor, gists: GistFetcher | None = None):
+        self.raw_html = raw_html
+        instance = extractor(make_soup("", "html.parser"))
+        self.rules: CleanRuleSet = instance.clean_rules()
+        containers = instance.article_container()
+        self.containers: list[str] = [
+            name for name, _ in (containers if isinstance(containers, list) else [containers])
+        ]
+        meta = PageMeta.from_soup(make_soup(PageMeta.meta_markup(raw_html), "html.parser"))
+        self.article = Article(
+            title=meta.get("og:title") or meta.get("title"),
+            url=meta.get("og:url") or meta.get("canonical"),
+            description=meta.get("og:description"),
+            body="",
+        )
+        self.parser = HtmlMarkdownParser(self.article, instance.post_rules(), gists)
+        # iter_fragments() 选定的正文容器标签名
+        self.target = ""
+        # 标题已经确定：正文的第一个 h1 已经结束，或已经转换到正文末尾
+        self.title_final = False
+
+    @staticmethod
+    def supports(extractor: type[Extractor]) -> bool:
+        """
+        提取器是否只使用了流式转换能够复现的逻辑：按标签名查找容器、可按属性判断的清理规则、基于元数据的标题和链接。
+        """
+        if not _BS4_INTERNALS:
+            return False
+        # 覆盖了 can_handle() 的提取器需要在完整文档上确认，DefaultExtractor 总是返回 True
+        if extractor is not DefaultExtractor and extractor.can_handle is not Extractor.can_handle:
+            return False
+        if extractor.RAW_HINTS or extractor.KEEP_SCRIPTS or extractor.PARSER not in (None, "html.parser"):
+            return False
+        if any(getattr(extractor, hook) is not getattr(Extractor, hook) for hook in _TREE_HOOKS):
+            return False
+        instance = extractor(make_soup("", "html.parser"))
+        containers = instance.article_container()
+        if any(attrs is not None for _, attrs in (containers if isinstance(containers, list) else [containers])):
+            return False
+        return not instance.clean_rules().needs_element
+
+    def parse(self) -> tuple[str, str] | None:
+        """
+        返回 (标题, Markdown)；找不到正文容器或无法保证与树解析一致时返回 None。
+        """
+        try:
+            markdown = render_markdown(group(list(self.iter_fragments())))
+        except StreamingUnsupportedError:
+            return None
+        return self.parser.finish(markdown)
+
+    def iter_markdown(self) -> Iterator[str]:
+        """
+        边解析边逐段产出 Markdown，全部拼接后与 parse() 的结果相同，例外见 HtmlMarkdownParser.iter_finish()。
+        正文的第一个 h1 可能修改标题，它结束之前的片段先缓存起来（正文中没有 h1 时要到最后）。
+        找不到正文容器时在产出任何内容之前抛出 StreamingUnsupportedError。
+        """
+        fragments = self.iter_fragments()
+        head: list[Node] = []
+        for node in fragments:
+            head.append(node)
+            if self.title_final:
+                break
+        description = self.article.description
+        may_describe = False
+        if description:
+            # 只看正文容器开始之后的部分，<head> 中的 meta 标签本身就包含摘要
+            start = re.search(rf"<{re.escape(self.target)}(?=[\s/>])", self.raw_html, re.IGNORECASE)
+            source = _source_text(self.raw_html[start.start() if start else 0 :])
+            may_describe = contains_words(f"{source} {self.article.url}", description)
+        yield from self.parser.iter_finish(iter_render_markdown(chain(head, fragments)), may_describe)
+
+    def iter_fragments(self) -> Iterator[Node]:
+        """
+        按文档顺序逐个产出正文容器中每个直接子节点的转换结果（尚未经过后处理规则处理）。
+        正文中第一个 h1 与标题重复时会被去掉，并更新 article.title。
+        """
+        markup = strip_raw_text(self.raw_html)
+        target = _find_container(markup, self.containers)
+        if target is None:
+            raise StreamingUnsupportedError("No article container found.")
+        self.target = target
+        self.parser.prefetch_gists(html.unescape(match[1]) for match in _GIST_SRC_RE.finditer(markup))
+        if _Tokenizer is None or _TreeBuilder is None:
+            raise StreamingUnsupportedError("bs4 internals are unavailable.")
+        try:
+            higher = frozenset(self.containers[: self.containers.index(target)])
+            sink = _MarkdownSink(self, _TreeBuilder(), target, higher)
+            args, kwargs = sink.builder.parser_args
+            tokenizer = _Tokenizer(sink, *args, **kwargs)
+        except (AttributeError, TypeError) as e:
+            # 已安装的 bs4 与这里使用的内部接口不兼容
+            raise StreamingUnsupportedError(f"Incompatible bs4 internals: {e}") from e
+        try:
+            for pos in range(0, len(markup), _CHUNK_SIZE):
+                tokenizer.feed(markup[pos : pos + _CHUNK_SIZE])
+                yield from sink.drain()
+            tokenizer.close()
+            sink.close()
+        except _ContainerClosedError:
+            pass
+        except (AssertionError, ParserRejectedMarkup) as e:
+            raise StreamingUnsupportedError(str(e)) from e
+        if not sink.started:
+            raise StreamingUnsupportedError("No article container found.")
+        self.title_final = True
+        yield from sink.drain()
+
+
+class _MarkdownSink:
+    """
+    代替 BeautifulSoup 对象接收 BeautifulSoupHTMLParser 的建树调用，
+    开始/结束标签的配对、空白折叠和字符串类型的规则与 BeautifulSoup 相同。
+    """
+
+    def __init__(self, owner: StreamingMarkdownParser, builder: Any, target: str, higher: frozenset[str]):
+        # BeautifulSoupHTMLParser 通过 soup.builder 读取建树选项
+        self.builder = builder
+        self.contains_replacement_characters = False
+        self.owner = owner
+        self.parser = owner.parser
+        self.rules = owner.rules
+        self.target = target
+        # 优先级更高的容器，出现即说明预扫描选错了容器
+        self.higher = higher
+        self.started = False
+        self.root: _Frame | None = None
+        self.stack: list[_Frame] = []
+        self.open_counts: dict[str, int] = {}
+        self.preserve_whitespace: list[_Frame] = []
+        self.string_containers: list[_Frame] = []
+        self.current_data: list[str] = []
+        self.fragments: list[Node] = []
+        self.h1_frame: _Frame | None = None
+        self.h1_done = False
+        self.h1_text: list[str] = []
+
+    def drain(self) -> list[Node]:
+        fragments, self.fragments = self.fragments, []
+        return fragments
+
+    def close(self):
+        self.endData()
+        while self.stack:
+            self._pop()
+
+    def handle_starttag(
+        self,
+        name: str,
+        namespace: str | None,
+        nsprefix: str | None,
+        attrs: dict[str, Any],
+        sourceline: int | None = None,
+        sourcepos: int | None = None,
+        namespaces: dict[str, str] | None = None,
+    ) -> _Frame:
+        self.endData()
+        if name in self.higher:
+            raise StreamingUnsupportedError(f"Found a preferred container: {name}")
+        builder = self.builder
+        attrs = builder._replace_cdata_list_attribute_values(name, attrs)
+        parent = self.stack[-1] if self.stack else None
+        frame = _Frame(name, attrs, _OUTSIDE, 0, builder.can_be_empty_element(name))
+        if parent is None or parent.mode == _OUTSIDE:
+            if not self.started and name == self.target:
+                self.started = True
+                self.root = frame
+                frame.mode = _CONVERT
+        elif parent.mode == _SKIP or self.rules.matches_attrs(name, attrs, frame):  # type: ignore[arg-type]
+            frame.mode = _SKIP
+        else:
+            self._classify(frame, parent)
+            if name == "h1" and not self.h1_done:
+                self.h1_done = True
+                self.h1_frame = frame
+        self.stack.append(frame)
+        self.open_counts[name] = self.open_counts.get(name, 0) + 1
+        if name in builder.preserve_whitespace_tags:
+            self.preserve_whitespace.append(frame)
+        if name in builder.string_containers:
+            self.string_containers.append(frame)
+        return frame
+
+    def _classify(self, frame: _Frame, parent: _Frame):
+        name = frame.name
+        mode = parent.mode
+        if mode in (_SUBTREE, _TREE):
+            frame.mode = _TREE
+            frame.tag = Tag(builder=self.builder, name=name, attrs=frame.attrs)
+            parent.tag.append(frame.tag)  # type: ignore[union-attr]
+            return
+        if mode == _IGNORE:
+            frame.mode = _IGNORE
+            return
+        if mode == _LIST:
+            # 列表只转换 li 和直接嵌套的列表
+            if name == "li":
+                frame.mode = _ENTRY
+                frame.level = parent.level
+            elif name in ("ul", "ol"):
+                frame.mode = _LIST
+                frame.level = parent.level + 1
+            else:
+                frame.mode = _IGNORE
+            return
+        frame.level = parent.level
+        if name in ("ul", "ol"):
+            frame.mode = _LIST
+        elif name in _SUBTREE_ELEMENTS or (name == "svg" and frame.attrs.get("data-id") == "omnimd"):
+            frame.mode = _SUBTREE
+            frame.tag = Tag(builder=self.builder, name=name, attrs=frame.attrs)
+        elif name == "svg":
+            frame.mode = _IGNORE
+        else:
+            frame.mode = _CONVERT
+
+    def handle_endtag(self, name: str, nsprefix: str | None = None):
+        self.endData()
+        if not self.open_counts.get(name):
+            return
+        while self.stack:
+            if self._pop().name == name:
+                break
+
+    def handle_data(self, data: str):
+        self.current_data.append(data)
+
+    def endData(self, containerClass: type[NavigableString] | None = None):  # noqa: N802, N803
+        if not self.current_data:
+            return
+        data = "".join(self.current_data)
+        self.current_data = []
+        if not self.preserve_whitespace and not data.strip(BeautifulSoup.ASCII_SPACES):
+            data = "\n" if "\n" in data else " "
+        cls = containerClass or NavigableString
+        if cls is NavigableString and self.string_containers:
+            cls = self.builder.string_containers.get(self.string_containers[-1].name, cls)
+        if self.stack:
+            self._string(self.stack[-1], data, cls)
+
+    def _string(self, frame: _Frame, data: str, cls: type[NavigableString]):
+        mode = frame.mode
+        # 正文中的注释在提取时已被删除
+        if mode in (_OUTSIDE, _SKIP) or issubclass(cls, Comment):
+            return
+        if self.h1_frame is not None and cls in _TEXT_TYPES:
+            text = data.strip()
+            if text:
+                self.h1_text.append(text)
+        if mode in (_SUBTREE, _TREE):
+            frame.tag.append(cls(data))  # type: ignore[union-attr]
+            return
+        if data.strip():
+            frame.pure = False
+        if mode in (_CONVERT, _ENTRY):
+            text = collapse_spaces(data).replace("<", "&lt;").replace(">", "&gt;")
+            if text.strip():
+                self._append(frame, Text(text))
+
+    def _append(self, frame: _Frame, node: Node):
+        # 正文容器的直接子节点不再保留，直接作为片段产出
+        if frame is self.root:
+            self.fragments.append(node)
+        else:
+            frame.parts.append(node)
+
+    def _pop(self) -> _Frame:
+        frame = self.stack.pop()
+        self.open_counts[frame.name] -= 1
+        if self.preserve_whitespace and self.preserve_whitespace[-1] is frame:
+            self.preserve_whitespace.pop()
+        if self.string_containers and self.string_containers[-1] is frame:
+            self.string_containers.pop()
+        self._close(frame)
+        return frame
+
+    def _close(self, frame: _Frame):
+        mode = frame.mode
+        if mode in (_OUTSIDE, _SKIP):
+            return
+        if frame is self.root:
+            raise _ContainerClosedError
+        if frame is self.h1_frame:
+            # 与 Extractor.remove_duplicate_titles() 一致：正文第一个 h1 包含于标题中时用它作为标题并删除
+            self.h1_frame = None
+            self.owner.title_final = True
+            text = "".join(self.h1_text)
+            article = self.owner.article
+            if text.lower() in article.title.lower():
+                article.title = text
+                if frame.tag is not None:
+                    frame.tag.decompose()
+                return
+        parent = self.stack[-1]
+        if not is_block_element(frame.name):
+            parent.pure = False
+        if mode == _TREE:
+            return
+        if mode == _IGNORE:
+            result: Node = EMPTY
+        elif mode == _SUBTREE:
+            result = self.parser._process_element(frame.tag, frame.level)  # type: ignore[arg-type]
+        elif mode == _LIST:
+            result = self.parser.wrap_block(frame.name, Text("\n".join(frame.parts)), frame.pure)
+        elif mode == _ENTRY:
+            result = group(frame.parts)
+        else:
+            result = self._convert(frame)
+        if parent.mode == _LIST:
+            entry = self.parser.format_list_entry(parent.name == "ol", parent.index, parent.level, frame.name, result)
+            parent.index += 1
+            if entry:
+                parent.parts.append(entry)
+        elif parent.mode in (_CONVERT, _ENTRY) and not result.is_blank:
+            self._append(parent, result)
+
+    def _convert(self, frame: _Frame) -> Node:
+        name = frame.name
+        attrs = frame.attrs
+        match name:
+            case "br":
+                result: Node = BREAK
+            case "hr":
+                result = Text("---")
+            case "img":
+                result = self.parser.format_image(get_attr_text(attrs.get("src")), get_attr_text(attrs.get("alt")))
+            case _:
+                result = self.parser.format_content(name, attrs, group(frame.parts))
+        return self.parser.wrap_block(name, result, frame.pure)
+
+
+def _source_text(markup: str) -> str:
+    # 去掉标签并解码实体，再附上所有属性值：转换结果中的文字都来自这里（只用于判断摘要是否可能出现在正文中）
+    values = " ".join(value for match in _ATTR_VALUE_RE.finditer(markup) for value in match.groups() if value)
+    return f"{html.unescape(_TAG_RE.sub('', markup))} {html.unescape(values)}"
+
+
+def _find_container(markup: str, names: list[str]) -> str | None:
+    # 按优先级返回文档中出现的第一个容器标签名，跳过注释和 script / style 的内容
+    spans = [(start, end) for _, start, _, _, end in iter_raw_text(markup)]
+    starts = [start for start, _ in spans]
+    for name in names:
+        for match in re.finditer(rf"<{re.escape(name)}(?=[\s/>])", markup, re.IGNORECASE):
+            i = bisect_right(starts, match.start()) - 1
+            if i < 0 or match.start() >= spans[i][1]:
+                return name
+    return None
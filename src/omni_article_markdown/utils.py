@@ -17,18 +17,26 @@ def is_sequentially_increasing(code: str) -> bool:
 
 
 def move_spaces(input_string: str, suffix: str) -> str:
-    # 使用正则表达式匹配以指定的suffix结尾，且suffix之前有空格的情况
-    escaped_suffix = re.escape(suffix)  # 处理正则中的特殊字符
-    pattern = rf"(.*?)\s+({escaped_suffix})$"
-    match = re.search(pattern, input_string)
-    if match:
-        # 获取字符串的主体部分（不含空格）和尾部的 '**'
-        main_part = match.group(1)
-        stars = match.group(2)
-        # 计算空格的数量并将空格移动到 '**' 后
-        space_count = len(input_string) - len(main_part) - len(stars)
-        return f"{main_part}{stars}{' ' * space_count}"
-    return input_string
+    """
+    把 suffix 之前的空白移到 suffix 之后，与 `re.search(rf"(.*?)\\s+({suffix})$", ...)` 的匹配结果一致：
+    匹配从最后一个换行之后开始，之前的内容被丢弃并计入空格数。直接扫描字符串，避免正则回溯。
+    """
+    if input_string.endswith(suffix):
+        end = len(input_string) - len(suffix)
+    elif input_string.endswith(f"{suffix}\n"):
+        end = len(input_string) - len(suffix) - 1
+    else:
+        return input_string
+    # suffix 之前连续空白的起点
+    start = end
+    while start > 0 and input_string[start - 1].isspace():
+        start -= 1
+    if start == end:
+        return input_string
+    # 获取字符串的主体部分（不含空格），计算空格的数量并将空格移动到 suffix 后
+    main_part = input_string[input_string.rfind("\n", 0, start) + 1 : start]
+    space_count = len(input_string) - len(main_part) - len(suffix)
+    return f"{main_part}{suffix}{' ' * space_count}"
 
 
 def to_snake_case(input_string: str) -> str:
@@ -37,11 +45,21 @@ def to_snake_case(input_string: str) -> str:
     return snake_case_string
 
 
+_SPACES_RE = re.compile(r"\s+")
+
+
 def collapse_spaces(text: str) -> str:
     """
     将多个连续空格（包括换行和 Tab）折叠成一个空格。
     """
-    return re.sub(r"\s+", " ", text)
+    return _SPACES_RE.sub(" ", text)
+
+
+def contains_words(text: str, phrase: str) -> bool:
+    """
+    phrase 中的每个词是否都在 text 中出现（按子串判断）。返回 False 时 phrase 必定不是 text 的子串。
+    """
+    return all(word in text for word in re.findall(r"\w+", phrase))
 
 
 def extract_domain(url: str) -> str | None:
@@ -64,11 +82,6 @@ def extract_domain(url: str) -> str | None:
         return None  # 如果 URL 格式无效，则返回 None
 
 
-def detect_language(file_name: str | None, code: str) -> str:
-    # TODO: 添加语言检测逻辑
-    return ""
-
-
 def filter_tag(el: Tag | PageElement | NavigableString | None) -> Tag | None:
     if el is None or not isinstance(el, Tag):
         return None
@@ -1,6 +1,20 @@
+import threading
+from http.server import ThreadingHTTPServer
+
 import pytest
 from bs4 import BeautifulSoup
 
+from omni_article_markdown import omni_article_md
+from omni_article_markdown.result_cache import ResultCache
+
+
+@pytest.fixture(autouse=True)
+def isolated_result_cache(tmp_path, monkeypatch):
+    # 避免测试读写用户目录中的转换结果缓存
+    result_cache = ResultCache(tmp_path / "result_cache")
+    monkeypatch.setattr(omni_article_md, "get_result_cache", lambda: result_cache)
+    return result_cache
+
 
 @pytest.fixture
 def make_soup():
@@ -8,3 +22,41 @@ def make_soup():
         return BeautifulSoup(html, parser)
 
     return _make_soup
+
+
+@pytest.fixture
+def make_article(tmp_path):
+    """make_article(name, title) 在 tmp_path 下写入一篇简单的文章，返回文件路径。"""
+
+    def _make_article(name: str, title: str) -> str:
+        path = tmp_path / f"{name}.html"
+        path.write_text(
+            f"<html><head><title>{title}</title></head><body><article><p>{title} body</p></article></body></html>",
+            encoding="utf-8",
+        )
+        return str(path)
+
+    return _make_article
+
+
+@pytest.fixture
+def local_server(monkeypatch):
+    """
+    local_server(handler_cls, **state) 在本机随机端口上启动 HTTP 服务并返回根 URL，测试结束后关闭。
+    处理器用类属性记录收到的请求，state 中的值在启动前设为 handler_cls 的类属性，测试结束后恢复。
+    """
+    servers: list[ThreadingHTTPServer] = []
+
+    def start(handler_cls, **state) -> str:
+        for name, value in state.items():
+            monkeypatch.setattr(handler_cls, name, value)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler_cls)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,64 @@
+import base64
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from omni_article_markdown import OmniArticleMarkdown
+from omni_article_markdown.assets import SvgExporter, minify_svg
+from omni_article_markdown.parser import _svg_markup
+
+SVG = b'<svg viewBox="0 0 10 10">\n  <!-- c -->\n  <circle r="1"/>\n</svg>'
+NAME = f"{hashlib.sha256(SVG).hexdigest()[:16]}.svg"
+
+
+def _inline(svg: bytes, alt: str = "") -> str:
+    return f"![{alt}](data:image/svg+xml;base64,{base64.b64encode(svg).decode()})"
+
+
+@pytest.mark.parametrize("parser", ["html.parser", "lxml", "html5lib"])
+def test_svg_markup_matches_bs4(make_soup, parser):
+    html = (
+        "<div><svg viewBox='0 0 1 1' data-a='say \"hi\"' data-b=\"it's\" data-c='&amp;&lt;'>"
+        "<style>a > b { fill: red }</style><text x='1'>1 &lt; 2 &amp; 3</text><!-- c --><br/>"
+        "<g class='x y'><path d='M0 0'/></g></svg></div>"
+    )
+    svg = make_soup(html, parser).find("svg")
+    assert _svg_markup(svg) == str(svg)
+
+
+def test_svg_exporter_dedupes(tmp_path):
+    markdown = f"{_inline(SVG, 'a')} {_inline(SVG)}\n\n```\n{_inline(SVG)}\n```\n\n![x](data:image/svg+xml;base64,@)"
+    result = SvgExporter().localise(markdown, tmp_path / "post")
+    assert (
+        result
+        == f"![a](assets/{NAME}) ![](assets/{NAME})\n\n```\n{_inline(SVG)}\n```\n\n![x](data:image/svg+xml;base64,@)"
+    )
+    assert [p.name for p in (tmp_path / "post" / "assets").iterdir()] == [NAME]
+    assert (tmp_path / "post" / "assets" / NAME).read_bytes() == SVG
+
+    # 资源目录在 Markdown 文件目录之外时同样使用相对路径
+    other = SvgExporter(assets_dir="../shared").localise(_inline(SVG), tmp_path / "post")
+    assert other == f"![](../shared/{NAME})"
+
+
+def test_minify_svg(tmp_path):
+    assert minify_svg(SVG) == b'<svg viewBox="0 0 10 10"><circle r="1"/></svg>'
+    result = SvgExporter(minify=True).localise(_inline(SVG), tmp_path)
+    saved = tmp_path / result.removeprefix("![](").removesuffix(")")
+    assert saved.read_bytes() == minify_svg(SVG)
+
+
+def test_save_with_svg_files(tmp_path):
+    html = (
+        "<html><head><title>Svg</title></head><body><article><p>text</p>"
+        "<svg data-id='omnimd' viewBox='0 0 1 1'><circle r='1'/></svg></article></body></html>"
+    )
+    handler = OmniArticleMarkdown("local", use_cache=False, localisers=[SvgExporter()])
+    handler.parse_html(html)
+    saved = Path(handler.save(str(tmp_path))).read_text(encoding="utf-8")
+    assert "data:image/svg+xml" in handler.result()
+    assert "data:image/svg+xml" not in saved
+    (svg_file,) = (tmp_path / "assets").iterdir()
+    assert f"![](assets/{svg_file.name})" in saved
+    assert svg_file.read_text(encoding="utf-8").startswith("<svg")
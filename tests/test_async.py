@@ -0,0 +1,70 @@
+import asyncio
+from http.server import BaseHTTPRequestHandler
+
+from omni_article_markdown import OmniArticleMarkdown, convert_many, http_client, reader
+
+PAGE = (
+    b"<html><head><title>Remote</title></head><body><article><h2>Heading</h2><p>Remote <b>body</b></p>"
+    b"<pre><code class='language-python'>print(1)</code></pre></article></body></html>"
+)
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_aparse_matches_parse(make_article):
+    path = make_article("a", "Async")
+    sync_handler = OmniArticleMarkdown(path)
+    sync_handler.parse()
+    async_handler = OmniArticleMarkdown(path)
+    asyncio.run(async_handler.aparse())
+    assert async_handler.result() == sync_handler.result()
+
+
+def test_convert_many_yields_every_result(tmp_path, make_article):
+    paths = [make_article(f"a{i}", f"Article {i}") for i in range(6)]
+    paths.append(str(tmp_path / "missing.html"))
+
+    async def collect():
+        return [item async for item in convert_many(paths, concurrency=3)]
+
+    results = asyncio.run(collect())
+    assert len(results) == len(paths)
+    errors = {handler.url_or_path: error for handler, error in results}
+    assert errors[paths[-1]] is not None
+    for path in paths[:-1]:
+        assert errors[path] is None
+
+
+def test_aparse_over_http_matches_parse(local_server, monkeypatch):
+    url = f"{local_server(PageHandler)}/article"
+    sync_handler = OmniArticleMarkdown(url, use_cache=False)
+    sync_handler.parse()
+
+    clients = []
+
+    def get_async_client(verify_ssl: bool = True):
+        clients.append(http_client.get_async_client(verify_ssl))
+        return clients[-1]
+
+    monkeypatch.setattr(reader, "get_async_client", get_async_client)
+
+    async def convert():
+        return [item async for item in convert_many([url], use_cache=False)]
+
+    ((async_handler, error),) = asyncio.run(convert())
+    assert error is None
+    assert async_handler.result() == sync_handler.result()
+    assert "Remote **body**" in sync_handler.result()
+    # 经由 httpx 读取，convert_many 结束时客户端已关闭
+    assert clients
+    assert all(client.is_closed for client in clients)
@@ -0,0 +1,41 @@
+import io
+
+from omni_article_markdown.batch import convert_batch, iter_urls
+
+
+def test_iter_urls_skips_blank_and_comment_lines():
+    stream = io.StringIO("https://a.com\n\n  # comment\n  https://b.com  \n")
+    assert list(iter_urls(stream)) == ["https://a.com", "https://b.com"]
+
+
+def test_convert_batch_saves_each_article(tmp_path, make_article):
+    out_dir = tmp_path / "out"
+    inputs = [make_article(f"a{i}", f"Article {i}") for i in range(5)]
+    results = list(convert_batch(inputs, save_path=str(out_dir), workers=3))
+
+    assert sorted(r.url for r in results) == sorted(inputs)
+    assert all(r.ok for r in results)
+    for i in range(5):
+        saved = out_dir / f"article_{i}.md"
+        assert saved.exists()
+        assert f"Article {i} body" in saved.read_text(encoding="utf-8")
+
+
+def test_convert_batch_reports_failures(tmp_path, make_article):
+    good = make_article("good", "Good")
+    missing = str(tmp_path / "missing.html")
+    results = {r.url: r for r in convert_batch([good, missing], save_path=str(tmp_path), workers=2)}
+
+    assert results[good].ok
+    assert not results[missing].ok
+    assert results[missing].error
+
+
+def test_convert_batch_keeps_duplicate_titles(tmp_path, make_article):
+    out_dir = tmp_path / "out"
+    inputs = [make_article(f"same{i}", "Same") for i in range(3)]
+    results = list(convert_batch(inputs, save_path=str(out_dir), workers=3))
+
+    assert all(r.ok for r in results)
+    assert len({r.save_path for r in results}) == 3
+    assert sorted(p.name for p in out_dir.iterdir()) == ["same-2.md", "same-3.md", "same.md"]
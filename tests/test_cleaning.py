@@ -0,0 +1,93 @@
+import pytest
+
+from omni_article_markdown.cleaning import CleanRule, CleanRuleSet
+from omni_article_markdown.extractor import DefaultExtractor
+from omni_article_markdown.extractors.wikipedia import WikipediaExtractor
+
+
+def first(soup, name):
+    return soup.find(name)
+
+
+def test_rule_semantics(make_soup):
+    soup = make_soup(
+        '<div id="catlinks-box" class="a reflist" role="navigation main"><sup class="reference">1</sup></div>'
+    )
+    div, sup = first(soup, "div"), first(soup, "sup")
+    assert CleanRule(class_="reflist").matches(div.name, div.attrs)
+    assert not CleanRule(class_="ref").matches(div.name, div.attrs)
+    assert not CleanRule(id="catlinks").matches(div.name, div.attrs)
+    assert CleanRule(attr="id", contains="catlinks").matches(div.name, div.attrs)
+    assert CleanRule(attr="role", contains="navigation").matches(div.name, div.attrs)
+    assert CleanRule(tags=("sup",), class_="reference").matches(sup.name, sup.attrs)
+    assert not CleanRule(tags=("span",), class_="reference").matches(sup.name, sup.attrs)
+
+
+def test_contains_requires_attr():
+    with pytest.raises(ValueError):
+        CleanRule(contains="x")
+
+
+def test_rule_set_indexes_and_generic_rules(make_soup):
+    soup = make_soup('<div><p class="x y">a</p><span id="s">b</span><em data-k="1">c</em><i>d</i><b>e</b></div>')
+    rules = CleanRuleSet(
+        [
+            CleanRule(class_="y"),
+            CleanRule(id="s"),
+            CleanRule(attr="data-k"),
+            CleanRule(css="div > i"),
+            lambda el: el.name == "b",
+        ]
+    )
+    matched = [el.name for el in soup.div.find_all() if rules.matches(el)]
+    assert matched == ["p", "span", "em", "i", "b"]
+    assert not rules.matches(soup.div)
+
+
+def test_matches_attrs_without_element():
+    rules = CleanRuleSet([CleanRule(tags=("nav",)), CleanRule(class_="ad"), CleanRule(css="div.x")])
+    assert rules.matches_attrs("nav", {})
+    assert rules.matches_attrs("div", {"class": ["ad"]})
+    # CSS 规则需要元素本身才能判断
+    assert not rules.matches_attrs("div", {"class": ["x"]})
+
+
+def test_default_rules_keep_gist_script(make_soup):
+    soup = make_soup(
+        "<article><p>text</p>"
+        '<script src="https://gist.github.com/a/b.js"></script>'
+        '<script src="https://example.com/a.js"></script><script>var a;</script>'
+        '<div style="display: none">hidden</div></article>'
+    )
+    article = DefaultExtractor(soup).extract()
+    assert article is not None
+    scripts = article.body.find_all("script")
+    assert [s["src"] for s in scripts] == ["https://gist.github.com/a/b.js"]
+    assert "hidden" not in article.body.get_text()
+
+
+def test_clean_rules_cached_per_class(make_soup):
+    soup = make_soup("<article></article>")
+    assert WikipediaExtractor(soup).clean_rules() is WikipediaExtractor(soup).clean_rules()
+    assert WikipediaExtractor(soup).clean_rules() is not DefaultExtractor(soup).clean_rules()
+
+
+def test_prune_skips_removed_subtrees_and_drops_comments(make_soup):
+    soup = make_soup(
+        '<nav class="ad"><p>a</p><!-- c1 --></nav>'
+        "<div><!-- c2 --><p>keep<!-- c3 --></p><span class='ad'><b>x</b></span></div><!-- c4 -->"
+    )
+    seen = []
+
+    def spy(el):
+        seen.append(el.name)
+        return False
+
+    rules = CleanRuleSet([CleanRule(class_="ad"), spy])
+    root = soup.new_tag("root")
+    for node in list(soup.contents):
+        root.append(node.extract())
+    rules.prune(root)
+    assert str(root) == "<root><div><p>keep</p></div></root>"
+    # 被删除元素的子孙节点不会再被判断
+    assert seen == ["div", "p"]
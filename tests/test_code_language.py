@@ -0,0 +1,71 @@
+import pytest
+
+from omni_article_markdown.code_language import DETECT_LIMIT, _detect_code, detect_language
+from omni_article_markdown.extractor import Article
+from omni_article_markdown.parser import HtmlMarkdownParser
+
+
+def test_file_name():
+    assert detect_language("file.py", "print('hi')") == "python"
+    assert detect_language("src/App.TSX", "") == "tsx"
+    assert detect_language("Dockerfile", "") == "dockerfile"
+    # 无法从文件名判断时按内容检测
+    assert detect_language("notes", "fn main() {\n    let mut x = 1;\n}") == "rust"
+    assert detect_language("README", "See the docs.") == ""
+
+
+@pytest.mark.parametrize(
+    ("code", "language"),
+    [
+        ("def add(a, b):\n    return a + b\n\nprint(add(1, 2))", "python"),
+        ("const add = (a, b) => a + b;\nconsole.log(add(1, 2));", "javascript"),
+        ('package main\n\nfunc main() {\n\tfmt.Println("hi")\n}', "go"),
+        (
+            "public class A {\n    public static void main(String[] args) {\n        System.out.println(1);\n    }\n}",
+            "java",
+        ),
+        ('#include <stdio.h>\nint main() {\n    printf("hi");\n}', "c"),
+        ("SELECT id, name FROM users WHERE id = 1;", "sql"),
+        ("$ sudo apt install curl", "bash"),
+        ("#!/usr/bin/env python3\nx = 1", "python"),
+        ('{"a": [1, 2], "b": null}', "json"),
+        ("<!DOCTYPE html>\n<html><body><div>x</div></body></html>", "html"),
+    ],
+)
+def test_detect_content(code, language):
+    assert detect_language(None, code) == language
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "",
+        "code",
+        "Hello, world!",
+        "1\n2\n3",
+        "Total: 3 passed, 0 failed",
+        # 英文段落中的常用词与 Python 关键词相同
+        "This is not a problem, and it works with or without the cache as long as it is in the list.",
+        "2024-05-01 12:00:02 WARN Cache is not ready, retrying in 5s\n"
+        "2024-05-01 12:00:03 ERROR Failed to connect as the pool is in use and or with no free slots",
+    ],
+)
+def test_unknown_content(code):
+    assert detect_language(None, code) == ""
+
+
+def test_bounded_and_memoised():
+    code = "def f(x):\n    return x\n" * 10000
+    _detect_code.cache_clear()
+    assert detect_language(None, code) == "python"
+    assert detect_language(None, code + "tail") == "python"
+    # 只检测开头部分，因此两次调用共用一条缓存
+    info = _detect_code.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert len(code) > DETECT_LIMIT
+
+
+def test_codeblock_language(make_soup):
+    html = "<pre><code>def f():\n    return 1</code></pre><pre><code class='language-js'>def f(): pass</code></pre>"
+    _, md = HtmlMarkdownParser(Article("T", "", "", make_soup(html))).parse()
+    assert md == "# T\n\n```python\ndef f():\n    return 1\n```\n\n```js\ndef f(): pass\n```"
@@ -0,0 +1,112 @@
+import json
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from omni_article_markdown.extractor import Article
+from omni_article_markdown.gist import GistFetcher, GistRef, parse_gist_src
+from omni_article_markdown.http_cache import HttpCache
+from omni_article_markdown.parser import HtmlMarkdownParser
+from omni_article_markdown.streaming import StreamingMarkdownParser
+
+DELAY = 0.2
+
+
+class GistApiHandler(BaseHTTPRequestHandler):
+    """GitHub gist API 的本地替身：/gists/<id>[/<revision>]，id 为 dead 时返回限流错误。"""
+
+    requests_seen: list[tuple[str, str | None]] = []
+
+    def do_GET(self):
+        GistApiHandler.requests_seen.append((self.path, self.headers.get("If-None-Match")))
+        time.sleep(DELAY)
+        path = self.path.removeprefix("/gists/")
+        etag = f'"{path}"'
+        if path == "dead":
+            self._send(403, {}, {"message": "API rate limit exceeded"})
+        elif self.headers.get("If-None-Match") == etag:
+            self._send(304, {"ETag": etag}, None)
+        else:
+            gist_id = path.split("/")[0]
+            files = {"main.py": {"content": f"print('{path}')"}, "notes.txt": {"content": gist_id}}
+            self._send(200, {"ETag": etag}, {"id": gist_id, "files": files})
+
+    def _send(self, status: int, headers: dict[str, str], data: dict | None):
+        body = json.dumps(data).encode() if data is not None else b""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def api_url(local_server):
+    return local_server(GistApiHandler, requests_seen=[]) + "/gists"
+
+
+def _article(gist_ids: list[str], make_soup) -> Article:
+    scripts = "".join(f"<p>gist {i}</p><script src='https://gist.github.com/u/{i}.js'></script>" for i in gist_ids)
+    return Article("T", "", "", make_soup(f"<div>{scripts}</div>"))
+
+
+def test_parse_gist_src():
+    assert parse_gist_src("https://gist.github.com/user/a1b2.js") == GistRef("a1b2")
+    assert parse_gist_src("https://gist.github.com/a1b2.js?file=x.py") == GistRef("a1b2", file="x.py")
+    assert parse_gist_src("https://gist.github.com/user/a1b2/ff00.js") == GistRef("a1b2", "ff00")
+    assert parse_gist_src("https://example.com/user/a1b2.js") is None
+    assert parse_gist_src("https://gist.github.com/user/not-an-id.js") is None
+
+
+def test_prefetches_concurrently_and_revalidates(tmp_path, api_url, make_soup):
+    ids = ["a1", "b2", "c3", "d4", "e5"]
+    cache = HttpCache(tmp_path)
+    start = time.perf_counter()
+    _, md = HtmlMarkdownParser(_article(ids, make_soup), gists=GistFetcher(cache, api_url=api_url)).parse()
+    assert time.perf_counter() - start < DELAY * len(ids) / 2
+    assert "gist a1\n\n```python\nprint('a1')\n```\n\n```\na1\n```\n\ngist b2" in md
+    assert len(GistApiHandler.requests_seen) == len(ids)
+
+    # 再次转换时携带 ETag 条件请求，服务端返回 304
+    GistApiHandler.requests_seen.clear()
+    _, again = HtmlMarkdownParser(_article(ids, make_soup), gists=GistFetcher(cache, api_url=api_url)).parse()
+    assert again == md
+    assert sorted(etag for _, etag in GistApiHandler.requests_seen) == [f'"{i}"' for i in ids]
+
+    # 流式转换同样预先获取
+    html = f"<html><body><article>{_article(ids, make_soup).body}</article></body></html>"
+    result = StreamingMarkdownParser(html, gists=GistFetcher(cache, offline=True, api_url=api_url)).parse()
+    assert result is not None
+    assert result[1].endswith(md.removeprefix("# T"))
+
+
+def test_offline_revision_and_errors(tmp_path, api_url, make_soup, capsys):
+    cache = HttpCache(tmp_path)
+    GistFetcher(cache, api_url=api_url).prefetch([GistRef("a1"), GistRef("a1", "ff")])
+    GistApiHandler.requests_seen.clear()
+
+    # 固定 revision 的内容不会变化，命中缓存后不再请求
+    fetcher = GistFetcher(cache, api_url=api_url)
+    assert fetcher.files(GistRef("a1", "ff", "main.py")) == {"main.py": "print('a1/ff')"}
+    assert GistApiHandler.requests_seen == []
+
+    messages = []
+    offline = GistFetcher(cache, offline=True, reporter=messages.append, api_url=api_url)
+    _, md = HtmlMarkdownParser(_article(["a1", "b2"], make_soup), gists=offline).parse()
+    assert "print('a1')" in md
+    assert "gist b2" in md
+    assert offline.failed == {"b2"}
+    assert messages == ["Gist b2 is not cached, skipped in offline mode."]
+    assert GistApiHandler.requests_seen == []
+
+    messages.clear()
+    online = GistFetcher(cache, reporter=messages.append, api_url=api_url)
+    assert online.files(GistRef("dead")) == {}
+    assert online.failed == {"dead"}
+    assert messages == ["Fetch gist error: dead: API rate limit exceeded"]
+    assert capsys.readouterr().out == ""
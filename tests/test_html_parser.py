@@ -0,0 +1,120 @@
+import pytest
+
+from omni_article_markdown import html_parser
+from omni_article_markdown.html_parser import (
+    make_soup,
+    resolve_parser,
+    set_default_parser,
+    soup_parser,
+    strip_raw_text,
+)
+from omni_article_markdown.omni_article_md import OmniArticleMarkdown
+from omni_article_markdown.page_meta import PageMeta
+
+HTML = "<html><head><title>Parser</title></head><body><article><p>Hello parser</p></article></body></html>"
+
+WECHAT_HTML = """
+<html><head><meta property="og:site_name" content="微信公众平台"><title>公众号文章</title></head>
+<body><div class="rich_media_content"><p>text</p><svg viewBox="0 0 10 10"><circle r="1"/></svg></div></body></html>
+"""
+
+
+@pytest.fixture
+def default_parser():
+    previous = html_parser.get_default_parser()
+    yield
+    set_default_parser(previous)
+
+
+def test_resolve_parser(default_parser):
+    assert resolve_parser("html.parser") == "html.parser"
+    assert resolve_parser("auto") in ("lxml", "html5lib")
+    set_default_parser("html.parser")
+    assert resolve_parser() == "html.parser"
+    assert soup_parser(make_soup(HTML)) == "html.parser"
+    with pytest.raises(ValueError):
+        resolve_parser("xml")
+    with pytest.raises(ValueError):
+        set_default_parser("xml")
+
+
+def test_backends_produce_same_markdown():
+    results = set()
+    for parser in html_parser.PARSER_BACKENDS:
+        if parser == "lxml" and not html_parser._lxml_available():
+            continue
+        handler = OmniArticleMarkdown("", use_cache=False, html_parser=parser)
+        handler.parse_html(HTML)
+        results.add(handler.result())
+    assert len(results) == 1
+
+
+def test_extractor_can_require_parser(monkeypatch):
+    used = []
+    original = html_parser.make_soup
+
+    def spy(markup, parser=None):
+        used.append(parser)
+        return original(markup, parser)
+
+    monkeypatch.setattr("omni_article_markdown.extractor.make_soup", spy)
+    handler = OmniArticleMarkdown("", use_cache=False, html_parser="lxml" if html_parser._lxml_available() else None)
+    handler.parse_html(WECHAT_HTML)
+    # 元数据标签用 html.parser 解析，正文直接用提取器要求的 html5lib 解析，无需重复解析
+    assert used == ["html.parser", "html5lib"]
+    assert "data:image/svg+xml" in handler.result()
+
+
+def test_strip_raw_text():
+    html = (
+        '<head><style>p { color: red }</style><script src="a.js"></script>'
+        "<SCRIPT type='text/javascript'>var a = '<p>';</SCRIPT></head>"
+        "<body><!-- <script> --><p>text</p><script><!-- document.write('<script></script>') --></script></body>"
+    )
+    assert strip_raw_text(html) == (
+        '<head><style></style><script src="a.js"></script>'
+        "<SCRIPT type='text/javascript'></SCRIPT></head>"
+        "<body><!-- <script> --><p>text</p><script><!-- document.write('<script></script>') --></script></body>"
+    )
+
+
+def test_strip_raw_text_skips_attribute_values():
+    html = (
+        '<p><img src="/a.png" alt="use <script> tags"></p><p title=\'<style>\'>one</p>'
+        '<p data-note="<!--">two</p><script-x>kept</script-x><script>var x = 1;</script><style>p {}</style>'
+    )
+    assert strip_raw_text(html) == (
+        '<p><img src="/a.png" alt="use <script> tags"></p><p title=\'<style>\'>one</p>'
+        '<p data-note="<!--">two</p><script-x>kept</script-x><script></script><style></style>'
+    )
+
+
+def test_strip_raw_text_leaves_ambiguous_markup():
+    html = '<textarea><script>a</textarea><p title="unterminated><script>b</script>'
+    assert strip_raw_text(html) == html
+
+
+def test_meta_markup_skips_attribute_values():
+    html = '<head><link rel="icon" title="<!--" href="/i.png"><meta property="og:site_name" content="Site"></head>'
+    assert PageMeta.meta_markup(html) == (
+        '<link rel="icon" title="<!--" href="/i.png"><meta property="og:site_name" content="Site">'
+    )
+
+
+def test_parse_keeps_content_after_script_in_attribute():
+    html = (
+        "<html><head><title>T</title></head><body><article>"
+        '<p><img src="/a.png" alt="use <script> tags"></p><p>Important paragraph one.</p>'
+        "<p>Important two.</p><script>var x=1;</script></article></body></html>"
+    )
+    handler = OmniArticleMarkdown("", use_cache=False)
+    handler.parse_html(html)
+    assert "Important paragraph one." in handler.result()
+    assert "Important two." in handler.result()
+
+
+def test_result_cache_is_keyed_by_parser(isolated_result_cache):
+    handler = OmniArticleMarkdown("", html_parser="html.parser")
+    handler.parse_html(HTML)
+    assert isolated_result_cache.get(HTML, variant="html.parser") is not None
+    assert isolated_result_cache.get(HTML, variant="html5lib") is None
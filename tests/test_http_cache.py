@@ -0,0 +1,91 @@
+import os
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+import requests
+
+from omni_article_markdown.http_cache import HttpCache, _cache_key, cached_get
+
+BODY = "<html><body>缓存</body></html>".encode()
+
+
+class EtagHandler(BaseHTTPRequestHandler):
+    requests_seen: list[dict[str, str]] = []
+
+    def do_GET(self):
+        EtagHandler.requests_seen.append(dict(self.headers))
+        if self.path == "/no-store":
+            self._send(200, {"Cache-Control": "no-store", "ETag": '"v1"'}, BODY)
+        elif self.path == "/fresh":
+            self._send(200, {"Cache-Control": "max-age=3600"}, BODY)
+        elif self.headers.get("If-None-Match") == '"v1"':
+            self._send(304, {"ETag": '"v1"'}, b"")
+        else:
+            self._send(200, {"ETag": '"v1"'}, BODY)
+
+    def _send(self, status: int, headers: dict[str, str], body: bytes):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def base_url(local_server):
+    return local_server(EtagHandler, requests_seen=[])
+
+
+def test_revalidates_with_etag(tmp_path, base_url):
+    cache = HttpCache(tmp_path)
+    session = requests.Session()
+    assert cached_get(session, f"{base_url}/page", cache) == BODY.decode()
+    assert cached_get(session, f"{base_url}/page", cache) == BODY.decode()
+    assert EtagHandler.requests_seen[1].get("If-None-Match") == '"v1"'
+
+
+def test_fresh_entry_skips_network(tmp_path, base_url):
+    cache = HttpCache(tmp_path)
+    session = requests.Session()
+    cached_get(session, f"{base_url}/fresh", cache)
+    assert cached_get(session, f"{base_url}/fresh", cache) == BODY.decode()
+    assert len(EtagHandler.requests_seen) == 1
+
+
+def test_no_store_is_not_cached(tmp_path, base_url):
+    cache = HttpCache(tmp_path)
+    cached_get(requests.Session(), f"{base_url}/no-store", cache)
+    assert cache.lookup(f"{base_url}/no-store") is None
+
+
+def test_variants_are_cached_separately(tmp_path, base_url):
+    cache = HttpCache(tmp_path)
+    cached_get(requests.Session(), f"{base_url}/page", cache, variant="curl")
+    assert cache.lookup(f"{base_url}/page") is None
+    assert cache.lookup(f"{base_url}/page", "curl") is not None
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = HttpCache(tmp_path, max_size=700)
+    headers = {"ETag": '"x"'}
+    now = time.time()
+    for i in range(2):
+        url = f"https://example.com/{i}"
+        cache.store(url, "", b"x" * 100, headers)
+        # 0 号条目最久未被访问
+        os.utime(tmp_path / f"{_cache_key(url, '')}.json", (now - 100 + i, now - 100 + i))
+    cache.store("https://example.com/2", "", b"x" * 100, headers)
+    assert cache.lookup("https://example.com/0") is None
+    assert cache.lookup("https://example.com/1") is not None
+    assert cache.lookup("https://example.com/2") is not None
+
+
+def test_evicts_entries_older_than_max_age(tmp_path):
+    cache = HttpCache(tmp_path, max_age=-1)
+    cache.store("https://example.com/old", "", b"old", {"ETag": '"x"'})
+    assert cache.lookup("https://example.com/old") is None
@@ -0,0 +1,89 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+import requests
+
+from omni_article_markdown.http_client import SessionManager, get_session
+
+THREADS = 32
+REQUESTS_PER_THREAD = 20
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """保持连接的 HTTP/1.1 服务，返回请求路径；/slow 在响应前等待 1 秒。"""
+
+    protocol_version = "HTTP/1.1"
+    # 响应头和响应体分两次写出，避免 Nagle 算法与延迟确认叠加造成每个请求约 40 ms 的等待
+    disable_nagle_algorithm = True
+    clients: set[tuple[str, int]] = set()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with EchoHandler.lock:
+            EchoHandler.clients.add(self.client_address)
+        if self.path == "/slow":
+            time.sleep(1)
+        body = self.path.encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def base_url(local_server):
+    return local_server(EchoHandler, clients=set())
+
+
+def test_sessions_are_per_thread():
+    manager = SessionManager()
+    assert manager.session() is manager.session()
+    assert manager.session() is not manager.session(verify_ssl=False)
+    with ThreadPoolExecutor(4) as pool:
+        others = list(pool.map(lambda _: manager.session(), range(4)))
+    assert all(session is not manager.session() for session in others)
+    assert all(session.get_adapter("https://example.com") is manager.adapter for session in others)
+    assert get_session() is get_session()
+
+
+def test_concurrent_requests_share_pool(base_url):
+    manager = SessionManager(pool_maxsize=THREADS)
+
+    def worker(i: int) -> list[str]:
+        session = manager.session()
+        return [session.get(f"{base_url}/{i}/{n}").text for n in range(REQUESTS_PER_THREAD)]
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        results = list(pool.map(worker, range(THREADS)))
+    assert results == [[f"/{i}/{n}" for n in range(REQUESTS_PER_THREAD)] for i in range(THREADS)]
+    # 连接在请求之间复用，不会超过线程数
+    assert len(EchoHandler.clients) <= THREADS
+
+    # 新线程中的 Session 复用已有的连接
+    first_round = set(EchoHandler.clients)
+    EchoHandler.clients.clear()
+    with ThreadPoolExecutor(THREADS) as pool:
+        list(pool.map(lambda i: manager.session().get(f"{base_url}/again/{i}").text, range(THREADS)))
+    assert EchoHandler.clients <= first_round
+
+    # 关闭后连接被释放，之后的请求重新建立连接
+    manager.close()
+    EchoHandler.clients.clear()
+    assert manager.session().get(f"{base_url}/after").text == "/after"
+    assert len(EchoHandler.clients) == 1
+
+
+def test_default_timeout(base_url):
+    manager = SessionManager(timeout=0.2)
+    start = time.perf_counter()
+    with pytest.raises(requests.Timeout):
+        manager.session().get(f"{base_url}/slow")
+    assert time.perf_counter() - start < 1
+    # 显式传入的超时优先
+    assert manager.session().get(f"{base_url}/slow", timeout=5).text == "/slow"
@@ -0,0 +1,110 @@
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+import pytest
+
+from omni_article_markdown import OmniArticleMarkdown
+from omni_article_markdown.images import ImageDownloader
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+# 按内容命名
+NAME = f"{hashlib.sha256(PNG).hexdigest()[:16]}.png"
+DELAY = 0.1
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    """/a.png 与 /same.png 内容相同，/page 返回 HTML，/big 返回 1 MB 的图片。"""
+
+    requests_seen: list[str] = []
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = ImageHandler
+        with cls.lock:
+            cls.requests_seen.append(self.path)
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(DELAY)
+        with cls.lock:
+            cls.in_flight -= 1
+        if self.path == "/page":
+            self._send("text/html", b"<html></html>")
+        elif self.path == "/big":
+            self._send("image/jpeg", b"\xff" * 1024 * 1024)
+        elif self.path.startswith("/missing"):
+            self.send_error(404)
+        else:
+            self._send("image/png", PNG if self.path in ("/a.png", "/same.png") else self.path.encode())
+
+    def _send(self, content_type: str, body: bytes):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def base_url(local_server):
+    return local_server(ImageHandler, requests_seen=[], in_flight=0, max_in_flight=0)
+
+
+def test_localise_rewrites_and_dedupes(tmp_path, base_url):
+    messages = []
+    downloader = ImageDownloader(reporter=messages.append)
+    markdown = (
+        f"![a]({base_url}/a.png) [![b]({base_url}/same.png)]({base_url}/link)\n\n"
+        f"```\n![code]({base_url}/a.png)\n```\n\n![p]({base_url}/page) ![m]({base_url}/missing.png)"
+    )
+    result = downloader.localise(markdown, tmp_path)
+    assert result == (
+        f"![a](assets/{NAME}) [![b](assets/{NAME})]({base_url}/link)\n\n"
+        f"```\n![code]({base_url}/a.png)\n```\n\n![p]({base_url}/page) ![m]({base_url}/missing.png)"
+    )
+    assert sorted(p.name for p in (tmp_path / "assets").iterdir()) == [".index.json", NAME]
+    assert len(messages) == 2
+
+    # 另一篇文章引用同一个 URL 时不再下载，链接相对于 Markdown 所在目录
+    ImageHandler.requests_seen.clear()
+    other = ImageDownloader().localise(f"![a]({base_url}/a.png)", tmp_path / "assets" / "..")
+    assert other == f"![a](assets/{NAME})"
+    assert ImageHandler.requests_seen == []
+
+
+def test_localise_url_with_parentheses(tmp_path, base_url):
+    body = b"/Foo_(bar).png"
+    name = f"{hashlib.sha256(body).hexdigest()[:16]}.png"
+    result = ImageDownloader().localise(f"![w]({base_url}/Foo_(bar).png) ![a]({base_url}/a.png)", tmp_path)
+    assert result == f"![w](assets/{name}) ![a](assets/{NAME})"
+    assert sorted(ImageHandler.requests_seen) == ["/Foo_(bar).png", "/a.png"]
+
+
+def test_concurrency_limits(tmp_path, base_url):
+    markdown = " ".join(f"![{i}]({base_url}/{i}.png)" for i in range(8))
+    start = time.perf_counter()
+    ImageDownloader(workers=8, per_host=2).localise(markdown, tmp_path)
+    assert ImageHandler.max_in_flight == 2
+    assert time.perf_counter() - start < DELAY * 8
+
+    messages = []
+    downloader = ImageDownloader(max_total_size=512 * 1024, reporter=messages.append)
+    result = downloader.localise(f"![big]({base_url}/big) ![x]({base_url}/x.png)", tmp_path / "capped")
+    assert f"![big]({base_url}/big)" in result
+    assert messages == ["Image size limit (524288 bytes) reached, keeping remaining links."]
+
+
+def test_save_with_downloaded_images(tmp_path, base_url):
+    html = f"<html><head><title>Images</title></head><body><article><p><img src='{base_url}/a.png'></p></article></body></html>"
+    handler = OmniArticleMarkdown("local", use_cache=False, localisers=[ImageDownloader()])
+    handler.parse_html(html)
+    saved = handler.save(str(tmp_path))
+    assert f"![](assets/{NAME})" in Path(saved).read_text(encoding="utf-8")
+    assert f"![]({base_url}/a.png)" in handler.result()
@@ -0,0 +1,128 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from omni_article_markdown import launch_playwright
+from omni_article_markdown.launch_playwright import BrowserPool
+
+# ---- fake playwright objects ----
+
+
+class FakeClosable:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeContext(FakeClosable):
+    def __init__(self):
+        super().__init__()
+        self.scripts = []
+        self.pages = []
+
+    def add_init_script(self, script=None, path=None):
+        self.scripts.append(script)
+
+    def new_page(self):
+        page = FakeClosable()
+        self.pages.append(page)
+        return page
+
+
+class FakeBrowser(FakeClosable):
+    def __init__(self):
+        super().__init__()
+        self.contexts = []
+
+    def is_connected(self):
+        return not self.closed
+
+    def new_context(self, **kwargs):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.browsers = []
+        self.stopped = False
+        self.chromium = self
+
+    def launch(self, headless=True):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+    def start(self):
+        return self
+
+    def stop(self):
+        self.stopped = True
+
+
+def install_fake(monkeypatch) -> FakePlaywright:
+    fake = FakePlaywright()
+    monkeypatch.setattr(launch_playwright, "ensure_playwright_installed", lambda reporter=None: lambda: fake)
+    return fake
+
+
+def test_pool_reuses_browser_and_isolates_contexts(monkeypatch):
+    fake = install_fake(monkeypatch)
+    pool = BrowserPool(max_pages_per_browser=10)
+    for _ in range(3):
+        with pool.page() as (page, context):
+            assert not page.closed
+            assert context.scripts and context.scripts[0]
+
+    assert len(fake.browsers) == 1
+    contexts = fake.browsers[0].contexts
+    assert len(contexts) == 3
+    assert all(c.closed and c.pages[0].closed for c in contexts)
+
+
+def test_pool_recycles_browser_after_max_pages(monkeypatch):
+    fake = install_fake(monkeypatch)
+    pool = BrowserPool(max_pages_per_browser=2)
+    for _ in range(5):
+        with pool.page():
+            pass
+
+    assert len(fake.browsers) == 3
+    assert all(b.closed for b in fake.browsers[:2])
+    pool.close()
+    assert fake.browsers[2].closed
+    assert fake.stopped
+
+
+def test_pool_relaunches_disconnected_browser(monkeypatch):
+    fake = install_fake(monkeypatch)
+    pool = BrowserPool()
+    with pool.page():
+        pass
+    fake.browsers[0].closed = True
+    with pool.page():
+        pass
+    assert len(fake.browsers) == 2
+
+
+def test_worker_pools_close_on_owner_threads(monkeypatch):
+    closed = []
+    monkeypatch.setattr(BrowserPool, "close", lambda self: closed.append((self, threading.get_ident())))
+    owners = {}
+
+    def use_pool(_):
+        pool = launch_playwright.get_browser_pool()
+        owners[pool] = threading.get_ident()
+        # 让任务分散到多个线程上
+        time.sleep(0.01)
+
+    with ThreadPoolExecutor(3) as executor:
+        list(executor.map(use_pool, range(9)))
+        launch_playwright.close_worker_browser_pools(executor, 3)
+
+    assert len(owners) > 1
+    assert len(closed) == len(owners)
+    assert set(closed) == set(owners.items())
@@ -0,0 +1,122 @@
+from omni_article_markdown import extractor as extractor_module
+from omni_article_markdown.extractor import DefaultExtractor, Extractor, ExtractorFactory
+from omni_article_markdown.extractors.baijiahao import Netease163Extractor as BaijiahaoExtractor
+from omni_article_markdown.extractors.hackernoon import HackernoonExtractor
+from omni_article_markdown.extractors.medium import MediumExtractor
+from omni_article_markdown.extractors.wikipedia import WikipediaExtractor
+from omni_article_markdown.page_meta import MetaDispatcher, MetaRule, PageMeta
+
+
+def make_page(head: str, body: str = "<article><p>Hello</p></article>") -> str:
+    return f"<html><head>{head}</head><body>{body}</body></html>"
+
+
+def test_page_meta_records_first_occurrence(make_soup):
+    soup = make_soup(
+        make_page(
+            """
+            <title> Page Title </title>
+            <meta property="og:site_name" content="First">
+            <meta property="og:site_name" content="Second">
+            <meta name="generator" content="Hugo 0.1">
+            <link rel="alternate stylesheet" href="/a.css">
+            <link rel="canonical" href="https://example.com/post">
+            """,
+            '<div data-testid="article"><svg><title>icon</title></svg></div>',
+        )
+    )
+    meta = PageMeta.from_soup(soup)
+    assert meta.get("title") == "Page Title"
+    assert meta.get("og:site_name") == "First"
+    assert meta.get("generator") == "Hugo 0.1"
+    assert meta.get("canonical") == "https://example.com/post"
+    assert meta.get("og:url") == ""
+    assert meta.testids == {"article"}
+
+
+def test_meta_dispatcher_matches_rules():
+    dispatcher: MetaDispatcher[str] = MetaDispatcher()
+    dispatcher.add(MetaRule("og:site_name", "eq", "Medium"), "medium")
+    dispatcher.add(MetaRule("canonical", "prefix", "https://a.com"), "a")
+    dispatcher.add(MetaRule("title", "suffix", " - B"), "b")
+    meta = PageMeta(fields={"og:site_name": "Medium", "canonical": "https://a.com/x", "title": "Post - C"})
+    assert dispatcher.match(meta) == {"medium", "a"}
+    assert dispatcher.match(PageMeta()) == set()
+
+
+def test_factory_dispatches_by_metadata(make_soup):
+    cases = [
+        ('<meta property="og:site_name" content="Medium">', MediumExtractor),
+        ('<link rel="canonical" href="https://en.wikipedia.org/wiki/Python">', WikipediaExtractor),
+        ('<meta property="og:title" content="Some Story | HackerNoon">', HackernoonExtractor),
+        ("<title>Unknown site</title>", DefaultExtractor),
+    ]
+    for head, extractor_cls in cases:
+        extractor = ExtractorFactory.create(make_soup(make_page(head)))
+        assert type(extractor) is extractor_cls, head
+
+
+def test_callable_check_runs_after_metadata_prefilter(make_soup):
+    body = '<div data-testid="article"><span class="bjh-p">text</span></div>'
+    assert type(ExtractorFactory.create(make_soup(make_page("", body)))) is BaijiahaoExtractor
+    body = '<div data-testid="article"><p>text</p></div>'
+    assert type(ExtractorFactory.create(make_soup(make_page("", body)))) is DefaultExtractor
+
+
+def test_meta_markup_matches_full_document(make_soup):
+    html = make_page(
+        """
+        <title>Page &amp; Title</title>
+        <!-- <meta property="og:site_name" content="Commented"> -->
+        <script>var s = '<meta property="og:site_name" content="Script">';</script>
+        <meta property="og:site_name" content="Real">
+        <meta content="a > b" property="og:title">
+        <link rel="canonical" href="https://example.com/post">
+        """,
+        '<div class="x" data-testid="article"><p>body</p></div><meta property="og:url" content="https://a.com">',
+    )
+    head = make_soup(PageMeta.meta_markup(html))
+    assert PageMeta.from_soup(head) == PageMeta.from_soup(make_soup(html))
+
+
+def test_create_from_html_two_phase():
+    body = '<article><p>Hello</p></article><script id="__NEXT_DATA__">{"props": {}}</script>'
+    extractor = ExtractorFactory.create_from_html(
+        make_page('<meta property="og:title" content="Story | HackerNoon">', body), "html.parser"
+    )
+    assert type(extractor) is HackernoonExtractor
+    # 声明了 KEEP_SCRIPTS 的提取器保留脚本内容
+    assert extractor.soup.find("script").string == '{"props": {}}'
+
+    extractor = ExtractorFactory.create_from_html(make_page("<title>Unknown</title>", body), "html.parser")
+    assert type(extractor) is DefaultExtractor
+    assert extractor.soup.find("script").string is None
+
+
+def test_create_from_html_verifies_raw_hints():
+    body = '<div data-testid="article"><span class="bjh-p">text</span></div>'
+    assert type(ExtractorFactory.create_from_html(make_page("", body), "html.parser")) is BaijiahaoExtractor
+    # 原始 HTML 中出现了提示字符串，但完整文档上 can_handle() 不成立
+    body = '<div data-testid="article"><p class="bjh-p">text</p></div>'
+    assert type(ExtractorFactory.create_from_html(make_page("", body), "html.parser")) is DefaultExtractor
+
+
+class BodyCheckExtractor(Extractor):
+    """依赖正文判断但没有声明 RAW_HINTS 的第三方提取器。"""
+
+    def can_handle(self) -> bool:
+        return self.soup.find("div", class_="custom-post") is not None
+
+
+def test_select_from_meta_defers_undecidable_extractors(monkeypatch):
+    builtin = extractor_module.plugin_classes(Extractor, "extractors")
+    assert ExtractorFactory.select_from_meta(make_page("<title>Unknown</title>")) is DefaultExtractor
+
+    monkeypatch.setattr(extractor_module, "plugin_classes", lambda *_: (*builtin, BodyCheckExtractor))
+    html = make_page("<title>Unknown</title>", '<div class="custom-post"><p>Hello</p></div>')
+    # 元数据无法排除 BodyCheckExtractor，交由完整解析判定
+    assert ExtractorFactory.select_from_meta(html) is None
+    assert type(ExtractorFactory.create_from_html(html, "html.parser")) is BodyCheckExtractor
+    # 元数据已经命中的提取器仍然直接返回
+    head = '<meta property="og:site_name" content="Medium">'
+    assert ExtractorFactory.select_from_meta(make_page(head)) is MediumExtractor
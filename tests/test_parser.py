@@ -1,5 +1,9 @@
+import pytest
+
 from omni_article_markdown.extractor import Article
+from omni_article_markdown.markdown_ir import Block, Text, iter_render_markdown
 from omni_article_markdown.parser import HtmlMarkdownParser
+from omni_article_markdown.utils import move_spaces
 
 
 def test_basic_paragraph(make_soup):
@@ -103,6 +107,24 @@ def test_table_parsing(make_soup):
     assert "| Alice | 18 |" in md
 
 
+def test_table_spans(make_soup):
+    html = (
+        "<table><tr><th rowspan='2'>Name</th><th colspan='2'>Pop</th></tr><tr><th>2000</th><th>2010</th></tr>"
+        "<tr><th>X</th><td rowspan='9'>1</td></tr><tr><td>Y <table><tr><td>nested</td></tr></table></td></tr></table>"
+    )
+    _, md = HtmlMarkdownParser(Article("T", "", "", make_soup(html))).parse()
+    assert md == (
+        "# T\n\n| Name | Pop | Pop |\n|------|-----|-----|\n| Name | 2000 | 2010 |\n| X | 1 |  |\n| Ynested | 1 |  |"
+    )
+    # 没有 th 时第一行同样作为表头；包含代码块的表格按一般内容处理
+    html = "<table><tr><td>a</td><td colspan='x'>b</td></tr><tr><td>c</td></tr></table>"
+    _, md = HtmlMarkdownParser(Article("T", "", "", make_soup(html))).parse()
+    assert md == "# T\n\n| a | b |\n|---|---|\n| c |  |"
+    html = "<table><tr><td><pre>code</pre></td></tr></table>"
+    _, md = HtmlMarkdownParser(Article("T", "", "", make_soup(html))).parse()
+    assert md == "# T\n\n```\ncode\n```"
+
+
 def test_mathjax_equations(make_soup):
     html = "<math><semantics><annotation encoding='application/x-tex'>E=mc^2</annotation></semantics></math>"
     article = Article("Math", "", "", make_soup(html))
@@ -118,3 +140,61 @@ def test_post_handler_math(make_soup):
     _, md = parser.parse()
     assert "$x+y$" in md
     assert "$$E=mc^2$$" in md
+
+
+def test_nested_quote_and_inline(make_soup):
+    html = (
+        "<blockquote><p>one <b>bold </b>tail</p><blockquote><p>inner</p></blockquote>"
+        "<p><a href='https://e.com'>x<br>y</a></p></blockquote><p><i>it <code>c</code> </i>end</p>"
+    )
+    article = Article("T", "", "", make_soup(html))
+    _, md = HtmlMarkdownParser(article).parse()
+    assert md == "# T\n\n> one **bold** tail\n> > inner\n> [xy](https://e.com)\n\n*it `c`*end"
+
+
+def test_deeply_nested_emphasis(make_soup):
+    depth = 150
+    html = "<p>" + "<b>w " * depth + "</b>" * depth + "</p>"
+    article = Article("T", "", "", make_soup(html))
+    _, md = HtmlMarkdownParser(article).parse()
+    # 每一层都把末尾的空白移到 ** 之后
+    expected = ""
+    for _ in range(depth):
+        expected = move_spaces(f"**w {expected}**", "**")
+    assert md == f"# T\n\n{expected.strip()}"
+
+
+def test_deeply_nested_dom(make_soup):
+    # 远超默认递归深度限制的包装层级
+    depth = 5000
+    html = "<div><span>" * depth + "<p><b>deep</b></p><ul><li>item</li></ul><blockquote>q</blockquote>"
+    html += "</span></div>" * depth
+    article = Article("T", "", "", make_soup(html))
+    _, md = HtmlMarkdownParser(article).parse()
+    assert md == "# T\n\n**deep**\n\n- item\n\n> q"
+
+
+@pytest.mark.parametrize("description", ["", "one bold tail", "not in body"])
+def test_iter_markdown_matches_parse(make_soup, description):
+    html = (
+        " <h2>Head</h2><p>one <b>bold </b>tail</p>text<span> more </span><blockquote><p>a</p><p>b</p></blockquote>"
+        "<p>\\(x\\) <code>**c**</code></p><ul><li>item</li></ul> "
+    )
+    _, expected = HtmlMarkdownParser(Article("T", "", description, make_soup(html))).parse()
+    chunks = list(HtmlMarkdownParser(Article("T", "", description, make_soup(html))).iter_markdown())
+    assert "".join(chunks) == expected
+    # 标题和摘要单独成段，正文在空行处分段
+    assert chunks[0].startswith("# T\n\n")
+    assert chunks[1:3] == ["## Head", "\n\none **bold** tail"]
+
+
+def test_iter_render_markdown_is_incremental():
+    def nodes():
+        yield Block(Text("one"))
+        yield Text(" two ")
+        yield Block(Text("three"))
+        raise AssertionError("consumed too far")
+
+    chunks = iter_render_markdown(nodes())
+    assert next(chunks) == "one"
+    assert next(chunks) == "\n\n two"
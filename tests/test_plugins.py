@@ -0,0 +1,49 @@
+from omni_article_markdown.extractor import Extractor
+from omni_article_markdown.plugins import plugin_classes
+from omni_article_markdown.reader import HtmlReader, Reader, ReaderFactory
+from omni_article_markdown.readers.browser import BrowserReader
+from omni_article_markdown.readers.feishu import FeishuReader
+from omni_article_markdown.readers.zhihu import ZhihuReader
+
+
+def test_plugin_classes_are_discovered_once():
+    assert plugin_classes(Reader, "readers") is plugin_classes(Reader, "readers")
+
+
+def test_plugin_classes_are_unique_and_defined_in_plugin_modules():
+    for base, package in ((Reader, "readers"), (Extractor, "extractors")):
+        classes = plugin_classes(base, package)
+        assert len(classes) == len(set(classes))
+        assert all(cls.__module__.startswith(f"omni_article_markdown.{package}.") for cls in classes)
+    # scrollable_browser 导入了 BrowserReader，但只应收录一次
+    assert plugin_classes(Reader, "readers").count(BrowserReader) == 1
+
+
+def test_plugin_classes_respect_priority(monkeypatch):
+    classes = plugin_classes(Reader, "readers")
+    monkeypatch.setattr(ZhihuReader, "PRIORITY", 10)
+    plugin_classes.cache_clear()
+    try:
+        assert plugin_classes(Reader, "readers")[0] is ZhihuReader
+    finally:
+        monkeypatch.undo()
+        plugin_classes.cache_clear()
+    assert plugin_classes(Reader, "readers") == classes
+
+
+def test_factory_only_instantiates_routed_reader(monkeypatch):
+    created = []
+    original_init = Reader.__init__
+
+    def tracking_init(self, *args, **kwargs):
+        created.append(type(self))
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(Reader, "__init__", tracking_init)
+    result = ReaderFactory.create("https://example.feishu.cn/docx/1")
+    assert isinstance(result, FeishuReader)
+    assert created == [FeishuReader]
+
+
+def test_factory_falls_back_to_html_reader():
+    assert type(ReaderFactory.create("https://example.com/post")) is HtmlReader
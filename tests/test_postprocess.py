@@ -0,0 +1,42 @@
+import re
+
+from omni_article_markdown.extractor import Article, DefaultExtractor
+from omni_article_markdown.parser import HtmlMarkdownParser
+from omni_article_markdown.postprocess import DEFAULT_POST_RULES, POST_RULES, PostRule, PostRuleSet
+from omni_article_markdown.streaming import StreamingMarkdownParser
+
+
+class TodoExtractor(DefaultExtractor):
+    def get_post_rules(self) -> list[PostRule]:
+        return super().get_post_rules() + [PostRule(r"\[(TODO|FIXME)\]", lambda m: f"**{m[1].lower()}**")]
+
+
+def test_default_rules():
+    markdown = "`**a**`\n`*b*`\n` [c](/c) `\n\\(x^2\\) \\[y\\] `plain`"
+    assert DEFAULT_POST_RULES.apply(markdown) == "**`a`**\n*`b`*\n[`c`](/c)\n$x^2$ $$y$$ `plain`"
+    # 与逐条调用 re.sub() 的结果一致，后面的规则作用于前面规则的结果
+    text = "`**x** and `*y*` \\(`*z*`\\)"
+    expected = text
+    for rule in POST_RULES:
+        expected = re.sub(rule.pattern, rule.repl, expected)
+    assert DEFAULT_POST_RULES.apply(text) == expected
+
+
+def test_rule_flags_and_order():
+    rules = PostRuleSet([PostRule("a+", "b", re.IGNORECASE), PostRule("b", "c")])
+    assert rules.apply("xAaAy") == "xcy"
+    assert rules.rules[0].flags == re.IGNORECASE
+
+
+def test_extractor_post_rules(make_soup):
+    soup = make_soup("<article></article>")
+    rules = TodoExtractor(soup).post_rules()
+    assert rules is TodoExtractor(soup).post_rules()
+    assert DefaultExtractor(soup).post_rules().rules == POST_RULES
+    assert rules.rules[: len(POST_RULES)] == POST_RULES
+
+    article = Article("T", "", "", "`**x**` [TODO] [FIXME]")
+    assert HtmlMarkdownParser(article, rules).parse()[1] == "# T\n\n**`x`** **todo** **fixme**"
+    # 流式转换使用同一组规则
+    html = "<html><head><title>T</title></head><body><article><p>[TODO] `*y*`</p></article></body></html>"
+    assert StreamingMarkdownParser(html, TodoExtractor).parse() == ("T", "# T\n\n**todo** *`y`*")
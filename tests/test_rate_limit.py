@@ -0,0 +1,175 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from omni_article_markdown import rate_limit
+from omni_article_markdown.batch import _HostInterleaver
+from omni_article_markdown.http_client import SessionManager
+from omni_article_markdown.rate_limit import DEFAULT_HOST_LIMIT, HostLimit, HostRateLimiter, parse_host_limit
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """每个请求等待 0.1 秒，记录同时在途的请求数。"""
+
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = SlowHandler
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(0.1)
+        with cls.lock:
+            cls.in_flight -= 1
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def base_url(local_server):
+    return local_server(SlowHandler, in_flight=0, max_in_flight=0)
+
+
+def test_limit_for_and_parse():
+    limiter = HostRateLimiter({"zhihu.com": HostLimit(1, 2, 2)})
+    assert limiter.limit_for("zhuanlan.zhihu.com") == HostLimit(1, 2, 2)
+    assert limiter.limit_for("ZHIHU.COM.") == HostLimit(1, 2, 2)
+    assert limiter.limit_for("notzhihu.com") == DEFAULT_HOST_LIMIT
+    # 本机与本地文件不限制
+    assert limiter.limit_for("127.0.0.1") is None
+    assert limiter.limit_for("") is None
+
+    assert parse_host_limit("Juejin.cn=0.5") == ("juejin.cn", HostLimit(0.5, 1, 1))
+    assert parse_host_limit("a.com=2,4,3") == ("a.com", HostLimit(2, 4, 3))
+    for spec in ("a.com", "a.com=x", "a.com=1,0", "=1", "a.com=1,2,3,4"):
+        with pytest.raises(ValueError):
+            parse_host_limit(spec)
+
+
+def test_token_bucket_spaces_requests():
+    now = [100.0]
+    delays = []
+    limiter = HostRateLimiter({"a.com": HostLimit(rate=2, burst=2, max_in_flight=10)}, clock=lambda: now[0])
+    limiter.sleep = delays.append
+    for _ in range(5):
+        with limiter.slot("https://a.com/x"):
+            pass
+    # 突发 2 个之后按每秒 2 个排队
+    assert delays == [0.5, 1.0, 1.5]
+
+    # 令牌随时间恢复，但不超过 burst
+    delays.clear()
+    now[0] += 10
+    for _ in range(3):
+        with limiter.slot("https://a.com/y"):
+            pass
+    assert delays == [0.5]
+
+    # 其他主机互不影响
+    with limiter.slot("https://b.com/"):
+        pass
+    assert delays == [0.5]
+
+
+def test_http_client_applies_limits(base_url):
+    limiter = HostRateLimiter({"127.0.0.1": HostLimit(rate=1000, burst=1000, max_in_flight=2)})
+    manager = SessionManager(rate_limiter=limiter)
+    with ThreadPoolExecutor(8) as pool:
+        assert list(pool.map(lambda _: manager.session().get(base_url).text, range(8))) == ["ok"] * 8
+    assert SlowHandler.max_in_flight == 2
+
+    limiter = HostRateLimiter({"127.0.0.1": HostLimit(rate=20, burst=1, max_in_flight=8)})
+    manager = SessionManager(rate_limiter=limiter)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: manager.session().get(base_url).text, range(8)))
+    assert time.perf_counter() - start >= 7 / 20
+
+
+def test_async_slot_shares_in_flight_cap():
+    limiter = HostRateLimiter({"a.com": HostLimit(rate=1000, burst=1000, max_in_flight=2)})
+    state = {"in_flight": 0, "max": 0}
+
+    async def request():
+        async with limiter.aslot("https://a.com/"):
+            state["in_flight"] += 1
+            state["max"] = max(state["max"], state["in_flight"])
+            await asyncio.sleep(0.05)
+            state["in_flight"] -= 1
+
+    async def main():
+        await asyncio.gather(*(request() for _ in range(6)))
+
+    asyncio.run(main())
+    assert state["max"] == 2
+
+
+def test_async_slot_hands_off_in_order():
+    limiter = HostRateLimiter({"a.com": HostLimit(rate=1000, burst=1000, max_in_flight=1)})
+    order = []
+
+    async def request(i):
+        async with limiter.aslot("https://a.com/"):
+            order.append(i)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        # 同步请求占着唯一的名额时，协程排队等待
+        held = threading.Event()
+        done = threading.Event()
+
+        def hold():
+            with limiter.slot("https://a.com/"):
+                held.set()
+                done.wait()
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        await asyncio.to_thread(held.wait)
+        tasks = [asyncio.create_task(request(i)) for i in range(5)]
+        await asyncio.sleep(0.01)
+        # 被取消的等待者不占用名额，其余按排队顺序依次获得名额
+        tasks[1].cancel()
+        done.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.to_thread(thread.join)
+
+    asyncio.run(main())
+    assert order == [0, 2, 3, 4]
+    with limiter.slot("https://a.com/"):
+        pass
+
+
+def test_batch_interleaves_hosts(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_rate_limiter", HostRateLimiter({"a.com": HostLimit(1, 1, 2)}))
+    read = []
+
+    def urls():
+        for url in [*(f"https://a.com/{i}" for i in range(10)), "https://b.com/1", "/local/file.html"]:
+            read.append(url)
+            yield url
+
+    scheduler = _HostInterleaver(urls(), lookahead=4, max_pending=8)
+    taken = [scheduler.take() for _ in range(3)]
+    # a.com 达到上限后，预读窗口中没有其他主机的 URL
+    assert taken == ["https://a.com/0", "https://a.com/1", None]
+    # 已提交 2 个，预读 4 个
+    assert len(read) == 6
+
+    scheduler.release("https://a.com/0")
+    assert scheduler.take() == "https://a.com/2"
+
+    scheduler = _HostInterleaver(urls(), lookahead=20, max_pending=8)
+    taken = [scheduler.take() for _ in range(5)]
+    assert taken == ["https://a.com/0", "https://b.com/1", "/local/file.html", "https://a.com/1", None]
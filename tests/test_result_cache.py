@@ -0,0 +1,56 @@
+from omni_article_markdown import omni_article_md, result_cache
+from omni_article_markdown.extractor import DefaultExtractor
+from omni_article_markdown.extractors.juejin import JuejinExtractor
+from omni_article_markdown.omni_article_md import OmniArticleMarkdown
+from omni_article_markdown.result_cache import ResultCache
+
+HTML = "<html><head><title>Cached</title></head><body><article><p>Hello cache</p></article></body></html>"
+
+
+def test_put_and_get(tmp_path):
+    cache = ResultCache(tmp_path)
+    cache.put(HTML, DefaultExtractor, "Cached", "Hello cache")
+    assert cache.get(HTML) == ("Cached", "Hello cache")
+    assert cache.get(HTML + " ") is None
+
+
+def test_hit_skips_extraction(isolated_result_cache, monkeypatch):
+    handler = OmniArticleMarkdown("")
+    handler.parse_html(HTML)
+    first = handler.result()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("extractor should not run on a cache hit")
+
+    monkeypatch.setattr(omni_article_md.ExtractorFactory, "create", fail)
+    handler = OmniArticleMarkdown("")
+    handler.parse_html(HTML)
+    assert handler.result() == first
+
+
+def test_no_cache_bypasses_result_cache(isolated_result_cache):
+    handler = OmniArticleMarkdown("", use_cache=False)
+    handler.parse_html(HTML)
+    assert isolated_result_cache.get(HTML) is None
+
+
+def test_extractor_version_bump_invalidates_only_its_entries(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path)
+    cache.put("a", DefaultExtractor, "A", "a")
+    cache.put("b", JuejinExtractor, "B", "b")
+    monkeypatch.setattr(JuejinExtractor, "VERSION", JuejinExtractor.VERSION + 1)
+    assert cache.get("a") == ("A", "a")
+    assert cache.get("b") is None
+
+
+def test_parser_version_bump_invalidates_entries(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path)
+    cache.put("a", DefaultExtractor, "A", "a")
+    monkeypatch.setattr(result_cache, "PARSER_VERSION", result_cache.PARSER_VERSION + 1)
+    assert cache.get("a") is None
+
+
+def test_expired_entries_are_dropped(tmp_path):
+    cache = ResultCache(tmp_path, max_age=-1)
+    cache.put("a", DefaultExtractor, "A", "a")
+    assert cache.get("a") is None
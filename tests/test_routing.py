@@ -0,0 +1,68 @@
+from omni_article_markdown.reader import ReaderFactory
+from omni_article_markdown.readers.browser import BrowserReader
+from omni_article_markdown.readers.curl import CurlReader
+from omni_article_markdown.readers.scrollable_browser import ScrollableBrowserReader
+from omni_article_markdown.readers.toutiao import ToutiaoReader
+from omni_article_markdown.readers.zhihu import ZhihuReader
+from omni_article_markdown.routing import RouteTable
+
+
+def test_longest_prefix_wins():
+    table: RouteTable[str] = RouteTable()
+    table.add("example.com", "host")
+    table.add("example.com/docs/", "docs")
+    table.add("example.com/docs/api/", "api")
+    assert table.match("https://example.com/")[1] == "host"
+    assert table.match("https://example.com/docs/intro")[1] == "docs"
+    assert table.match("http://EXAMPLE.com:8080/docs/api/x")[1] == "api"
+    assert table.match("https://example.org/docs/") is None
+
+
+def test_wildcard_matches_subdomains_only():
+    table: RouteTable[str] = RouteTable()
+    table.add("*.example.com", "sub")
+    assert table.match("https://a.b.example.com/x")[1] == "sub"
+    assert table.match("https://example.com/x") is None
+    assert table.match("https://notexample.com/x") is None
+
+
+def test_exact_host_wins_over_wildcard():
+    table: RouteTable[str] = RouteTable()
+    table.add("*.example.com", "wildcard")
+    table.add("www.example.com/article", "exact")
+    assert table.match("https://www.example.com/article/1")[1] == "exact"
+    assert table.match("https://www.example.com/other")[1] == "wildcard"
+
+
+def test_large_table():
+    table: RouteTable[int] = RouteTable()
+    for i in range(2000):
+        table.add(f"host{i}.example.com/p/", i)
+    assert len(table) == 2000
+    assert table.match("https://host1999.example.com/p/1")[1] == 1999
+    assert table.match("https://host1999.example.com/q/1") is None
+
+
+def test_reader_dispatch():
+    cases = {
+        "https://developer.apple.com/documentation/swift": BrowserReader,
+        "https://www.toutiao.com/article/123/": BrowserReader,
+        "https://m.toutiao.com/is/abc/": ToutiaoReader,
+        "https://wallstreetcn.com/articles/1": CurlReader,
+        "https://x.com/user/status/1": ScrollableBrowserReader,
+        "https://zhuanlan.zhihu.com/p/1": ZhihuReader,
+    }
+    for url, reader_cls in cases.items():
+        assert type(ReaderFactory.create(url)) is reader_cls, url
+
+
+def test_browser_reader_selector_follows_matched_route():
+    reader = ReaderFactory.create("https://www.huxiu.com/article/1.html")
+    assert isinstance(reader, BrowserReader)
+    assert reader._get_matched_selector() == 'div[class="article__content"]'
+
+
+def test_routing_table_lists_all_routes():
+    table = dict(ReaderFactory.routing_table())
+    assert table["x.com"] is ScrollableBrowserReader
+    assert table["wallstreetcn.com/articles/"] is CurlReader
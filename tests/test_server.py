@@ -0,0 +1,77 @@
+import http.client
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from omni_article_markdown import server
+from omni_article_markdown.server import ConversionServer, ConversionService
+
+
+@pytest.fixture
+def server_url():
+    service = ConversionService(workers=2)
+    service.warm_up()
+    server = ConversionServer(("127.0.0.1", 0), service)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def post(url: str, body: dict) -> tuple[int, dict]:
+    request = urllib.request.Request(
+        url, data=json.dumps(body).encode(), headers={"Content-Type": "application/json"}, method="POST"
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_health(server_url):
+    with urllib.request.urlopen(f"{server_url}/health") as response:
+        assert json.loads(response.read()) == {"status": "ok"}
+
+
+def test_convert_raw_html(server_url):
+    html = "<html><head><title>Served</title></head><body><article><p>Hello <b>server</b></p></article></body></html>"
+    status, body = post(f"{server_url}/convert", {"html": html})
+    assert status == 200
+    assert body["title"] == "Served"
+    assert "Hello **server**" in body["markdown"]
+    assert {"extract", "parse", "total"} <= body["timings"].keys()
+
+
+def test_convert_rejects_local_paths(server_url):
+    status, body = post(f"{server_url}/convert", {"url": "/etc/passwd"})
+    assert status == 400
+    assert "error" in body
+
+
+@pytest.mark.parametrize(
+    ("headers", "body", "status"),
+    [
+        ({"Content-Length": "abc"}, b"{}", 400),
+        ({"Content-Length": "0"}, b"", 400),
+        ({"Content-Length": "64"}, b'{"html": "' + b"x" * 50 + b'"}', 413),
+    ],
+)
+def test_convert_rejects_bad_bodies(server_url, monkeypatch, headers, body, status):
+    monkeypatch.setattr(server, "MAX_BODY_SIZE", 32)
+    conn = http.client.HTTPConnection(server_url.removeprefix("http://"))
+    conn.putrequest("POST", "/convert")
+    for name, value in headers.items():
+        conn.putheader(name, value)
+    conn.endheaders(body)
+    response = conn.getresponse()
+    assert response.status == status
+    assert "error" in json.loads(response.read())
+    # 未读取的请求体不会被当作下一个请求
+    assert response.getheader("Connection") == "close"
+    conn.close()
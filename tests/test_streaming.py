@@ -0,0 +1,125 @@
+import pytest
+
+from omni_article_markdown import streaming
+from omni_article_markdown.extractor import DefaultExtractor, ExtractorFactory
+from omni_article_markdown.extractors.wikipedia import WikipediaExtractor
+from omni_article_markdown.html_parser import resolve_parser
+from omni_article_markdown.markdown_ir import render_markdown
+from omni_article_markdown.omni_article_md import OmniArticleMarkdown
+from omni_article_markdown.parser import HtmlMarkdownParser
+from omni_article_markdown.streaming import StreamingMarkdownParser
+
+HEAD = (
+    '<head><title>Streaming test - Site</title><meta property="og:description" content="desc">'
+    '<meta property="og:url" content="https://example.com/post/"><style>p { color: red }</style></head>'
+)
+
+SAMPLES = [
+    # 标题去重、段落、行内格式与链接
+    "<article><h1>Streaming test</h1><p>Hello <b>bold </b><i>it</i> <a href='/x'>link</a> &amp; <code>x&lt;y</code>"
+    "</p><p>a<br>b</p><hr><img src='a.png' alt='A'></article>",
+    # 嵌套列表、列表中的非 li 元素与未闭合标签
+    "<main><ul><li>one<ul><li>nested</li></ul></li><ul><li>deep</li></ul><div>skip</div><li>two</ul>"
+    "<ol><li>first<li>second</ol><blockquote><p>quote</p><p>more</p></blockquote></main>",
+    # 代码块、表格、图片源、公式、脚注和 SVG
+    "<article><pre><code class='language-python'>def f():\n    return 1\n</code></pre>"
+    "<table><tr><th>a</th><th>b</th></tr><tr><td>1</td><td><h1>cell</h1></td></tr></table>"
+    "<picture><source srcset='/big.png 2x'><img src='/small.png'></picture><p>x<sup>1</sup></p>"
+    "<math><semantics><annotation encoding='application/x-tex'>e^x</annotation></semantics></math>"
+    "<svg data-id='omnimd' viewbox='0 0 1 1'><circle r='1'/><!-- c --></svg><svg><text>plain</text></svg></article>",
+    # 清理规则、注释、隐藏元素以及容器外的内容
+    "<nav><p>outside</p></nav><article><!-- note --><p>keep</p><div style='display: none'><h1>hidden</h1></div>"
+    "<footer>foot</footer><p hidden>no</p><span aria-hidden='true'>icon</span><script>var a;</script>"
+    "<figure><img src='f.png'><figcaption>cap\none</figcaption></figure></article><p>after</p>",
+    # 没有 article / main 时使用 body，h1 与标题不一致时保留
+    "<body><section><h1>Other heading</h1><p>text  with\n spaces</p></section><p>tail</p></body>",
+]
+
+
+def tree_result(html: str) -> tuple[str, str]:
+    article = ExtractorFactory.create_from_html(html, "html.parser").extract()
+    assert article is not None
+    return HtmlMarkdownParser(article).parse()
+
+
+@pytest.mark.parametrize("body", SAMPLES)
+def test_matches_tree_parser(body, monkeypatch):
+    html = f"<html>{HEAD}{body}</html>"
+    expected = tree_result(html)
+    assert StreamingMarkdownParser(html).parse() == expected
+    # 分块边界落在标签、实体和文本中间时结果不变
+    monkeypatch.setattr(streaming, "_CHUNK_SIZE", 7)
+    assert StreamingMarkdownParser(html).parse() == expected
+
+
+@pytest.mark.parametrize("body", SAMPLES)
+def test_iter_markdown_matches_parse(body):
+    for head in (HEAD, HEAD.replace('content="desc"', 'content="keep"')):
+        html = f"<html>{head}{body}</html>"
+        expected = StreamingMarkdownParser(html).parse()
+        parser = StreamingMarkdownParser(html)
+        assert "".join(parser.iter_markdown()) == expected[1]
+        assert parser.article.title == expected[0]
+
+
+def test_fragments_are_top_level_blocks():
+    html = f"<html>{HEAD}<article><h1>Streaming test</h1><p>one</p><p>two</p></article></html>"
+    parser = StreamingMarkdownParser(html)
+    assert [render_markdown(node) for node in parser.iter_fragments()] == ["one", "two"]
+    assert parser.article.title == "Streaming test"
+
+
+def test_falls_back_when_tree_is_required():
+    assert StreamingMarkdownParser.supports(DefaultExtractor)
+    # 维基百科提取器覆盖了 pre_handle_soup() 等方法
+    assert not StreamingMarkdownParser.supports(WikipediaExtractor)
+    # 没有正文容器，或容器只出现在属性值中
+    assert StreamingMarkdownParser("<html><p>x</p></html>").parse() is None
+    assert StreamingMarkdownParser("<html><div title='<main>'><p>x</p></div></html>").parse() is None
+
+
+def test_falls_back_without_bs4_internals(monkeypatch):
+    html = f"<html>{HEAD}{SAMPLES[0]}</html>"
+
+    def incompatible(*args, **kwargs):
+        raise TypeError("unexpected keyword argument")
+
+    # 分词器的构造方式变化时退回树解析
+    monkeypatch.setattr(streaming, "_Tokenizer", incompatible)
+    assert StreamingMarkdownParser(html).parse() is None
+    handler = OmniArticleMarkdown("", use_cache=False, streaming=True)
+    handler.parse_html(html)
+    assert handler.result() == tree_result(html)[1]
+
+    # 内部接口不存在时不使用流式转换
+    monkeypatch.setattr(streaming, "_BS4_INTERNALS", False)
+    assert not StreamingMarkdownParser.supports(DefaultExtractor)
+
+
+def test_handler_streaming_option(isolated_result_cache):
+    html = f"<html>{HEAD}{SAMPLES[0]}</html>"
+    handler = OmniArticleMarkdown("", streaming=True)
+    handler.parse_html(html)
+    assert handler.result() == tree_result(html)[1]
+    assert isolated_result_cache.get(html, variant=f"{resolve_parser()}+stream") is not None
+
+
+def test_handler_iter_markdown(tmp_path):
+    path = tmp_path / "page.html"
+    path.write_text(f"<html>{HEAD}{SAMPLES[1]}</html>", encoding="utf-8")
+    options = {"use_cache": False, "html_parser": "html.parser"}
+    handler = OmniArticleMarkdown(str(path), **options)
+    handler.parse()
+    for stream in (False, True):
+        incremental = OmniArticleMarkdown(str(path), streaming=stream, **options)
+        assert "".join(incremental.iter_markdown()) == handler.result()
+        assert incremental.title == "Streaming test - Site"
+    saved = OmniArticleMarkdown(str(path), **options).save_incremental(str(tmp_path))
+    assert saved == str((tmp_path / "streaming_test_site.md").resolve())
+    assert (tmp_path / "streaming_test_site.md").read_text(encoding="utf-8") == handler.result()
+
+
+def test_deeply_nested_page():
+    depth = 5000
+    html = f"<html>{HEAD}<article>{'<div><span>' * depth}<p>deep</p>{'</span></div>' * depth}</article></html>"
+    assert StreamingMarkdownParser(html).parse() == tree_result(html)
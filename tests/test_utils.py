@@ -1,10 +1,11 @@
+import re
+
 import pytest
 from bs4.element import AttributeValueList, NavigableString
 
 from omni_article_markdown.utils import (
     clean_text,
     collapse_spaces,
-    detect_language,
     extract_domain,
     filter_tag,
     get_attr_text,
@@ -49,6 +50,18 @@ def test_move_spaces():
     assert move_spaces("**hello world**", "**") == "**hello world**"
 
 
+@pytest.mark.parametrize(
+    "text", ["**a\nb  **", "**a\n  **", "**  **", "*x *\n", "**a\tb\u3000**", "**a **b**", "x", "****"]
+)
+def test_move_spaces_matches_regex(text):
+    suffix = "*" if text.startswith("*x") else "**"
+    match = re.search(rf"(.*?)\s+({re.escape(suffix)})$", text)
+    expected = text
+    if match:
+        expected = f"{match.group(1)}{suffix}{' ' * (len(text) - len(match.group(1)) - len(suffix))}"
+    assert move_spaces(text, suffix) == expected
+
+
 # --------------------------
 # to_snake_case
 # --------------------------
@@ -75,13 +88,6 @@ def test_extract_domain():
     assert extract_domain("not_a_url") is None
 
 
-# --------------------------
-# detect_language
-# --------------------------
-def test_detect_language_placeholder():
-    assert detect_language("file.py", "print('hi')") == ""
-
-
 # --------------------------
 # filter_tag
 # --------------------------